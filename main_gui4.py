@@ -11,7 +11,7 @@ import sys
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QLabel, QLineEdit, QPushButton, QTextEdit, QMessageBox, QFrame,
-    QStackedWidget, QSizePolicy, QSpacerItem, QDialog
+    QStackedWidget, QSizePolicy, QSpacerItem, QDialog, QComboBox, QCheckBox
 )
 from PyQt6.QtCore import Qt, QThread, pyqtSignal
 from PyQt6.QtGui import QFont, QIcon, QPixmap
@@ -19,6 +19,8 @@ import json
 import os
 import webbrowser
 from naver_blog_automation import NaverBlogAutomation
+from modules.batch_runner import BatchRunner
+from modules.utils import get_app_data_dir
 from firebase_auth import FirebaseAuthManager
 
 
@@ -36,59 +38,46 @@ class Colors:
 
 class AutomationThread(QThread):
     progress = pyqtSignal(str)
+    post_done = pyqtSignal(str, bool, str)
     finished = pyqtSignal(bool, str)
 
-    def __init__(self, config, shopping_url):
+    def __init__(self, config, shopping_urls):
         super().__init__()
         self.config = config
-        self.shopping_url = shopping_url
+        # 단일 URL(str)도 그대로 받을 수 있도록 리스트로 정규화
+        if isinstance(shopping_urls, str):
+            shopping_urls = [shopping_urls]
+        self.shopping_urls = shopping_urls
         self.bot = None
 
     def run(self):
         try:
-            self.progress.emit("🌐 브라우저 시작 중...")
             self.bot = NaverBlogAutomation(
                 self.config['blog_id'],
                 self.config['naver_id'],
                 self.config['naver_pw'],
-                self.config['gemini_api_key']
+                self.config['gemini_api_key'],
+                timing_profile=self.config.get('timing_profile', 'normal'),
+                headless=self.config.get('headless', False),
+                persistent_profile=self.config.get('persistent_profile', False),
+                ai_cache_bypass=self.config.get('ai_cache_bypass', False)
             )
-            self.bot.start_browser()
-            self.progress.emit("✅ 브라우저 시작 완료\n")
-
-            self.progress.emit("🔐 로그인 중...")
-            if not self.bot.login():
-                self.finished.emit(False, "로그인 실패")
-                return
-            self.progress.emit("✅ 로그인 완료\n")
-
-            self.progress.emit("📦 제품 정보 추출 중...")
-            product_info = self.bot.extract_product_info(self.shopping_url)
-            if not product_info:
-                self.finished.emit(False, "제품 정보 추출 실패")
-                return
-            self.progress.emit(f"✅ 제품명: {product_info['title'][:50]}...\n")
-
-            self.progress.emit("💾 이미지 다운로드 중...")
-            image_files = self.bot.download_images(product_info['images'])
-            if not image_files:
-                self.finished.emit(False, "이미지 다운로드 실패 - 최소 1개")
-                return
-            self.progress.emit(f"✅ {len(image_files)}개 이미지 다운로드 완료\n")
-
-            self.progress.emit("🤖 AI 글 생성 중...")
-            ai_result = self.bot.generate_ai_content(product_info)
-            if not ai_result:
-                self.finished.emit(False, "AI 글 생성 실패")
-                return
-            self.progress.emit(f"✅ AI 글 생성 완료 ({len(ai_result['content'])}자)\n")
-            self.progress.emit(f"✅ 태그 {len(ai_result['tags'])}개 생성\n")
+            # 브라우저 시작/로그인은 1회만, 작성 중에 다음 글의 다운로드/AI 생성을 미리 진행
+            runner = BatchRunner(
+                self.bot,
+                progress_callback=self.progress.emit,
+                result_callback=lambda r: self.post_done.emit(r['url'], r['success'], r['message']),
+                pipelined=True
+            )
+            results = runner.run(self.shopping_urls)
 
-            self.progress.emit("📝 블로그 글 작성 및 발행 중...")
-            if self.bot.write_blog_post(product_info['title'], ai_result, image_files, self.shopping_url):
-                self.finished.emit(True, "블로그 글 발행 완료! 🎉")
+            succeeded = sum(1 for r in results if r['success'])
+            if len(results) == 1:
+                self.finished.emit(results[0]['success'], results[0]['message'])
+            elif results and succeeded == len(results):
+                self.finished.emit(True, f"{succeeded}개 글 발행 완료! 🎉")
             else:
-                self.finished.emit(False, "블로그 글 작성 실패")
+                self.finished.emit(False, f"{len(results)}개 중 {succeeded}개 발행 완료")
         except Exception as e:
             self.finished.emit(False, f"오류 발생: {str(e)}")
         finally:
@@ -318,9 +307,9 @@ class LoginDialog(QDialog):
 class ConfigManager:
     """
     ColdAPP 설정 및 로그인 이메일 저장 관리자
-    AppData\Roaming\ColdAPP\config.json 에 저장
+    AppData\Roaming\ColdAPP\config.json 에 저장 (리눅스는 ~/.config/ColdAPP)
     """
-    CONFIG_DIR = os.path.join(os.getenv("APPDATA"), "ColdAPP")
+    CONFIG_DIR = get_app_data_dir()
     CONFIG_FILE = os.path.join(CONFIG_DIR, "config.json")
 
     @staticmethod
@@ -345,6 +334,10 @@ class ConfigManager:
             "naver_id": "",
             "naver_pw": "",
             "gemini_api_key": "",
+            "timing_profile": "normal",
+            "headless": False,
+            "persistent_profile": False,
+            "ai_cache_bypass": False,
             "last_login_email": ""
         }
 
@@ -640,7 +633,7 @@ class MainWindow(QMainWindow):
         # URL 입력
         url_group, url_lay = self.build_group("📦 쇼핑 URL")
         # 안내 라벨
-        helper = QLabel("발급받은 브랜드커넥트 URL(naver.me)을 붙여넣으세요.")
+        helper = QLabel("발급받은 브랜드커넥트 URL(naver.me)을 붙여넣으세요. 여러 개는 공백 또는 쉼표로 구분합니다.")
         helper.setStyleSheet(f"color:{Colors.TEXT_WEAK}; font-size:12px;")
         url_lay.addWidget(helper)
 
@@ -701,6 +694,29 @@ class MainWindow(QMainWindow):
         api_lay.addWidget(self.gemini_key_input)
         layout.addWidget(api_group)
 
+        speed_group, speed_lay = self.build_group("⏱️ 실행 속도")
+        speed_hint = QLabel("PC나 인터넷이 느려서 입력이 누락되면 '느림'을 선택하세요.")
+        speed_hint.setStyleSheet(f"color:{Colors.TEXT_WEAK}; font-size:12px;")
+        speed_lay.addWidget(speed_hint)
+        self.timing_combo = QComboBox()
+        for label, value in [("빠름", "fast"), ("보통", "normal"), ("느림", "slow")]:
+            self.timing_combo.addItem(label, value)
+        index = self.timing_combo.findData(self.config.get('timing_profile', 'normal'))
+        self.timing_combo.setCurrentIndex(index if index >= 0 else 1)
+        self.timing_combo.setFixedHeight(36)
+        speed_lay.addWidget(self.timing_combo)
+        self.persistent_profile_check = QCheckBox("로그인 유지 (Chrome 프로필 재사용 - 다음 실행 때 로그인/캡차 생략)")
+        self.persistent_profile_check.setToolTip("ColdAPP 데이터 폴더의 계정별 Chrome 프로필을 계속 사용합니다")
+        self.persistent_profile_check.setStyleSheet(f"color:{Colors.TEXT}; font-size:12px;")
+        self.persistent_profile_check.setChecked(self.config.get('persistent_profile', False))
+        speed_lay.addWidget(self.persistent_profile_check)
+        self.ai_cache_bypass_check = QCheckBox("AI 캐시 사용 안 함 (같은 상품도 글/태그를 새로 생성)")
+        self.ai_cache_bypass_check.setToolTip("저장된 AI 응답/작성 관점을 읽지 않고 Gemini로 새로 생성합니다 (결과는 다시 저장)")
+        self.ai_cache_bypass_check.setStyleSheet(f"color:{Colors.TEXT}; font-size:12px;")
+        self.ai_cache_bypass_check.setChecked(self.config.get('ai_cache_bypass', False))
+        speed_lay.addWidget(self.ai_cache_bypass_check)
+        layout.addWidget(speed_group)
+
         save_bar = QWidget(); save_bar.setStyleSheet(f"background:{Colors.SURFACE}; border:none; border-radius:12px;")
         hb = QHBoxLayout(save_bar); hb.setContentsMargins(12,10,12,10)
         hb.addStretch(); save_btn = SolidButton("설정 저장", color=Colors.SUCCESS); hb.addWidget(save_btn)
@@ -714,8 +730,8 @@ class MainWindow(QMainWindow):
         self.btn_settings.setChecked(index == 1)
 
     def start_automation(self):
-        url = self.url_input.text().strip()
-        if not url or url.startswith("https://naver.me/") is False:
+        urls = BatchRunner.load_urls(self.url_input.text().strip())
+        if not urls or not all(url.startswith("https://naver.me/") for url in urls):
             QMessageBox.warning(self, "입력 오류", "유효한 쇼핑 URL을 입력하세요.")
             return
         if not all([self.blog_id_input.text().strip(), self.naver_id_input.text().strip(), self.naver_pw_input.text(), self.gemini_key_input.text().strip()]):
@@ -743,10 +759,15 @@ class MainWindow(QMainWindow):
             'blog_id': self.blog_id_input.text().strip(),
             'naver_id': self.naver_id_input.text().strip(),
             'naver_pw': self.naver_pw_input.text(),
-            'gemini_api_key': self.gemini_key_input.text().strip()
+            'gemini_api_key': self.gemini_key_input.text().strip(),
+            'timing_profile': self.timing_combo.currentData(),
+            'headless': self.config.get('headless', False),
+            'persistent_profile': self.persistent_profile_check.isChecked(),
+            'ai_cache_bypass': self.ai_cache_bypass_check.isChecked()
         }
-        self.thread = AutomationThread(cfg, url)
+        self.thread = AutomationThread(cfg, urls)
         self.thread.progress.connect(self.update_progress)
+        self.thread.post_done.connect(self.post_finished)
         self.thread.finished.connect(self.automation_finished)
         self.thread.start()
 
@@ -758,16 +779,17 @@ class MainWindow(QMainWindow):
     def update_progress(self, msg: str):
         self.progress_text.append(msg)
 
+    def post_finished(self, url: str, success: bool, message: str):
+        # Firebase 사용 횟수 증가 (발행된 글 1개당 1회)
+        if success and self.user_info and self.auth_manager.is_enabled():
+            self.auth_manager.increment_usage(self.user_info.get('email'))
+            self.user_info['usage_count'] = self.user_info.get('usage_count', 0) + 1
+
     def automation_finished(self, success: bool, message: str):
         self.start_btn.setEnabled(True)
         self.stop_btn.setEnabled(False)
         self.url_input.setEnabled(True)
         
-        # Firebase 사용 횟수 증가
-        if success and self.user_info and self.auth_manager.is_enabled():
-            self.auth_manager.increment_usage(self.user_info.get('email'))
-            self.user_info['usage_count'] = self.user_info.get('usage_count', 0) + 1
-        
         if success:
             self.progress_text.append(f"\n✅ {message}")
             QMessageBox.information(self, "완료", message)
@@ -784,6 +806,9 @@ class MainWindow(QMainWindow):
         current_config['naver_id'] = self.naver_id_input.text().strip()
         current_config['naver_pw'] = self.naver_pw_input.text()
         current_config['gemini_api_key'] = self.gemini_key_input.text().strip()
+        current_config['timing_profile'] = self.timing_combo.currentData()
+        current_config['persistent_profile'] = self.persistent_profile_check.isChecked()
+        current_config['ai_cache_bypass'] = self.ai_cache_bypass_check.isChecked()
         
         # 3. 업데이트된 전체 설정을 저장합니다.
         ConfigManager.save(current_config)
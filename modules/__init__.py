@@ -8,6 +8,8 @@ from .image_handler import ImageHandler
 from .ai_generator import AIContentGenerator
 from .blog_writer import BlogWriter
 from .utils import StyleUtils
+from .batch_runner import BatchRunner
+from .browser_pool import BrowserPool
 
 __all__ = [
     'BrowserHandler',
@@ -15,5 +17,7 @@ __all__ = [
     'ImageHandler',
     'AIContentGenerator',
     'BlogWriter',
-    'StyleUtils'
+    'StyleUtils',
+    'BatchRunner',
+    'BrowserPool'
 ]
@@ -0,0 +1,248 @@
+"""
+AI 응답 디스크 캐시 모듈
+- Gemini 응답 텍스트를 (프롬프트 + 상세 이미지 내용 해시 + 모델 + 작성 관점) 키로 저장
+- 발행 실패 후 재시도/재실행이면 Gemini를 다시 부르지 않고 바로 반환
+- 같은 상품은 작성 관점(style angle)을 고정해서 재시도 때도 같은 프롬프트 → 캐시 적중
+- 유효 기간(TTL) 지나면 무시/삭제, 개수/용량 한도를 넘으면 오래 안 쓴 것부터 삭제
+- bypass=True면 캐시를 읽지 않고 새로 생성 (결과는 다시 저장)
+"""
+
+import os
+import re
+import json
+import time
+import random
+import hashlib
+import threading
+
+from .utils import get_app_data_dir
+
+
+PRODUCT_ID_PATTERN = re.compile(r'/(?:products|catalog)/(\d+)')
+
+
+def product_id_from_url(url):
+    """
+    상품 URL에서 상품 번호 추출 (smartstore/brand .../products/<번호>, 가격비교 /catalog/<번호>)
+
+    Args:
+        url: 상품 URL (naver.me 짧은 URL은 번호가 없으므로 리다이렉트된 최종 URL을 넘길 것)
+
+    Returns:
+        str: 상품 번호 (없으면 None)
+    """
+    match = PRODUCT_ID_PATTERN.search(url or '')
+    return match.group(1) if match else None
+
+
+def product_key(product_info):
+    """
+    상품 식별 문자열 (상품 번호 → 링크 → 제품명 순서)
+
+    상품 번호는 추출할 때 최종 URL/페이지 상태에서 읽은 product_info['product_id']를 우선 사용
+    (같은 상품을 다른 짧은 URL로 올려도 같은 키)
+
+    Args:
+        product_info: 제품 정보 dict
+
+    Returns:
+        str: 상품 키
+    """
+    link = product_info.get('link') or ''
+    product_id = product_info.get('product_id') or product_id_from_url(link)
+    if product_id:
+        return f"product:{product_id}"
+    return link or f"title:{product_info.get('title', '')}"
+
+
+def file_digest(path):
+    """파일 내용 해시 (경로/파일 이름이 달라도 내용이 같으면 같은 값)"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _normalize_prompt(prompt):
+    """줄 끝 공백/빈 줄 개수 차이는 같은 프롬프트로 취급"""
+    lines = [line.rstrip() for line in prompt.strip().splitlines()]
+    return re.sub(r'\n{3,}', '\n\n', '\n'.join(lines))
+
+
+class AICache:
+    """Gemini 응답 디스크 캐시"""
+
+    _shared = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, cache_dir=None, ttl=3 * 24 * 3600, max_entries=500, max_bytes=50 * 1024 * 1024):
+        """
+        초기화
+
+        Args:
+            cache_dir: 저장 폴더 (기본: ColdAPP 데이터 폴더/ai_cache)
+            ttl: 유효 기간(초)
+            max_entries: 최대 저장 개수
+            max_bytes: 최대 저장 용량(바이트)
+        """
+        self.cache_dir = cache_dir or get_app_data_dir('ai_cache')
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def shared(cls):
+        """
+        프로세스 전체에서 공유하는 기본 캐시
+
+        Returns:
+            AICache: 기본 인스턴스
+        """
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    @staticmethod
+    def make_key(kind, prompt, model, angle=None, image_paths=(), extra=None):
+        """
+        캐시 키 생성
+
+        Args:
+            kind: 응답 종류 ('body', 'tags', 'vision' 등)
+            prompt: 프롬프트 문자열
+            model: 모델 이름
+            angle: 작성 관점 (선택)
+            image_paths: 함께 보낸 상세 이미지 파일 경로들 (내용 해시로 반영)
+            extra: 결과에 영향을 주는 기타 설정 dict (선택, 예: 전처리 예산)
+
+        Returns:
+            str: 키 (sha256 hex)
+        """
+        parts = {
+            'kind': kind,
+            'prompt': _normalize_prompt(prompt),
+            'model': model,
+            'angle': angle,
+            'images': [file_digest(p) for p in image_paths],
+            'extra': extra or {},
+        }
+        raw = json.dumps(parts, ensure_ascii=False, sort_keys=True)
+        return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def get(self, key, bypass=False):
+        """
+        저장된 값 (없거나 기간이 지났으면 None)
+
+        Args:
+            key: make_key()로 만든 키
+            bypass: True면 읽지 않고 None (새로 생성하도록)
+
+        Returns:
+            저장한 값 (JSON으로 저장 가능한 값) 또는 None
+        """
+        if bypass:
+            return None
+        path = self._path(key)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            self.misses += 1
+            return None
+
+        if time.time() - entry.get('created', 0) > self.ttl:
+            self._remove(path)
+            self.misses += 1
+            return None
+
+        # 최근 사용 시각 갱신 (용량 정리 때 오래 안 쓴 것부터 삭제)
+        try:
+            os.utime(path, None)
+        except OSError:
+            pass
+        self.hits += 1
+        return entry.get('value')
+
+    def set(self, key, value):
+        """
+        값 저장 (임시 파일에 쓰고 교체 → 중간에 끊겨도 깨진 파일 없음)
+
+        Args:
+            key: make_key()로 만든 키
+            value: JSON으로 저장 가능한 값
+        """
+        path = self._path(key)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'created': time.time(), 'value': value}, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"   ⚠️ AI 캐시 저장 실패: {e}")
+            self._remove(tmp_path)
+            return
+        self._evict()
+
+    def sticky_choice(self, name, choices, bypass=False):
+        """
+        이름(상품 등)별로 한 번 고른 값을 유효 기간 동안 계속 사용 (예: 작성 관점)
+
+        Args:
+            name: 고정할 대상 이름 (예: product_key(product_info))
+            choices: 후보 리스트
+            bypass: True면 새로 고름 (새 값으로 교체)
+
+        Returns:
+            후보 중 하나
+        """
+        key = hashlib.sha256(f"sticky:{name}".encode('utf-8')).hexdigest()
+        chosen = self.get(key, bypass=bypass)
+        if chosen in choices:
+            return chosen
+        chosen = random.choice(choices)
+        self.set(key, chosen)
+        return chosen
+
+    def _remove(self, path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    def _evict(self):
+        """기간 지난 항목 삭제 + 개수/용량 한도를 넘으면 오래 안 쓴 것부터 삭제"""
+        with self._lock:
+            now = time.time()
+            entries = []
+            for name in os.listdir(self.cache_dir):
+                if not name.endswith('.json'):
+                    continue
+                path = os.path.join(self.cache_dir, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+
+            entries.sort()
+            total = sum(size for _, size, _ in entries)
+            while entries and (len(entries) > self.max_entries or total > self.max_bytes
+                               or now - entries[0][0] > self.ttl):
+                _, size, path = entries.pop(0)
+                self._remove(path)
+                total -= size
+
+    def clear(self):
+        """캐시 전체 삭제"""
+        with self._lock:
+            for name in os.listdir(self.cache_dir):
+                self._remove(os.path.join(self.cache_dir, name))
@@ -3,48 +3,59 @@ AI 콘텐츠 생성 모듈
 - Gemini 2.5 Pro/Flash 활용
 - Vision API로 상세 이미지 분석 ⭐ 신규
 - 제품 정보만 추출 (배송/이벤트 제외) ⭐ 신규
+- 2단계 생성: 상세 이미지 → 제품 사실 정보(상품별 저장) → 텍스트만으로 본문 작성
 - 태그 생성
 """
 
-import random
 import re
 import json
-from PIL import Image
+
+from .ai_cache import AICache, product_key
+from .gemini_client import GeminiClient
+from .model_router import ModelRouter
+from .product_facts import ProductFactExtractor, format_facts
+from .vision_preprocess import VisionPreprocessor
 
 
 class AIContentGenerator:
     """AI 콘텐츠 생성 클래스"""
     
-    def __init__(self, gemini_api_key):
+    def __init__(self, gemini_api_key, vision_budget=None, cache_bypass=False, two_phase=True, account=None):
         """
         초기화
         
         Args:
             gemini_api_key: Gemini API 키
+            vision_budget: 상세 이미지 전처리 기본 예산 dict (VisionPreprocessor.DEFAULTS 참고, 선택)
+            cache_bypass: True면 AI 응답 캐시/저장된 제품 정보를 읽지 않고 새로 생성 (결과는 다시 저장)
+            two_phase: True면 상세 이미지에서 제품 정보만 먼저 추출(상품별 저장)하고 본문은 텍스트만으로 작성
+                       (False면 기존처럼 이미지와 함께 한 번에 작성)
+            account: 블로그/계정 식별자 (예: 'blog_id/naver_id') - 작성 관점/본문 캐시를 계정별로 나눔
+                     (같은 상품을 여러 계정이 올려도 같은 글이 되지 않도록, 선택)
         """
         self.gemini_api_key = gemini_api_key
-        self.model = None
+        self.vision_budget = dict(vision_budget or {})
+        self.router = None
+        self.facts = None
+        self.cache = AICache.shared()
+        self.cache_bypass = cache_bypass
+        self.two_phase = two_phase
+        self.account = account or ''
         
     def initialize_model(self):
-        """Gemini 모델 초기화"""
-        import google.generativeai as genai
-        
-        genai.configure(api_key=self.gemini_api_key)
-        
-        try:
-            self.model = genai.GenerativeModel('gemini-2.5-pro')
-            print("   🤖 모델: gemini-2.5-pro")
-        except:
-            self.model = genai.GenerativeModel('gemini-2.5-flash')
-            print("   🤖 모델: gemini-2.5-flash (백업)")
+        """Gemini 모델 준비 (API 키별 공유 클라이언트 + 작업별 모델 선택, 실패 시 다음 모델로)"""
+        self.router = ModelRouter(GeminiClient.shared(self.gemini_api_key))
+        self.facts = ProductFactExtractor(self.router)
     
-    def generate_content_with_vision(self, product_info, detail_image_paths):
+    def generate_content_with_vision(self, product_info, detail_image_paths, vision_budget=None, stream=None):
         """
         Vision API를 활용하여 AI 콘텐츠 생성 ⭐ 핵심 함수
         
         Args:
             product_info: 제품 정보 dict
             detail_image_paths: 상세 설명 이미지 파일 경로 리스트
+            vision_budget: 이번 요청에만 적용할 전처리 예산 dict (예: {'max_tiles': 8}, 선택)
+            stream: 응답 조각을 받는 대로 넘길 AIStream (BlogWriter가 바로 입력, 선택)
             
         Returns:
             dict: {
@@ -57,7 +68,7 @@ class AIContentGenerator:
         
         try:
             # 모델 초기화
-            if not self.model:
+            if not self.router:
                 self.initialize_model()
             
             title = product_info['title']
@@ -73,7 +84,9 @@ class AIContentGenerator:
                 "핵심 스펙 숫자 강조(수치·치수·용량·소재 등 3개 이상)",
                 "TIP 제공형(구매/사용/관리 팁 3가지)"
             ]
-            chosen_angle = random.choice(style_angles)
+            # 같은 계정의 같은 상품은 같은 관점 (재시도 시 같은 프롬프트 → 캐시 적중)
+            chosen_angle = self.cache.sticky_choice(f"{self.account}|{product_key(product_info)}", style_angles,
+                                                    bypass=self.cache_bypass)
             
             # 금지 문구
             banned_phrases = [
@@ -86,41 +99,62 @@ class AIContentGenerator:
             # 이미지 개수에 따른 구조 결정
             advantages_template = self._build_advantages_template(image_count)
             
-            # 상세 이미지 로드 (Vision용)
+            # 1단계: 제품 사실 정보 (상품별로 저장된 값이 있으면 상세 이미지 단계 전체 생략) ⭐
+            facts = None
+            if self.two_phase:
+                facts = self.facts.lookup(product_info, bypass=self.cache_bypass)
+                if facts:
+                    print(f"   💾 저장된 제품 정보 사용 (상세 이미지 분석 생략)")
+            
+            # 상세 이미지 전처리 (Vision용: 축소/타일 분할/빈 타일 제외/재압축)
             detail_images = []
-            if detail_image_paths:
-                print(f"   📸 상세 이미지 {len(detail_image_paths)}개 로드 중...")
-                for img_path in detail_image_paths:
-                    try:
-                        img = Image.open(img_path)
-                        detail_images.append(img)
-                    except Exception as e:
-                        print(f"      ⚠️ 이미지 로드 실패 ({img_path}): {e}")
-                        continue
-                print(f"   ✅ {len(detail_images)}개 이미지 로드 완료")
+            budget = dict(self.vision_budget)
+            budget.update(vision_budget or {})
+            if detail_image_paths and not facts:
+                print(f"   📸 상세 이미지 {len(detail_image_paths)}개 전처리 중...")
+                detail_images = VisionPreprocessor(**budget).prepare(detail_image_paths)
+                print(f"   ✅ {len(detail_images)}개 이미지(타일) 준비 완료")
+                if self.two_phase and detail_images:
+                    facts = self.facts.extract(product_info, detail_images)
             
-            # 프롬프트 생성 (Vision 버전) ⭐
+            # 2단계: 프롬프트 생성 (제품 정보가 있으면 텍스트만, 추출 실패면 기존처럼 이미지와 함께) ⭐
             prompt = self._build_vision_prompt(
                 title, price, description, 
                 advantages_template, chosen_angle, banned_phrases,
-                len(detail_images)
+                len(detail_images), facts_text=format_facts(facts) if facts else None
             )
             
-            # Vision API 호출 ⭐
-            print(f"   🤖 Gemini Vision API 호출 중...")
-            print(f"      - 텍스트 정보: {len(description)}자")
-            print(f"      - 이미지 개수: {len(detail_images)}개")
-            
-            # 이미지와 함께 콘텐츠 생성
-            if detail_images:
-                # 프롬프트 + 이미지들을 함께 전송
-                content_parts = [prompt] + detail_images
-                response = self.model.generate_content(content_parts)
+            models = ','.join(self.router.models_for('body'))
+            if facts:
+                print(f"   🤖 Gemini 본문 작성 중 (텍스트만, 제품 정보 기반)...")
+                print(f"      - 텍스트 정보: {len(description)}자")
+                # 캐시 키: 프롬프트(제품 정보 포함) + 모델 + 관점 + 계정
+                cache_key = AICache.make_key('body', prompt, models, angle=chosen_angle,
+                                             extra={'account': self.account})
+                contents = prompt
             else:
-                # 이미지 없으면 텍스트만
-                response = self.model.generate_content(prompt)
+                # Vision API 호출 ⭐
+                print(f"   🤖 Gemini Vision API 호출 중...")
+                print(f"      - 텍스트 정보: {len(description)}자")
+                print(f"      - 이미지(타일) 개수: {len(detail_images)}개")
+                # 캐시 키: 프롬프트 + 상세 이미지 내용 해시 + 모델 + 관점 + 전처리 예산 + 계정
+                cache_key = AICache.make_key(
+                    'vision', prompt, models, angle=chosen_angle,
+                    image_paths=detail_image_paths or [], extra=dict(budget, account=self.account)
+                )
+                # 이미지 없으면 텍스트만, 있으면 프롬프트 + 이미지들을 함께 전송
+                contents = [prompt] + detail_images if detail_images else prompt
+            
+            ai_response = self.cache.get(cache_key, bypass=self.cache_bypass)
             
-            ai_response = response.text.strip()
+            if ai_response:
+                print(f"   💾 AI 캐시 사용 (Gemini 호출 생략)")
+                if stream is not None:
+                    stream.put(ai_response)
+            else:
+                ai_response = self._generate_text(contents, stream)
+                if ai_response:
+                    self.cache.set(cache_key, ai_response)
             
             # JSON 부분 분리
             json_match = re.search(r'```json\s*(\{.*?\})\s*```', ai_response, re.DOTALL)
@@ -159,23 +193,54 @@ class AIContentGenerator:
             traceback.print_exc()
             return None
     
+    def _generate_text(self, contents, stream=None):
+        """
+        본문 생성 요청 (stream이 있으면 스트리밍으로 받으면서 조각을 바로 전달)
+        
+        스트림이 중간에 실패하면 라우터로 전체 본문을 다시 요청
+        (이미 보낸 조각이 있으면 stream.reset() → 입력 쪽에서 에디터를 다시 열고 전체 본문으로 작성)
+        """
+        if stream is None:
+            return self.router.generate('body', contents).text.strip()
+        
+        parts = []
+        try:
+            for chunk in self.router.generate('body', contents, stream=True):
+                try:
+                    text = chunk.text
+                except Exception:
+                    continue  # 텍스트 없는 조각 (메타데이터만)
+                parts.append(text)
+                stream.put(text)
+        except Exception as e:
+            if parts:
+                print(f"   ⚠️ 스트리밍 응답이 중간에 끊김 ({type(e).__name__}) - 전체 본문을 다시 받아서 새로 작성")
+                stream.reset()
+                return self.router.generate('body', contents).text.strip()
+            print(f"   ⚠️ 스트리밍 응답 실패 ({type(e).__name__}) - 입력 전이므로 다시 요청")
+            text = self.router.generate('body', contents).text.strip()
+            stream.put(text)
+            return text
+        return ''.join(parts).strip()
+    
     def _build_vision_prompt(self, title, price, description, advantages_template, 
-                            chosen_angle, banned_phrases, image_count):
+                            chosen_angle, banned_phrases, image_count, facts_text=None):
         """
         Vision API용 프롬프트 생성 ⭐
         상세 이미지를 보고 제품 정보만 추출하도록 명확히 지시
+        (facts_text가 있으면 이미지 대신 미리 추출한 제품 정보로 작성하도록 지시)
         """
-        prompt = f"""
-당신은 네이버 블로그 전문 리뷰어입니다. 아래 제품 후기를 작성하세요.
-
-제품명: {title}
-가격: {price}
-제품 설명: {description}
-
-작성 관점(랜덤으로 선택됨): {chosen_angle}
-
-🔍 이미지 분석 지침 (매우 중요!): ⭐ 신규
+        if facts_text:
+            source_guide = f"""🔍 상세 페이지에서 확인된 제품 정보 (매우 중요!): ⭐ 신규
+{facts_text}
+
+위 제품 정보와 제품 설명에 있는 내용만 사실로 사용하세요.
+(스펙 수치/소재/구성품은 그대로 인용하고, 없는 수치나 기능을 지어내지 마세요.)
+배송/이벤트/회사소개 관련 내용은 쓰지 말고, 오직 제품 자체에 대한 정보만 활용해서 후기를 작성하세요."""
+        else:
+            source_guide = f"""🔍 이미지 분석 지침 (매우 중요!): ⭐ 신규
 첨부된 {image_count}개의 이미지는 상품 상세 페이지의 설명 이미지들입니다.
+(세로로 긴 이미지는 위에서부터 순서대로 잘라낸 조각이므로 이어서 읽으세요.)
 이 이미지들을 분석할 때 다음 규칙을 반드시 따르세요:
 
 ✅ 포함할 정보만 사용:
@@ -194,7 +259,18 @@ class AIContentGenerator:
 - 상품평, 리뷰 스크린샷
 
 이미지 중 배송/이벤트/회사소개 관련 내용이 보이면 무시하고,
-오직 제품 자체에 대한 정보만 활용해서 후기를 작성하세요.
+오직 제품 자체에 대한 정보만 활용해서 후기를 작성하세요."""
+        
+        prompt = f"""
+당신은 네이버 블로그 전문 리뷰어입니다. 아래 제품 후기를 작성하세요.
+
+제품명: {title}
+가격: {price}
+제품 설명: {description}
+
+작성 관점(랜덤으로 선택됨): {chosen_angle}
+
+{source_guide}
 
 ⚠️ 네이버 알고리즘 최적화 규칙:
 
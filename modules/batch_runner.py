@@ -0,0 +1,219 @@
+"""
+배치 실행 모듈
+- 여러 쇼핑 URL을 한 번의 브라우저 세션으로 처리
+- 브라우저 시작/로그인은 1회만 수행
+- URL별 처리 결과 기록
+"""
+
+import os
+import time
+
+from .metrics import TimingRecorder, TokenUsage
+from .pipeline import PostPipeline
+
+
+class BatchRunner:
+    """여러 URL을 하나의 로그인 세션으로 연속 처리하는 클래스"""
+
+    def __init__(self, bot, progress_callback=None, result_callback=None, close_when_done=True,
+                 pipelined=False, max_ahead=1, workers=2):
+        """
+        초기화
+
+        Args:
+            bot: NaverBlogAutomation 인스턴스
+            progress_callback: 진행 메시지 콜백 (선택, GUI 로그용)
+            result_callback: URL 1개 처리 완료 시 결과 dict를 받는 콜백 (선택)
+            close_when_done: 배치 종료 후 브라우저 종료 여부
+            pipelined: True면 작성 중에 다음 글의 다운로드/AI 생성을 미리 진행 (PostPipeline)
+            max_ahead: 파이프라인 모드에서 미리 준비해둘 글 개수
+            workers: 파이프라인 모드의 워커 스레드 개수
+        """
+        self.bot = bot
+        self.progress_callback = progress_callback
+        self.result_callback = result_callback
+        self.close_when_done = close_when_done
+        self.pipelined = pipelined
+        self.max_ahead = max_ahead
+        self.workers = workers
+        self.results = []
+
+    @staticmethod
+    def load_urls(source):
+        """
+        URL 목록 불러오기
+
+        Args:
+            source: URL 목록 파일 경로, 여러 URL이 담긴 문자열 또는 리스트
+                    (공백/쉼표/줄바꿈 구분, '#'으로 시작하는 줄은 주석)
+
+        Returns:
+            list: 중복 제거된 URL 리스트 (입력 순서 유지)
+        """
+        if isinstance(source, (list, tuple)):
+            raw_lines = list(source)
+        elif os.path.isfile(source):
+            with open(source, 'r', encoding='utf-8') as f:
+                raw_lines = f.read().splitlines()
+        else:
+            raw_lines = source.splitlines()
+
+        urls = []
+        for line in raw_lines:
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            for token in line.replace(',', ' ').split():
+                if token.startswith('http') and token not in urls:
+                    urls.append(token)
+        return urls
+
+    def _emit(self, msg):
+        """진행 메시지 출력"""
+        print(msg)
+        if self.progress_callback:
+            self.progress_callback(msg)
+
+    def _start_session(self):
+        """브라우저 시작 + 로그인 (배치 전체에서 1회)"""
+        self._emit("🌐 브라우저 시작 중...")
+        self.bot.start_browser()
+        self._emit("✅ 브라우저 시작 완료\n")
+
+        self._emit("🔐 로그인 중...")
+        with TimingRecorder.shared().measure('login'):
+            logged_in = self.bot.login()
+        if not logged_in:
+            return False
+        self._emit("✅ 로그인 완료\n")
+        return True
+
+    def _session_alive(self):
+        """브라우저 세션이 살아있는지 확인"""
+        if not self.bot.driver:
+            return False
+        try:
+            self.bot.driver.current_url
+            return True
+        except Exception:
+            return False
+
+    def _ensure_session(self):
+        """세션이 끊겼으면 브라우저 재시작 후 재로그인"""
+        if self._session_alive():
+            return True
+
+        self._emit("⚠️ 브라우저 세션 끊김 - 재시작합니다")
+        try:
+            self.bot.close()
+        except Exception:
+            pass
+        self.bot.driver = None
+        return self._start_session()
+
+    def run(self, urls):
+        """
+        배치 실행
+
+        Args:
+            urls: 쇼핑 URL 리스트
+
+        Returns:
+            list: URL별 결과 dict 리스트 [{
+                'url': URL,
+                'success': 성공 여부,
+                'message': 결과 메시지,
+                'elapsed': 처리 시간(초)
+            }]
+        """
+        self.results = []
+        total = len(urls)
+
+        if not total:
+            self._emit("⚠️ 처리할 URL이 없습니다")
+            return self.results
+
+        try:
+            if not self._start_session():
+                self._emit("❌ 로그인 실패 - 배치 중단")
+                for url in urls:
+                    self._record(url, False, "로그인 실패", 0.0)
+                return self.results
+
+            if self.pipelined and total > 1:
+                self._run_pipelined(urls)
+                self._emit(self.summarize())
+                return self.results
+
+            for idx, url in enumerate(urls):
+                self._emit(f"\n{'='*40}\n📌 [{idx+1}/{total}] {url}\n{'='*40}")
+                started = time.time()
+
+                if not self._ensure_session():
+                    self._record(url, False, "브라우저 세션 복구 실패", time.time() - started)
+                    continue
+
+                try:
+                    success, message = self.bot.process_url(url, progress=self._emit)
+                except Exception as e:
+                    success, message = False, f"오류 발생: {str(e)}"
+
+                self._record(url, success, message, time.time() - started)
+
+            self._emit(self.summarize())
+            return self.results
+
+        finally:
+            for report in (TimingRecorder.shared().report(), TokenUsage.shared().report()):
+                if report:
+                    self._emit(report)
+            if self.close_when_done:
+                self.bot.close()
+
+    def _run_pipelined(self, urls):
+        """추출/작성과 다운로드/AI 생성을 겹쳐서 실행"""
+        pipeline = PostPipeline(
+            self.bot,
+            max_ahead=self.max_ahead,
+            workers=self.workers,
+            progress_callback=self._emit,
+            result_callback=self._record,
+            ensure_session=self._ensure_session
+        )
+        pipeline.run(urls)
+
+        # 결과는 완료 순서로 기록되므로 입력 순서로 정렬
+        order = {url: i for i, url in enumerate(urls)}
+        self.results.sort(key=lambda r: order.get(r['url'], len(order)))
+
+    def _record(self, url, success, message, elapsed):
+        """URL별 결과 기록"""
+        result = {
+            'url': url,
+            'success': success,
+            'message': message,
+            'elapsed': round(elapsed, 1)
+        }
+        self.results.append(result)
+
+        mark = "✅" if success else "❌"
+        self._emit(f"{mark} {url} → {message} ({result['elapsed']}초)")
+
+        if self.result_callback:
+            self.result_callback(result)
+        return result
+
+    def summarize(self):
+        """
+        배치 결과 요약 문자열
+
+        Returns:
+            str: 성공/실패 개수와 실패 URL 목록
+        """
+        succeeded = [r for r in self.results if r['success']]
+        failed = [r for r in self.results if not r['success']]
+
+        lines = [f"\n📊 배치 완료: 성공 {len(succeeded)}개 / 실패 {len(failed)}개 (총 {len(self.results)}개)"]
+        for r in failed:
+            lines.append(f"   ❌ {r['url']} - {r['message']}")
+        return '\n'.join(lines)
@@ -7,29 +7,41 @@
 - 발행
 """
 
-import time
-import pyperclip
 import os
-import win32gui
-import win32con
 import re
 import random
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.common.action_chains import ActionChains
 
+from .editor_injector import EditorInjector, select_text
+from .file_upload import EditorImageUploader
+from .stream_parser import ContentStreamParser, StreamReset, parse_content
+from .text_input import TextInput
+from .utils import StyleUtils
+from .waits import Waits
+
 
 class BlogWriter:
     """블로그 작성 클래스 (원본 버전)"""
     
-    def __init__(self, driver):
+    def __init__(self, driver, timing_profile='normal', use_html_injection=True, text_input_backend='auto'):
         """
         초기화
         
         Args:
             driver: Selenium WebDriver
+            timing_profile: 실행 속도 프로필 ('fast' / 'normal' / 'slow')
+            use_html_injection: 본문을 섹션별 HTML 1회 붙여넣기로 입력 (실패 시 키 입력 방식)
+            text_input_backend: 텍스트 입력 방식 ('auto' / 'cdp' / 'script' / 'keys' / 'clipboard')
         """
         self.driver = driver
+        self.waits = Waits(driver, timing_profile)
+        self.use_html_injection = use_html_injection
+        self.editor_injector = None
+        self.text_input = TextInput(driver, self.waits, text_input_backend)
+        self.image_uploader = EditorImageUploader(driver, self.waits)
+        self.stream_timeout = 180  # 스트리밍 입력 중 다음 AI 응답 조각 최대 대기(초)
     
     def write_and_publish(self, blog_id, title, ai_result, image_files, shopping_url):
         """
@@ -48,58 +60,17 @@ class BlogWriter:
         self.blog_id = blog_id
         return self.write_blog_post(title, ai_result, image_files, shopping_url)
     
-    def write_blog_post(self, title, ai_result, image_files, shopping_link):
+    def _apply_text_style_to_keyword(self, keyword_text, style_type):
         """키워드에 실제 스타일 적용 (안전한 방법)"""
         try:
-            # JavaScript로 본문에서 첫 번째 키워드 찾아서 선택
-            js_script = f"""
-            (function() {{
-                // 에디터 영역 찾기
-                var editor = document.querySelector('.se-component-content');
-                if (!editor) return false;
-                
-                // 텍스트 노드에서 키워드 찾기
-                var keyword = "{keyword_text}";
-                var found = false;
-                
-                function findAndSelect(node) {{
-                    if (found) return;
-                    
-                    if (node.nodeType === 3) {{  // 텍스트 노드
-                        var index = node.textContent.indexOf(keyword);
-                        if (index >= 0) {{
-                            var range = document.createRange();
-                            range.setStart(node, index);
-                            range.setEnd(node, index + keyword.length);
-                            
-                            var selection = window.getSelection();
-                            selection.removeAllRanges();
-                            selection.addRange(range);
-                            
-                            found = true;
-                            return;
-                        }}
-                    }} else {{
-                        for (var i = 0; i < node.childNodes.length; i++) {{
-                            findAndSelect(node.childNodes[i]);
-                            if (found) return;
-                        }}
-                    }}
-                }}
-                
-                findAndSelect(editor);
-                return found;
-            }})();
-            """
-            
-            # JavaScript 실행
-            result = self.driver.execute_script(js_script)
+            # 본문에서 첫 번째 키워드 찾아서 선택 (제목 영역 제외)
+            result = select_text(self.driver, keyword_text)
             
             if not result:
                 print(f"         ⚠️ '{keyword_text}' 찾기 실패")
                 return False
             
-            time.sleep(0.2)
+            self.waits.pause(0.2)
             
             # 스타일 적용
             if style_type == 'bold':
@@ -124,7 +95,7 @@ class BlogWriter:
                 # 글자색 버튼 클릭
                 font_color_btn = self.driver.find_element(By.CSS_SELECTOR, '[data-name="font-color"]')
                 font_color_btn.click()
-                time.sleep(0.3)
+                self.waits.pause(0.3)
                 
                 # 색상 선택
                 color = self._get_random_color('font')
@@ -136,7 +107,7 @@ class BlogWriter:
                 # 배경색 버튼 클릭
                 bg_color_btn = self.driver.find_element(By.CSS_SELECTOR, '[data-name="background-color"]')
                 bg_color_btn.click()
-                time.sleep(0.3)
+                self.waits.pause(0.3)
                 
                 # 색상 선택
                 color = self._get_random_color('bg')
@@ -148,7 +119,7 @@ class BlogWriter:
                 # 글자 크기 버튼 클릭
                 font_size_btn = self.driver.find_element(By.CSS_SELECTOR, '[data-name="font-size"]')
                 font_size_btn.click()
-                time.sleep(0.3)
+                self.waits.pause(0.3)
                 
                 # 크기 선택 (크게 = 19pt)
                 size_btn = self.driver.find_element(By.CSS_SELECTOR, '[data-value="fs19"]')
@@ -159,11 +130,11 @@ class BlogWriter:
                 # 굵게 + 글자색
                 bold_btn = self.driver.find_element(By.CSS_SELECTOR, '[data-name="bold"]')
                 bold_btn.click()
-                time.sleep(0.2)
+                self.waits.pause(0.2)
                 
                 font_color_btn = self.driver.find_element(By.CSS_SELECTOR, '[data-name="font-color"]')
                 font_color_btn.click()
-                time.sleep(0.3)
+                self.waits.pause(0.3)
                 
                 color = self._get_random_color('font')
                 color_btn = self.driver.find_element(By.CSS_SELECTOR, f'[data-color="{color}"]')
@@ -174,11 +145,11 @@ class BlogWriter:
                 # 굵게 + 배경색
                 bold_btn = self.driver.find_element(By.CSS_SELECTOR, '[data-name="bold"]')
                 bold_btn.click()
-                time.sleep(0.2)
+                self.waits.pause(0.2)
                 
                 bg_color_btn = self.driver.find_element(By.CSS_SELECTOR, '[data-name="background-color"]')
                 bg_color_btn.click()
-                time.sleep(0.3)
+                self.waits.pause(0.3)
                 
                 color = self._get_random_color('bg')
                 color_btn = self.driver.find_element(By.CSS_SELECTOR, f'[data-color="{color}"]')
@@ -186,11 +157,11 @@ class BlogWriter:
                 print(f"         [굵게+배경색{color}] '{keyword_text}'")
             
             # ✅ 수정: 스타일 적용 후 충분히 대기한 다음 해제
-            time.sleep(0.5)
+            self.waits.pause(0.5)
             self._deactivate_style(style_type)
             
             # 선택 영역 해제
-            time.sleep(0.3)
+            self.waits.pause(0.3)
             ActionChains(self.driver).send_keys(Keys.ESCAPE).perform()
             
             return True
@@ -205,77 +176,77 @@ class BlogWriter:
             if style_type == 'bold':
                 btn = self.driver.find_element(By.CSS_SELECTOR, '[data-name="bold"]')
                 btn.click()
-                time.sleep(0.1)
+                self.waits.pause(0.1)
                 
             elif style_type == 'italic':
                 btn = self.driver.find_element(By.CSS_SELECTOR, '[data-name="italic"]')
                 btn.click()
-                time.sleep(0.1)
+                self.waits.pause(0.1)
                 
             elif style_type == 'underline':
                 btn = self.driver.find_element(By.CSS_SELECTOR, '[data-name="underline"]')
                 btn.click()
-                time.sleep(0.1)
+                self.waits.pause(0.1)
                 
             elif style_type == 'font_color':
                 # 글자색 버튼 클릭
                 font_color_btn = self.driver.find_element(By.CSS_SELECTOR, '[data-name="font-color"]')
                 font_color_btn.click()
-                time.sleep(0.2)
+                self.waits.pause(0.2)
                 # 색상 선택
                 color = self._get_random_color('font')
                 color_btn = self.driver.find_element(By.CSS_SELECTOR, f'[data-color="{color}"]')
                 color_btn.click()
-                time.sleep(0.1)
+                self.waits.pause(0.1)
                 
             elif style_type == 'bg_color':
                 # 배경색 버튼 클릭
                 bg_color_btn = self.driver.find_element(By.CSS_SELECTOR, '[data-name="background-color"]')
                 bg_color_btn.click()
-                time.sleep(0.2)
+                self.waits.pause(0.2)
                 # 색상 선택
                 color = self._get_random_color('bg')
                 color_btn = self.driver.find_element(By.CSS_SELECTOR, f'[data-color="{color}"]')
                 color_btn.click()
-                time.sleep(0.1)
+                self.waits.pause(0.1)
                 
             elif style_type == 'font_size':
                 # 글자 크기 버튼 클릭
                 font_size_btn = self.driver.find_element(By.CSS_SELECTOR, '[data-name="font-size"]')
                 font_size_btn.click()
-                time.sleep(0.2)
+                self.waits.pause(0.2)
                 # 크기 선택 (19pt)
                 size_btn = self.driver.find_element(By.CSS_SELECTOR, '[data-value="fs19"]')
                 size_btn.click()
-                time.sleep(0.1)
+                self.waits.pause(0.1)
                 
             elif style_type == 'bold_font':
                 # 굵게
                 bold_btn = self.driver.find_element(By.CSS_SELECTOR, '[data-name="bold"]')
                 bold_btn.click()
-                time.sleep(0.1)
+                self.waits.pause(0.1)
                 # 글자색
                 font_color_btn = self.driver.find_element(By.CSS_SELECTOR, '[data-name="font-color"]')
                 font_color_btn.click()
-                time.sleep(0.2)
+                self.waits.pause(0.2)
                 color = self._get_random_color('font')
                 color_btn = self.driver.find_element(By.CSS_SELECTOR, f'[data-color="{color}"]')
                 color_btn.click()
-                time.sleep(0.1)
+                self.waits.pause(0.1)
                 
             elif style_type == 'bold_bg':
                 # 굵게
                 bold_btn = self.driver.find_element(By.CSS_SELECTOR, '[data-name="bold"]')
                 bold_btn.click()
-                time.sleep(0.1)
+                self.waits.pause(0.1)
                 # 배경색
                 bg_color_btn = self.driver.find_element(By.CSS_SELECTOR, '[data-name="background-color"]')
                 bg_color_btn.click()
-                time.sleep(0.2)
+                self.waits.pause(0.2)
                 color = self._get_random_color('bg')
                 color_btn = self.driver.find_element(By.CSS_SELECTOR, f'[data-color="{color}"]')
                 color_btn.click()
-                time.sleep(0.1)
+                self.waits.pause(0.1)
                 
         except Exception as e:
             print(f"         ⚠️ 스타일 활성화 실패: {e}")
@@ -287,94 +258,86 @@ class BlogWriter:
                 # 굵게 OFF (토글)
                 btn = self.driver.find_element(By.CSS_SELECTOR, '[data-name="bold"]')
                 btn.click()
-                time.sleep(0.2)
+                self.waits.pause(0.2)
                 
             elif style_type == 'italic':
                 # 기울임 OFF (토글)
                 btn = self.driver.find_element(By.CSS_SELECTOR, '[data-name="italic"]')
                 btn.click()
-                time.sleep(0.2)
+                self.waits.pause(0.2)
                 
             elif style_type == 'underline':
                 # 밑줄 OFF (토글)
                 btn = self.driver.find_element(By.CSS_SELECTOR, '[data-name="underline"]')
                 btn.click()
-                time.sleep(0.2)
+                self.waits.pause(0.2)
                 
             elif style_type == 'font_color':
                 # 글자색 → 검정색으로
                 font_color_btn = self.driver.find_element(By.CSS_SELECTOR, '[data-name="font-color"]')
                 font_color_btn.click()
-                time.sleep(0.3)
+                self.waits.pause(0.3)
                 black_btn = self.driver.find_element(By.CSS_SELECTOR, '[data-color="#000000"]')
                 black_btn.click()
-                time.sleep(0.2)
+                self.waits.pause(0.2)
                 
             elif style_type == 'bg_color':
                 # 배경색 → 색상 없음
                 bg_color_btn = self.driver.find_element(By.CSS_SELECTOR, '[data-name="background-color"]')
                 bg_color_btn.click()
-                time.sleep(0.3)
+                self.waits.pause(0.3)
                 no_color_btn = self.driver.find_element(By.CSS_SELECTOR, '.se-color-palette-no-color')
                 no_color_btn.click()
-                time.sleep(0.2)
+                self.waits.pause(0.2)
                 
             elif style_type == 'font_size':
                 # 글자크기 → 기본 크기(16)
                 font_size_btn = self.driver.find_element(By.CSS_SELECTOR, '[data-name="font-size"]')
                 font_size_btn.click()
-                time.sleep(0.3)
+                self.waits.pause(0.3)
                 default_size_btn = self.driver.find_element(By.CSS_SELECTOR, '[data-value="fs16"]')
                 default_size_btn.click()
-                time.sleep(0.2)
+                self.waits.pause(0.2)
                 
             elif style_type == 'bold_font':
                 # 굵게 OFF
                 bold_btn = self.driver.find_element(By.CSS_SELECTOR, '[data-name="bold"]')
                 bold_btn.click()
-                time.sleep(0.2)
+                self.waits.pause(0.2)
                 # 글자색 → 검정색
                 font_color_btn = self.driver.find_element(By.CSS_SELECTOR, '[data-name="font-color"]')
                 font_color_btn.click()
-                time.sleep(0.3)
+                self.waits.pause(0.3)
                 black_btn = self.driver.find_element(By.CSS_SELECTOR, '[data-color="#000000"]')
                 black_btn.click()
-                time.sleep(0.2)
+                self.waits.pause(0.2)
                 
             elif style_type == 'bold_bg':
                 # 굵게 OFF
                 bold_btn = self.driver.find_element(By.CSS_SELECTOR, '[data-name="bold"]')
                 bold_btn.click()
-                time.sleep(0.2)
+                self.waits.pause(0.2)
                 # 배경색 → 색상 없음
                 bg_color_btn = self.driver.find_element(By.CSS_SELECTOR, '[data-name="background-color"]')
                 bg_color_btn.click()
-                time.sleep(0.3)
+                self.waits.pause(0.3)
                 no_color_btn = self.driver.find_element(By.CSS_SELECTOR, '.se-color-palette-no-color')
                 no_color_btn.click()
-                time.sleep(0.2)
+                self.waits.pause(0.2)
                 
         except Exception as e:
             print(f"         ⚠️ 스타일 되돌리기 실패: {e}")
     
-    def _insert_text_with_inline_styles(self, text, highlights, section):
-        """텍스트 입력하면서 강조 부분은 바로 스타일 적용"""
-        import random
-        
+    def _select_highlight_positions(self, text, highlights, section):
+        """이 섹션 텍스트에서 강조할 위치 선택 (섹션별 랜덤 1-3개, 없으면 빈 리스트)"""
         # 1. 이 섹션의 highlights 찾기
         section_highlights = [h for h in highlights if h.get('section') == section]
         
-        if not section_highlights:
-            # 강조 없으면 그냥 입력
-            pyperclip.copy(text)
-            ActionChains(self.driver).key_down(Keys.CONTROL).send_keys('v').key_up(Keys.CONTROL).perform()
-            return
-        
         # 2. 텍스트에서 키워드 위치 찾기
         positions = []
         for h in section_highlights:
             keyword = h.get('text', '')
-            start = text.find(keyword)
+            start = text.find(keyword) if keyword else -1
             if start >= 0:
                 positions.append({
                     'start': start,
@@ -384,39 +347,47 @@ class BlogWriter:
                 })
         
         if not positions:
-            # 이 텍스트에는 강조 없음
-            pyperclip.copy(text)
-            ActionChains(self.driver).key_down(Keys.CONTROL).send_keys('v').key_up(Keys.CONTROL).perform()
-            return
-        
-        # 3. 위치 순서대로 정렬
-        positions.sort(key=lambda x: x['start'])
+            return []
         
-        # 4. 섹션별 랜덤 선택 (1-3개)
+        # 3. 섹션별 랜덤 선택 (1-3개), 위치 순서대로 정렬
         select_count = random.randint(1, min(3, len(positions)))
         selected_positions = random.sample(positions, select_count)
         selected_positions.sort(key=lambda x: x['start'])
         
         print(f"      💡 {section} 섹션: {len(positions)}개 중 {select_count}개 강조 선택")
+        return selected_positions
+    
+    def _insert_text_with_inline_styles(self, text, highlights, section):
+        """텍스트 입력하면서 강조 부분은 바로 스타일 적용"""
+        selected_positions = self._select_highlight_positions(text, highlights or [], section)
+        
+        # HTML 한 번에 붙여넣기 (실패 시 아래 키 입력 방식)
+        if self.editor_injector and self.editor_injector.insert_section(text, selected_positions, self._get_random_color):
+            for pos in selected_positions:
+                print(f"         [{pos['style']}] '{pos['text']}'")
+            return
         
-        # 5. 조각별로 입력
+        if not selected_positions:
+            # 강조 없으면 그냥 입력
+            self.text_input.insert(text)
+            return
+        
+        # 조각별로 입력
         last_end = 0
         for pos in selected_positions:
             # 일반 텍스트 부분 입력
             if pos['start'] > last_end:
                 normal_text = text[last_end:pos['start']]
-                pyperclip.copy(normal_text)
-                ActionChains(self.driver).key_down(Keys.CONTROL).send_keys('v').key_up(Keys.CONTROL).perform()
-                time.sleep(0.1)
+                self.text_input.insert(normal_text)
+                self.waits.pause(0.1)
             
             # 스타일 버튼 먼저 활성화
             print(f"         [{pos['style']}] '{pos['text']}'")
             self._activate_style(pos['style'])
             
             # 강조 텍스트 입력 (스타일 적용된 상태로)
-            pyperclip.copy(pos['text'])
-            ActionChains(self.driver).key_down(Keys.CONTROL).send_keys('v').key_up(Keys.CONTROL).perform()
-            time.sleep(0.1)
+            self.text_input.insert(pos['text'])
+            self.waits.pause(0.1)
             
             # 스타일 버튼 비활성화
             self._deactivate_style(pos['style'])
@@ -426,80 +397,58 @@ class BlogWriter:
         # 마지막 남은 텍스트
         if last_end < len(text):
             final_text = text[last_end:]
-            pyperclip.copy(final_text)
-            ActionChains(self.driver).key_down(Keys.CONTROL).send_keys('v').key_up(Keys.CONTROL).perform()
+            self.text_input.insert(final_text)
 
     def write_blog_post(self, title, ai_result, image_files, shopping_link):
         """블로그에 글 작성"""
         print(f"\n📝 블로그 글 작성 중...")
         
         try:
-            # AI 결과 파싱
-            ai_content = ai_result['content']
-            tags = ai_result['tags']
+            # AI 결과 파싱 (스트리밍이면 본문/태그/강조 키워드는 입력하면서 받음)
+            stream = ai_result.get('stream')
+            ai_content = ai_result.get('content', '')
+            tags = ai_result.get('tags', [])
             highlights = ai_result.get('highlights', [])  # highlights 받기
             
-            print(f"   ℹ️  강조 키워드: {len(highlights)}개")
+            if stream is None:
+                print(f"   ℹ️  강조 키워드: {len(highlights)}개")
             
-            # 글쓰기 페이지 이동
-            self.driver.get(f'https://blog.naver.com/{self.blog_id}/postwrite')
-            time.sleep(3)
-            
-            # 리다이렉트 (발행 버튼 노출)
-            current_url = self.driver.current_url
-            self.driver.get(current_url)
-            time.sleep(5)
-            
-            # 제목 입력
-            print("   ✏️  제목 입력...")
-            try:
-                title_div = self.driver.find_element(By.CSS_SELECTOR, "div.se-title-text")
-                title_div.click()
-                time.sleep(1)
-                
-                title_text = f"{title} 솔직 후기"
-                ActionChains(self.driver).send_keys(title_text).perform()
-                time.sleep(0.5)
-                print(f"   ✅ 제목: {title_text}")
-            except Exception as e:
-                print(f"   ⚠️ 제목 입력 실패: {e}")
-            
-            # 본문 에디터 찾기
-            print("   📄 본문 에디터 찾기...")
-            editors = self.driver.find_elements(By.CSS_SELECTOR, ".se-component-content")
-            if len(editors) >= 2:
-                editor = editors[1]
-                editor.click()
-                time.sleep(1)
-                print("   ✅ 본문 에디터 준비 완료")
-            else:
-                print("   ❌ 본문 에디터를 찾을 수 없습니다")
+            if not self._open_editor(title):
                 return False
-
-
             
             # AI 콘텐츠 파싱 및 작성
             print("   ✍️  본문 작성 중...")
             # 이미지 순서 랜덤 섞기
             random.shuffle(image_files)
-            elements = self._parse_content(ai_content, image_files, shopping_link)
-            
-            for idx, element in enumerate(elements):
-                self._insert_element(element, highlights)  # highlights 전달
+            if stream is not None:
+                ai_result, text_elements = self._write_streamed_body(stream, title, image_files, shopping_link)
+                if not ai_result:
+                    print("   ❌ AI 글 생성 실패 (스트리밍)")
+                    return False
+                tags = ai_result['tags']
+            else:
+                elements = self._parse_content(ai_content, image_files, shopping_link)
+                
+                for idx, element in enumerate(elements):
+                    self._insert_element(element, highlights)  # highlights 전달
             
             print("   ✅ 본문 작성 완료!")
             
             # 링크 삽입 후 에디터 안정화 대기
             print("   ⏳ 에디터 안정화 대기 중...")
-            time.sleep(2)
+            self.waits.dom_quiet(quiet=0.5, timeout=5)
             
             # 해시태그를 본문 맨 끝에 추가
             print("   🏷️  해시태그 추가 시작...")
             self._insert_hashtags_in_content(tags)
             print("   ✅ 해시태그 추가 완료")
             
-            # 스타일은 이미 입력하면서 적용됨
-            print("   ℹ️  스타일 적용은 텍스트 입력 중 완료")
+            if stream is not None and text_elements is not None:
+                # 강조 키워드는 본문 끝(JSON)에 오므로 입력이 끝난 뒤 적용
+                self._apply_highlights_after(text_elements, ai_result.get('highlights', []))
+            else:
+                # 스타일은 이미 입력하면서 적용됨
+                print("   ℹ️  스타일 적용은 텍스트 입력 중 완료")
             
             # 발행하기
             print("\n🚀 발행 프로세스 시작...")
@@ -515,114 +464,136 @@ class BlogWriter:
             traceback.print_exc()
             return False
     
-    def _parse_content(self, content, image_files, shopping_link):
-        """AI 콘텐츠 파싱"""
-        elements = []
-        lines = content.split('\n')
+    def _open_editor(self, title, reopen=False):
+        """
+        글쓰기 페이지를 열고 제목 입력 + 본문 에디터 클릭
         
-        # 섹션 추적 변수
-        current_section = 'intro'  # 시작은 도입부
-        advantage_count = 0  # 장점 카운터
-        is_disadvantage = False  # 단점 섹션 플래그
+        Args:
+            title: 상품명
+            reopen: 작성 중이던 글을 버리고 다시 여는 경우 (이어쓰기 팝업 확인)
         
-        i = 0
-        while i < len(lines):
-            line = lines[i].strip()
-            
-            if not line:
-                i += 1
-                continue
-            
-            # [QUOTE:VERTICAL] - 제목 인용구
-            if line == '[QUOTE:VERTICAL]':
-                i += 1
-                if i < len(lines):
-                    elements.append({
-                        'type': 'quote',
-                        'style': 'vertical',
-                        'content': lines[i].strip(),
-                        'section': 'title'
-                    })
-                i += 1
-            
-            # [QUOTE:UNDERLINE] - 장점 인용구
-            elif line == '[QUOTE:UNDERLINE]':
-                advantage_count += 1
-                current_section = f'advantage_{advantage_count}'
-                i += 1
-                if i < len(lines):
-                    elements.append({
-                        'type': 'quote',
-                        'style': 'underline',
-                        'content': lines[i].strip(),
-                        'section': current_section
-                    })
-                i += 1
-            
-            # [TEXT]
-            elif line == '[TEXT]':
-                i += 1
-                if i < len(lines):
-                    text_content = lines[i].strip()
-                    
-                    # 단점 섹션 감지 (키워드 기반)
-                    disadvantage_keywords = ['아쉬운', '불편', '단점', '아쉽', '불만']
-                    if any(keyword in text_content for keyword in disadvantage_keywords):
-                        is_disadvantage = True
-                        section = 'disadvantage'
-                    elif is_disadvantage:
-                        # 단점 섹션 끝나고 마무리
-                        is_disadvantage = False
-                        section = 'conclusion'
-                        current_section = 'conclusion'
-                    elif advantage_count == 0:
-                        # 장점 시작 전 = 도입부
-                        section = 'intro'
-                    elif advantage_count > 0 and current_section.startswith('advantage'):
-                        # 장점 섹션 유지
-                        section = current_section
-                    else:
-                        section = current_section
-                    
-                    elements.append({
-                        'type': 'text',
-                        'content': text_content,
-                        'section': section
-                    })
-                i += 1
-            
-            # [IMAGE:x,y] or [IMAGE:x]
-            elif line.startswith('[IMAGE:'):
-                nums_str = line.replace('[IMAGE:', '').replace(']', '')
-                img_nums = [int(n.strip()) for n in nums_str.split(',') if n.strip().isdigit()]
-                
-                img_files = []
-                for num in img_nums:
-                    if 0 < num <= len(image_files):
-                        img_files.append(image_files[num-1])
-                
-                if img_files:
-                    elements.append({
-                        'type': 'image',
-                        'images': img_files,
-                        'single': len(img_files) == 1,  # 단일 이미지 표시
-                        'section': current_section
-                    })
-                i += 1
-            
-            # [LINK]
-            elif line == '[LINK]':
-                elements.append({
-                    'type': 'text',
-                    'content': shopping_link,
-                    'section': 'conclusion'
-                })
-                i += 1
+        Returns:
+            bool: 본문 에디터 준비 여부
+        """
+        # 글마다 HTML 삽입 다시 시도 (이전 글에서 실패했어도)
+        self.editor_injector = EditorInjector(self.driver, self.waits) if self.use_html_injection else None
+        
+        # 글쓰기 페이지 이동 (작성 중인 글이 있으면 '페이지 나가기' 확인창 수락)
+        try:
+            self.driver.get(f'https://blog.naver.com/{self.blog_id}/postwrite')
+        except Exception:
+            self._accept_alert()
+        self.waits.page_loaded()
+        
+        # 리다이렉트 (발행 버튼 노출)
+        current_url = self.driver.current_url
+        self.driver.get(current_url)
+        
+        # 제목/본문 영역이 그려질 때까지 대기 (고정 대기 없음)
+        self.waits.editor_ready(timeout=20)
+        
+        # '작성 중인 글이 있습니다' 이어쓰기 팝업이 뜨면 취소 (새 글로 작성)
+        if reopen:
+            cancel = self.waits.until(
+                lambda: self.driver.find_element(By.CSS_SELECTOR, '.se-popup-button-cancel'), timeout=2
+            )
+            if cancel:
+                cancel.click()
+        
+        # 제목 입력
+        print("   ✏️  제목 입력...")
+        try:
+            title_div = self.driver.find_element(By.CSS_SELECTOR, "div.se-title-text")
+            title_div.click()
+            self.waits.pause(0.5)
+            
+            title_text = f"{title} 솔직 후기"
+            ActionChains(self.driver).send_keys(title_text).perform()
+            self.waits.pause(0.5)
+            print(f"   ✅ 제목: {title_text}")
+        except Exception as e:
+            print(f"   ⚠️ 제목 입력 실패: {e}")
+        
+        # 본문 에디터 찾기
+        print("   📄 본문 에디터 찾기...")
+        editors = self.driver.find_elements(By.CSS_SELECTOR, ".se-component-content")
+        if len(editors) < 2:
+            print("   ❌ 본문 에디터를 찾을 수 없습니다")
+            return False
+        editors[1].click()
+        self.waits.pause(0.5)
+        print("   ✅ 본문 에디터 준비 완료")
+        return True
+    
+    def _accept_alert(self):
+        """브라우저 확인창(alert/beforeunload)이 떠 있으면 수락"""
+        try:
+            self.driver.switch_to.alert.accept()
+        except Exception:
+            pass
+    
+    def _write_streamed_body(self, stream, title, image_files, shopping_link):
+        """
+        AI 응답 조각을 받는 대로 줄 단위로 파싱해서 에디터에 입력
+        
+        스트림이 중간에 끊겨 생성 쪽이 전체 본문을 다시 받으면(StreamReset) 이미 입력한 내용이 있을 때
+        에디터를 다시 열고, 전체 본문을 스트리밍 없이 입력 (강조 키워드도 입력하면서 적용)
+        
+        Args:
+            stream: AIStream (AIContentGenerator.generate_content_with_vision(..., stream=stream))
+            title: 상품명 (에디터를 다시 열 때 제목 입력용)
+            image_files: 이미지 파일 경로 리스트
+            shopping_link: 쇼핑 링크
             
-            else:
-                i += 1
+        Returns:
+            tuple: (AI 결과 dict 또는 None, 입력한 텍스트 요소 리스트 - 전체 본문으로 다시 썼으면 None)
+        """
+        seen_phrases = set()
+        parser = ContentStreamParser(image_files, shopping_link,
+                                     transform=lambda line: StyleUtils.soft_avoid_phrases(line, seen_phrases))
+        text_elements = []
+        inserted = []
+        
+        def insert(elements):
+            for element in elements:
+                self._insert_element(element)  # 강조 키워드는 아직 모름
+                inserted.append(element)
+                if element['type'] == 'text' and element['content'] != shopping_link:
+                    text_elements.append(element)
         
-        return elements
+        try:
+            for chunk in stream.chunks(timeout=self.stream_timeout):
+                insert(parser.feed(chunk))
+            insert(parser.close())
+        except StreamReset:
+            ai_result = stream.result(timeout=self.stream_timeout)
+            if not ai_result:
+                return None, text_elements
+            print(f"   ↩️ 스트리밍 중단 - 전체 본문으로 다시 작성 (이미 입력한 요소 {len(inserted)}개)")
+            if inserted and not self._open_editor(title, reopen=True):
+                return None, text_elements
+            highlights = ai_result.get('highlights', [])
+            for element in self._parse_content(ai_result['content'], image_files, shopping_link):
+                self._insert_element(element, highlights)
+            return ai_result, None
+        
+        ai_result = stream.result(timeout=self.stream_timeout)
+        if ai_result:
+            print(f"   ✅ 스트리밍 입력 완료 (요소 {len(text_elements)}개 텍스트)")
+        return ai_result, text_elements
+    
+    def _apply_highlights_after(self, text_elements, highlights):
+        """입력이 끝난 본문에서 섹션별 강조 키워드를 찾아 스타일 적용"""
+        if not highlights:
+            return
+        print(f"   🎨 강조 키워드 {len(highlights)}개 적용 중...")
+        for element in text_elements:
+            for pos in self._select_highlight_positions(element['content'], highlights, element['section']):
+                self._apply_text_style_to_keyword(pos['text'], pos['style'])
+    
+    def _parse_content(self, content, image_files, shopping_link):
+        """AI 콘텐츠 파싱"""
+        return parse_content(content, image_files, shopping_link)
     
     def _insert_element(self, element, highlights=None):
         """요소 삽입"""
@@ -644,23 +615,21 @@ class BlogWriter:
                 # 옵션 버튼 클릭
                 option_btn = self.driver.find_element(By.CSS_SELECTOR, '[data-name="insert-quotation"] .se-document-toolbar-select-option-button')
                 option_btn.click()
-                time.sleep(1)
                 
-                # 스타일 선택
-                quote_btn = self.driver.find_element(By.CSS_SELECTOR, f'[data-value="{target_value}"]')
+                # 스타일 선택 (메뉴가 열릴 때까지 대기)
+                quote_btn = self.waits.element(f'[data-value="{target_value}"]', timeout=5)
                 quote_btn.click()
-                time.sleep(0.5)
+                self.waits.pause(0.5)
                 
                 # 텍스트 입력
-                pyperclip.copy(element['content'])
-                ActionChains(self.driver).key_down(Keys.CONTROL).send_keys('v').key_up(Keys.CONTROL).perform()
-                time.sleep(0.5)
+                self.text_input.insert(element['content'])
+                self.waits.pause(0.5)
                 
                 # 인용구 빠져나오기
                 ActionChains(self.driver).send_keys(Keys.ARROW_DOWN).perform()
-                time.sleep(0.2)
+                self.waits.pause(0.2)
                 ActionChains(self.driver).send_keys(Keys.ARROW_DOWN).perform()
-                time.sleep(0.5)
+                self.waits.pause(0.5)
             
             # 텍스트
             elif elem_type == 'text':
@@ -693,16 +662,12 @@ class BlogWriter:
                     formatted_text += paragraph + "\n\n"
                     i += paragraph_size
                 
-                # highlights가 있으면 스타일 적용하면서 입력, 없으면 그냥 입력
-                if highlights:
-                    self._insert_text_with_inline_styles(formatted_text.strip(), highlights, section)
-                else:
-                    pyperclip.copy(formatted_text.strip())
-                    ActionChains(self.driver).key_down(Keys.CONTROL).send_keys('v').key_up(Keys.CONTROL).perform()
+                # 강조 스타일 적용하면서 입력 (HTML 한 번에 붙여넣기, 실패 시 조각별 입력)
+                self._insert_text_with_inline_styles(formatted_text.strip(), highlights, section)
                 
-                time.sleep(0.5)
+                self.waits.pause(0.5)
                 ActionChains(self.driver).send_keys(Keys.ENTER).send_keys(Keys.ENTER).perform()
-                time.sleep(0.5)
+                self.waits.pause(0.5)
             
             # 이미지
             elif elem_type == 'image':
@@ -724,12 +689,9 @@ class BlogWriter:
             # 해시태그 텍스트 생성
             hashtag_text = " ".join([f"#{tag}" for tag in tags])
             
-            # 클립보드에 복사
-            pyperclip.copy(hashtag_text)
-            
-            # 붙여넣기
-            ActionChains(self.driver).key_down(Keys.CONTROL).send_keys('v').key_up(Keys.CONTROL).perform()
-            time.sleep(0.5)
+            # 커서 위치에 입력 (클립보드 사용 안 함)
+            self.text_input.insert(hashtag_text)
+            self.waits.pause(0.5)
             
             print(f"   ✅ 해시태그 {len(tags)}개 추가 완료!")
             print(f"      예시: {' '.join([f'#{tag}' for tag in tags[:3]])}...")
@@ -746,7 +708,7 @@ class BlogWriter:
         try:
             # 해시태그 입력 후 대기
             print("   ⏳ 발행 전 대기 중...")
-            time.sleep(2)
+            self.waits.dom_quiet(quiet=0.5, timeout=5)
             
             # 발행 버튼 찾기 (오른쪽 상단)
             print("   🔍 발행 버튼 찾는 중...")
@@ -786,8 +748,8 @@ class BlogWriter:
                 return False
             
             # 첫 번째 발행 버튼 클릭
+            editor_url = self.driver.current_url
             publish_btn.click()
-            time.sleep(2)
             print("   ✅ 발행 버튼 클릭")
             
             # 발행 확인 버튼 클릭 (팝업)
@@ -800,6 +762,9 @@ class BlogWriter:
                 "button.se-publish-confirm"
             ]
             
+            # 발행 팝업이 열릴 때까지 대기
+            self.waits.any_element(confirm_selectors, timeout=10)
+            
             for selector in confirm_selectors:
                 try:
                     confirm_btn = self.driver.find_element(By.CSS_SELECTOR, selector)
@@ -813,7 +778,8 @@ class BlogWriter:
             
             if confirm_btn:
                 confirm_btn.click()
-                time.sleep(3)
+                # 발행 후 글 보기 페이지로 이동할 때까지 대기
+                self.waits.until(lambda: self.driver.current_url != editor_url, 15, "발행 후 페이지 이동")
                 print("   ✅ 발행 확인 완료!")
                 print("\n" + "="*60)
                 print("🎉 블로그 글 발행 성공!")
@@ -833,57 +799,14 @@ class BlogWriter:
     def _upload_single_image(self, image_file):
         """단일 이미지 업로드 (콜라주 없이)"""
         try:
-            # 사진 버튼 클릭
-            photo_btn = self.driver.find_element(By.CSS_SELECTOR, "button[data-name='image']")
-            photo_btn.click()
-            time.sleep(3)
-            
-            # file input 찾기
-            file_inputs = self.driver.find_elements(By.CSS_SELECTOR, "input[type='file']")
-            file_input = None
-            for inp in file_inputs:
-                try:
-                    accept = inp.get_attribute('accept')
-                    if accept and 'image' in accept:
-                        file_input = inp
-                        break
-                except:
-                    pass
-            
-            if not file_input and file_inputs:
-                file_input = file_inputs[0]
+            before_images = self.waits.editor_image_count()
             
-            if not file_input:
+            # 사진 버튼 → 파일 전달 (파일 선택 창 없이)
+            if not self.image_uploader.upload([image_file]):
                 return
             
-            # 파일 업로드 (단일)
-            file_input.send_keys(image_file)
-            time.sleep(1)
-            
-            # 파일 선택 창 닫기 (win32gui 직접 종료)
-            def find_window_by_title(title_part):
-                def callback(hwnd, windows):
-                    if win32gui.IsWindowVisible(hwnd):
-                        window_title = win32gui.GetWindowText(hwnd)
-                        if title_part in window_title:
-                            windows.append(hwnd)
-                    return True
-                
-                windows = []
-                win32gui.EnumWindows(callback, windows)
-                return windows[0] if windows else None
-            
-            hwnd = None
-            for i in range(5):
-                time.sleep(1)
-                hwnd = find_window_by_title("열기")
-                if hwnd:
-                    break
-            
-            if hwnd:
-                # WM_CLOSE 메시지로 창 닫기
-                win32gui.PostMessage(hwnd, win32con.WM_CLOSE, 0, 0)
-                time.sleep(2)
+            # 에디터에 이미지가 들어가고 썸네일이 로드될 때까지 대기
+            self.waits.upload_done(before_images, timeout=30)
             
             print(f"      ✅ 단일 이미지 업로드 완료")
             
@@ -893,67 +816,22 @@ class BlogWriter:
     def _upload_collage_images(self, image_files):
         """콜라주 이미지 업로드"""
         try:
-            # 사진 버튼 클릭
-            photo_btn = self.driver.find_element(By.CSS_SELECTOR, "button[data-name='image']")
-            photo_btn.click()
-            time.sleep(3)
-            
-            # file input 찾기
-            file_inputs = self.driver.find_elements(By.CSS_SELECTOR, "input[type='file']")
-            file_input = None
-            for inp in file_inputs:
-                try:
-                    accept = inp.get_attribute('accept')
-                    if accept and 'image' in accept:
-                        file_input = inp
-                        break
-                except:
-                    pass
-            
-            if not file_input and file_inputs:
-                file_input = file_inputs[0]
+            before_images = self.waits.editor_image_count()
             
-            if not file_input:
+            # 사진 버튼 → 파일 전달 (파일 선택 창 없이)
+            if not self.image_uploader.upload(image_files):
                 return
             
-            # 파일 업로드
-            files_path = '\n'.join(image_files)
-            file_input.send_keys(files_path)
-            time.sleep(1)
-            
-            # 파일 선택 창 닫기 (win32gui 직접 종료)
-            def find_window_by_title(title_part):
-                def callback(hwnd, windows):
-                    if win32gui.IsWindowVisible(hwnd):
-                        window_title = win32gui.GetWindowText(hwnd)
-                        if title_part in window_title:
-                            windows.append(hwnd)
-                    return True
-                
-                windows = []
-                win32gui.EnumWindows(callback, windows)
-                return windows[0] if windows else None
-            
-            hwnd = None
-            for i in range(5):
-                time.sleep(1)
-                hwnd = find_window_by_title("열기")
-                if hwnd:
-                    break
-            
-            if hwnd:
-                # WM_CLOSE 메시지로 창 닫기
-                win32gui.PostMessage(hwnd, win32con.WM_CLOSE, 0, 0)
-                time.sleep(2)
+            # 에디터에 이미지가 들어가고 썸네일이 로드될 때까지 대기
+            self.waits.upload_done(before_images, timeout=30)
             
             # 콜라주 버튼 클릭
             if len(image_files) >= 2:
-                time.sleep(2)
-                collage_label = self.driver.find_element(By.CSS_SELECTOR, "label[for='image-type-collage']")
+                collage_label = self.waits.element("label[for='image-type-collage']", timeout=10, visible=False)
                 self.driver.execute_script("arguments[0].scrollIntoView(true);", collage_label)
-                time.sleep(0.5)
+                self.waits.pause(0.5)
                 collage_label.click()
-                time.sleep(2)
+                self.waits.dom_quiet(quiet=0.5, timeout=5)
                 
         except Exception as e:
             print(f"      ⚠️ 이미지 업로드 실패: {e}")
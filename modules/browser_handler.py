@@ -5,18 +5,23 @@
 - 캡차 처리 (Gemini Vision)
 """
 
-import time
 import os
 import json
-import pyperclip
 from selenium.webdriver.common.by import By
-from selenium.webdriver.common.keys import Keys
+
+from .gemini_client import GeminiClient
+from .model_router import ModelRouter
+from .naver_session import get_naver_cookies, has_login_cookies, is_captcha_page, restore_cookies
+from .text_input import TextInput
+from .waits import Waits
+from .workspace import JobWorkspace
 
 
 class BrowserHandler:
     """브라우저 관련 작업 처리 클래스"""
     
-    def __init__(self, driver, naver_id, naver_pw, cookies_file, gemini_api_key):
+    def __init__(self, driver, naver_id, naver_pw, cookies_file, gemini_api_key, timing_profile='normal',
+                 text_input_backend='auto'):
         """
         초기화
         
@@ -26,8 +31,12 @@ class BrowserHandler:
             naver_pw: 네이버 비밀번호
             cookies_file: 쿠키 파일 경로
             gemini_api_key: Gemini API 키 (캡차 해결용)
+            timing_profile: 실행 속도 프로필 ('fast' / 'normal' / 'slow')
+            text_input_backend: 텍스트 입력 방식 ('auto' / 'cdp' / 'script' / 'keys' / 'clipboard')
         """
         self.driver = driver
+        self.waits = Waits(driver, timing_profile)
+        self.text_input = TextInput(driver, self.waits, text_input_backend)
         self.naver_id = naver_id
         self.naver_pw = naver_pw
         self.cookies_file = cookies_file
@@ -37,12 +46,14 @@ class BrowserHandler:
         """네이버 로그인"""
         print("\n🔐 네이버 로그인...")
         
+        # 프로필에 로그인 세션이 남아 있으면 바로 사용 (페이지 이동 없이 쿠키만 확인)
+        if has_login_cookies(self.driver):
+            print("✅ 저장된 브라우저 세션으로 로그인 생략!")
+            return True
+        
         # 쿠키로 로그인 시도
         if self.load_cookies():
-            self.driver.get('https://www.naver.com')
-            time.sleep(2)
-            
-            if 'blog.naver.com' in self.driver.current_url or 'NID_AUT' in self.driver.page_source:
+            if has_login_cookies(self.driver):
                 print("✅ 쿠키 로그인 성공!")
                 return True
             else:
@@ -50,29 +61,29 @@ class BrowserHandler:
         
         # 네이버 로그인 페이지
         self.driver.get('https://nid.naver.com/nidlogin.login')
-        time.sleep(3)
+        self.waits.element('#id', timeout=10)
         
         # 자동 로그인 시도
         try:
             id_input = self.driver.find_element(By.ID, 'id')
             id_input.click()
-            time.sleep(0.8)
+            self.waits.pause(0.8)
             
-            pyperclip.copy(self.naver_id)
-            id_input.send_keys(Keys.CONTROL, 'v')
-            time.sleep(1.5)
+            self.text_input.insert(self.naver_id)
+            self.waits.pause(1.5)
             
             pw_input = self.driver.find_element(By.ID, 'pw')
             pw_input.click()
-            time.sleep(0.8)
+            self.waits.pause(0.8)
             
-            pyperclip.copy(self.naver_pw)
-            pw_input.send_keys(Keys.CONTROL, 'v')
-            time.sleep(1.5)
+            self.text_input.insert(self.naver_pw)
+            self.waits.pause(1.5)
             
             login_btn = self.driver.find_element(By.ID, 'log.login')
             login_btn.click()
-            time.sleep(5)
+            # 로그인 페이지를 벗어나거나(성공) 캡차/오류가 뜰 때까지 대기
+            self.waits.until(lambda: 'nidlogin.login' not in self.driver.current_url, 10)
+            self.waits.page_loaded()
             
             current_url = self.driver.current_url
             if 'nid.naver.com' not in current_url:
@@ -99,7 +110,7 @@ class BrowserHandler:
     def save_cookies(self):
         """쿠키 저장"""
         try:
-            cookies = self.driver.get_cookies()
+            cookies = get_naver_cookies(self.driver)
             with open(self.cookies_file, 'w') as f:
                 json.dump(cookies, f)
             print("✅ 쿠키 저장 완료")
@@ -113,8 +124,14 @@ class BrowserHandler:
                 with open(self.cookies_file, 'r') as f:
                     cookies = json.load(f)
                 
+                # CDP로 한 번에 복원 (페이지 이동 없음)
+                if restore_cookies(self.driver, cookies):
+                    print("✅ 쿠키 로드 완료")
+                    return True
+                
+                # CDP를 못 쓰면 naver.com에서 하나씩 추가
                 self.driver.get('https://www.naver.com')
-                time.sleep(1)
+                self.waits.page_loaded()
                 
                 for cookie in cookies:
                     try:
@@ -123,7 +140,7 @@ class BrowserHandler:
                         pass
                 
                 self.driver.refresh()
-                time.sleep(2)
+                self.waits.page_loaded()
                 print("✅ 쿠키 로드 완료")
                 return True
         except Exception as e:
@@ -138,48 +155,38 @@ class BrowserHandler:
             bool: 캡차 해결 성공 여부
         """
         try:
-            time.sleep(2)
+            self.waits.page_loaded()
             
-            # 캡차 확인
-            page_source = self.driver.page_source
-            is_captcha = (
-                "보안 확인" in page_source or 
-                "보안 학인을 완료해 주세요" in page_source or
-                "구매한 물건은 총 몇 개 입니까" in page_source or
-                "몇 개 입니까" in page_source
-            )
+            # 캡차 확인 (캡차 요소/안내 문구만 확인, 페이지 전체 HTML은 받지 않음)
+            is_captcha = is_captcha_page(self.driver)
             
             if not is_captcha:
                 return False
             
             print("🔐 캡차 감지! Gemini로 자동 해결 시도...")
             
-            # 스크린샷
-            screenshot_path = 'temp_captcha.png'
-            self.driver.save_screenshot(screenshot_path)
-            print(f"   📸 캡차 스크린샷 저장")
-            
-            # Gemini Vision으로 해결
-            answer = self._solve_captcha_with_gemini(screenshot_path)
+            # 스크린샷 (동시에 실행 중인 다른 봇과 겹치지 않도록 작업 폴더 사용)
+            with JobWorkspace(label='captcha') as workspace:
+                screenshot_path = workspace.file('captcha.png')
+                self.driver.save_screenshot(screenshot_path)
+                print(f"   📸 캡차 스크린샷 저장")
+                
+                # Gemini Vision으로 해결
+                answer = self._solve_captcha_with_gemini(screenshot_path)
             
             if answer:
                 # 답 입력
                 captcha_input = self.driver.find_element(By.ID, 'captchaAnswer')
                 captcha_input.clear()
                 captcha_input.send_keys(answer)
-                time.sleep(1)
+                self.waits.pause(1)
                 
                 # 확인 버튼
                 confirm_btn = self.driver.find_element(By.CSS_SELECTOR, 'button[type="submit"]')
                 confirm_btn.click()
-                time.sleep(3)
+                self.waits.network_quiet(timeout=10)
                 
                 print(f"   ✅ 캡차 해결 완료: {answer}")
-                
-                # 정리
-                if os.path.exists(screenshot_path):
-                    os.remove(screenshot_path)
-                
                 return True
             
             return False
@@ -199,12 +206,8 @@ class BrowserHandler:
             str: 캡차 답 (숫자)
         """
         try:
-            import google.generativeai as genai
             from PIL import Image
             
-            genai.configure(api_key=self.gemini_api_key)
-            model = genai.GenerativeModel('gemini-2.5-pro')
-            
             img = Image.open(screenshot_path)
             
             prompt = """
@@ -218,7 +221,8 @@ class BrowserHandler:
 설명 없이 답(숫자)만 출력하세요:
 """
             
-            response = model.generate_content([prompt, img])
+            # 캡차는 짧은 질문 1개라 Flash부터 (실패 시 Pro)
+            response = ModelRouter(GeminiClient.shared(self.gemini_api_key)).generate('captcha', [prompt, img])
             answer = response.text.strip()
             
             # 숫자만 추출
@@ -0,0 +1,395 @@
+"""
+브라우저 풀 모듈
+- 네이버 계정마다 Chrome 1개 (계정별 프로필 폴더 + 쿠키 파일)
+- 미리 띄워서 로그인까지 해두고(prewarm) 작업에 빌려줌
+- 빌려줄 때 상태 확인 → 죽었으면 재시작 + 재로그인
+- N개 글 작성 후 또는 Chrome 메모리가 많이 늘면 브라우저 재시작 (재활용)
+  (Chrome 프로세스 전체 RSS, psutil이 없으면 CDP Performance.getMetrics)
+- 일정 시간 안 쓰면 브라우저 종료 (다음에 빌릴 때 다시 시작)
+- run()으로 URL 목록을 계정들에 나눠서 동시에 처리
+"""
+
+import os
+import time
+import threading
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import psutil
+except ImportError:  # 미설치면 CDP 메트릭으로 대체
+    psutil = None
+
+from .metrics import TimingRecorder, TokenUsage
+from .naver_session import account_key, profile_dir
+from .utils import get_app_data_dir
+
+
+class PooledBrowser:
+    """풀에 들어있는 브라우저 1개 (계정 1개)"""
+
+    def __init__(self, account, bot):
+        """
+        초기화
+
+        Args:
+            account: 계정 설정 dict
+            bot: 이 계정 전용 NaverBlogAutomation
+        """
+        self.account = account
+        self.bot = bot
+        self.name = account['naver_id']
+        self.in_use = False
+        self.posts = 0              # 브라우저 시작 후 작성한 글 수
+        self.started_at = None
+        self.last_used = time.time()
+        self.baseline_memory = None  # 로그인 직후 메모리 사용량 (바이트)
+        self.needs_recycle = False
+
+    @property
+    def running(self):
+        """브라우저가 떠 있는지"""
+        return self.bot.driver is not None
+
+
+class BrowserPool:
+    """여러 네이버 계정의 브라우저를 관리하는 클래스"""
+
+    def __init__(self, accounts, bot_factory=None, prewarm=None, max_posts=20, max_memory_growth_mb=300,
+                 idle_timeout=600, headless=False, timing_profile='normal', version_main=141,
+                 profiles_dir=None, progress_callback=None):
+        """
+        초기화
+
+        Args:
+            accounts: 계정 dict 리스트 [{'blog_id', 'naver_id', 'naver_pw', 'gemini_api_key'}]
+            bot_factory: 계정 dict + 옵션 → 봇을 만드는 함수 (기본: NaverBlogAutomation)
+            prewarm: start()에서 미리 띄울 브라우저 개수 (기본: 전체)
+            max_posts: 이 개수만큼 글을 쓰면 브라우저 재시작
+            max_memory_growth_mb: 로그인 직후보다 Chrome 메모리가 이만큼 늘면 재시작
+            idle_timeout: 이 시간(초) 동안 안 쓰면 브라우저 종료 (0이면 종료 안 함)
+            headless: 화면 없이 실행
+            timing_profile: 실행 속도 프로필
+            version_main: Chrome 주 버전 (undetected_chromedriver)
+            profiles_dir: 계정별 프로필 폴더 위치 (기본: ColdAPP 데이터 폴더/profiles)
+            progress_callback: 진행 메시지 콜백 (선택)
+        """
+        if not accounts:
+            raise ValueError("계정이 1개 이상 필요합니다")
+
+        self.prewarm = len(accounts) if prewarm is None else min(prewarm, len(accounts))
+        self.max_posts = max_posts
+        self.max_memory_growth = max_memory_growth_mb * 1024 * 1024
+        self.idle_timeout = idle_timeout
+        self.profiles_dir = profiles_dir or get_app_data_dir('profiles')
+        self.progress_callback = progress_callback
+
+        options = {'headless': headless, 'timing_profile': timing_profile, 'version_main': version_main}
+        factory = bot_factory or self._default_factory
+        self.entries = []
+        for account in accounts:
+            bot = factory(account, **options)
+            # 계정마다 프로필/쿠키를 따로 (같은 프로필을 두 브라우저가 쓰면 Chrome이 잠금)
+            bot.user_data_dir = profile_dir(account['naver_id'], self.profiles_dir)
+            bot.cookies_file = os.path.join(self.profiles_dir, f"{account_key(account['naver_id'])}_cookies.json")
+            self.entries.append(PooledBrowser(account, bot))
+
+        self._condition = threading.Condition()
+        self._launch_lock = threading.Lock()  # 브라우저 시작은 한 번에 하나씩
+        self._closed = False
+        self._reaper = None
+
+    @staticmethod
+    def _default_factory(account, **options):
+        """기본 봇 생성 (NaverBlogAutomation)"""
+        from naver_blog_automation import NaverBlogAutomation
+
+        return NaverBlogAutomation(
+            account['blog_id'], account['naver_id'], account['naver_pw'], account['gemini_api_key'],
+            timing_profile=options['timing_profile'], headless=options['headless'],
+            chrome_version=options['version_main']
+        )
+
+    def _emit(self, msg):
+        """진행 메시지 출력"""
+        print(msg)
+        if self.progress_callback:
+            self.progress_callback(msg)
+
+    def start(self):
+        """
+        브라우저 미리 띄우기 + 로그인 (prewarm 개수만큼, 순서대로)
+
+        Returns:
+            int: 준비된 브라우저 개수
+        """
+        ready = 0
+        for entry in self.entries[:self.prewarm]:
+            if self._launch(entry):
+                ready += 1
+
+        if self.idle_timeout and not self._reaper:
+            self._reaper = threading.Thread(target=self._reap_idle, daemon=True)
+            self._reaper.start()
+
+        self._emit(f"🌐 브라우저 풀 준비: {ready}/{len(self.entries)}개")
+        return ready
+
+    def _launch(self, entry):
+        """브라우저 시작 + 로그인 (실패 시 브라우저 종료)"""
+        self._emit(f"🌐 [{entry.name}] 브라우저 시작...")
+        try:
+            # undetected_chromedriver는 시작할 때 드라이버 파일을 고치므로 동시에 시작하면 충돌
+            with self._launch_lock:
+                entry.bot.start_browser()
+            if not entry.bot.login():
+                self._emit(f"❌ [{entry.name}] 로그인 실패")
+                self._stop(entry)
+                return False
+        except Exception as e:
+            self._emit(f"❌ [{entry.name}] 브라우저 시작 실패: {e}")
+            self._stop(entry)
+            return False
+
+        entry.posts = 0
+        entry.started_at = time.time()
+        entry.needs_recycle = False
+        entry.baseline_memory = self._memory_size(entry)
+        return True
+
+    def _stop(self, entry):
+        """브라우저 종료"""
+        try:
+            entry.bot.close()
+        except Exception:
+            pass
+        entry.bot.driver = None
+
+    def _memory_size(self, entry):
+        """
+        브라우저 메모리 사용량 (모르면 None)
+
+        psutil이 있으면 Chrome/chromedriver 프로세스 전체 RSS (페이지 이동과 무관하게 누적 증가를 봄),
+        없으면 CDP Performance.getMetrics의 현재 페이지 JS 힙 크기 (페이지를 옮기면 다시 작아질 수 있음)
+        """
+        driver = entry.bot.driver
+        if driver is None:
+            return None
+        if psutil is not None:
+            size = self._process_rss(driver)
+            if size:
+                return size
+        try:
+            driver.execute_cdp_cmd('Performance.enable', {})
+            metrics = driver.execute_cdp_cmd('Performance.getMetrics', {}).get('metrics', [])
+            values = {m.get('name'): m.get('value', 0) for m in metrics}
+            return int(values.get('JSHeapTotalSize', 0)) or None
+        except Exception:
+            return None
+
+    @staticmethod
+    def _process_rss(driver):
+        """Chrome 브라우저(하위 렌더러/GPU 포함)와 chromedriver 프로세스 RSS 합계 (실패 시 None)"""
+        # undetected_chromedriver는 Chrome을 직접 띄우므로(browser_pid) chromedriver 하위가 아닐 수 있음
+        root_pids = [getattr(driver, 'browser_pid', None),
+                     getattr(getattr(getattr(driver, 'service', None), 'process', None), 'pid', None)]
+        seen = set()
+        total = 0
+        for pid in filter(None, root_pids):
+            try:
+                root = psutil.Process(pid)
+                processes = [root] + root.children(recursive=True)
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                continue
+            for proc in processes:
+                if proc.pid in seen:
+                    continue
+                seen.add(proc.pid)
+                try:
+                    total += proc.memory_info().rss
+                except (psutil.NoSuchProcess, psutil.AccessDenied):
+                    continue
+        return total or None
+
+    def _healthy(self, entry):
+        """브라우저가 응답하는지 확인"""
+        if not entry.running:
+            return False
+        try:
+            entry.bot.driver.current_url
+            return entry.bot.driver.execute_script("return 1") == 1
+        except Exception:
+            return False
+
+    def acquire(self, timeout=None):
+        """
+        브라우저 빌리기 (모두 사용 중이면 반납될 때까지 대기)
+        상태 확인/재활용/재시작을 거친 로그인된 브라우저를 반환
+
+        Args:
+            timeout: 최대 대기 시간(초, None이면 무제한)
+
+        Returns:
+            PooledBrowser: 사용할 브라우저 (시간 초과 시 None)
+        """
+        deadline = time.time() + timeout if timeout else None
+        with self._condition:
+            while True:
+                if self._closed:
+                    raise RuntimeError("브라우저 풀이 종료되었습니다")
+                free = [e for e in self.entries if not e.in_use]
+                if free:
+                    # 이미 떠 있는 브라우저 우선, 그중 오래 쉰 것부터
+                    entry = min(free, key=lambda e: (not e.running, e.last_used))
+                    entry.in_use = True
+                    break
+                remaining = deadline - time.time() if deadline else None
+                if remaining is not None and remaining <= 0:
+                    return None
+                self._condition.wait(remaining)
+
+        # 브라우저 준비는 잠금 밖에서 (다른 작업이 기다리지 않도록)
+        if entry.needs_recycle and entry.running:
+            self._emit(f"♻️ [{entry.name}] 브라우저 재활용 (글 {entry.posts}개 작성)")
+            self._stop(entry)
+        elif entry.running and not self._healthy(entry):
+            self._emit(f"⚠️ [{entry.name}] 브라우저 응답 없음 - 재시작")
+            self._stop(entry)
+
+        if not entry.running and not self._launch(entry):
+            self.release(entry, posts=0)
+            return None
+        return entry
+
+    def release(self, entry, posts=1):
+        """
+        브라우저 반납
+
+        Args:
+            entry: acquire()로 받은 PooledBrowser
+            posts: 이번에 작성한 글 수
+        """
+        entry.posts += posts
+        entry.last_used = time.time()
+
+        if entry.running:
+            if self.max_posts and entry.posts >= self.max_posts:
+                entry.needs_recycle = True
+            memory = self._memory_size(entry)
+            if memory and entry.baseline_memory and memory - entry.baseline_memory > self.max_memory_growth:
+                grown = (memory - entry.baseline_memory) // (1024 * 1024)
+                self._emit(f"⚠️ [{entry.name}] 브라우저 메모리 {grown}MB 증가 - 다음 사용 전 재시작")
+                entry.needs_recycle = True
+
+        with self._condition:
+            entry.in_use = False
+            self._condition.notify()
+
+    @contextmanager
+    def session(self, timeout=None):
+        """
+        with pool.session() as entry: entry.bot.process_url(url)
+
+        Args:
+            timeout: 빌리기 최대 대기 시간(초)
+        """
+        entry = self.acquire(timeout)
+        if entry is None:
+            raise RuntimeError("사용할 수 있는 브라우저가 없습니다")
+        posts = 0
+        try:
+            yield entry
+            posts = 1
+        finally:
+            self.release(entry, posts=posts)
+
+    def _reap_idle(self):
+        """오래 안 쓴 브라우저 종료 (백그라운드 스레드)"""
+        while not self._closed:
+            time.sleep(min(30, self.idle_timeout))
+            now = time.time()
+            for entry in self.entries:
+                with self._condition:
+                    if entry.in_use or not entry.running or now - entry.last_used < self.idle_timeout:
+                        continue
+                    entry.in_use = True
+                self._emit(f"💤 [{entry.name}] {self.idle_timeout}초 동안 사용 안 함 - 브라우저 종료")
+                self._stop(entry)
+                with self._condition:
+                    entry.in_use = False
+                    self._condition.notify()
+
+    def run(self, urls):
+        """
+        URL 목록을 계정들에 나눠서 동시에 처리
+
+        Args:
+            urls: 쇼핑 URL 리스트
+
+        Returns:
+            list: URL별 결과 dict 리스트 (입력 순서) [{
+                'url', 'success', 'message', 'elapsed', 'account'
+            }]
+        """
+        def work(url):
+            started = time.time()
+            entry = self.acquire()
+            if entry is None:
+                return {'url': url, 'success': False, 'message': "브라우저 준비 실패",
+                        'elapsed': round(time.time() - started, 1), 'account': None}
+            success = False
+            try:
+                success, message = entry.bot.process_url(url, progress=self._emit)
+            except Exception as e:
+                message = f"오류 발생: {str(e)}"
+            finally:
+                self.release(entry, posts=1 if success else 0)
+
+            result = {'url': url, 'success': success, 'message': message,
+                      'elapsed': round(time.time() - started, 1), 'account': entry.name}
+            mark = "✅" if success else "❌"
+            self._emit(f"{mark} [{entry.name}] {url} → {message} ({result['elapsed']}초)")
+            return result
+
+        with ThreadPoolExecutor(max_workers=len(self.entries), thread_name_prefix='browser-pool') as executor:
+            results = list(executor.map(work, urls))
+
+        succeeded = sum(1 for r in results if r['success'])
+        self._emit(f"\n📊 풀 작업 완료: 성공 {succeeded}개 / 실패 {len(results) - succeeded}개")
+        for report in (TimingRecorder.shared().report(), TokenUsage.shared().report()):
+            if report:
+                self._emit(report)
+        return results
+
+    def stats(self):
+        """
+        브라우저별 상태
+
+        Returns:
+            list: [{'account', 'running', 'in_use', 'posts', 'uptime'}]
+        """
+        now = time.time()
+        return [{
+            'account': e.name,
+            'running': e.running,
+            'in_use': e.in_use,
+            'posts': e.posts,
+            'uptime': round(now - e.started_at, 1) if e.running and e.started_at else 0.0
+        } for e in self.entries]
+
+    def shutdown(self):
+        """모든 브라우저 종료"""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        for entry in self.entries:
+            self._stop(entry)
+        self._emit("🛑 브라우저 풀 종료")
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.shutdown()
+        return False
@@ -0,0 +1,209 @@
+"""
+DOM 스냅샷 모듈
+- execute_script 1회로 상품 페이지에서 필요한 정보를 JSON으로 한 번에 가져옴
+  (상품명/가격 후보, 상세 설명 텍스트, 대표/썸네일/상세 이미지 정보)
+- 셀렉터별 find_elements + 요소별 .text/get_attribute 왕복 수십 번 → 1번
+- 필터링은 모두 파이썬에서 처리 (기존 셀렉터 방식과 같은 규칙)
+"""
+
+import re
+
+from .image_selection import COLLECT_IMAGES_JS, DETAIL_IMAGE_SELECTORS, normalize_image_url, select_detail_images
+
+
+TITLE_SELECTORS = [
+    'h3.YbkZ4Jg2_z',    # 초기 버전
+    'h3.DCVBehA8ZB',    # 변경 후 버전
+]
+
+PRICE_SELECTORS = [
+    'span.xMK43',
+    'span._1LY7DqCnwR',
+    '.price',
+    '[class*="price"]'
+]
+
+DESCRIPTION_SELECTORS = [
+    'div.se-main-container',   # 상세정보 메인 영역
+    'div.se-viewer',            # 백업
+    'div.nKuwJ',
+    'div._3cWR_0Clkt',
+]
+
+MAIN_IMAGE_SELECTORS = [
+    'img.TgO1N1wWTm[alt="대표이미지"]',
+    'img.TgO1N1wWTm',
+    'div._2LuLme7XCi img',
+    'div.image_viewer img',
+    'img[alt="대표이미지"]',
+]
+
+THUMBNAIL_SELECTOR = 'li.AIvsO_QzbN a'
+
+DESCRIPTION_EXCLUDE_KEYWORDS = ['상품정보 제공고시', '배송', '반품', '교환', '문의', '결제', '주문']
+
+# arguments[0]: 셀렉터 설정 dict → 스냅샷 dict
+SNAPSHOT_JS = """
+var config = arguments[0];
+var collectImages = function() {
+""" + COLLECT_IMAGES_JS + """
+};
+var texts = function(selectors, limit, maxLength) {
+    var result = [];
+    for (var s = 0; s < selectors.length; s++) {
+        var nodes = document.querySelectorAll(selectors[s]);
+        var items = [];
+        for (var i = 0; i < nodes.length && i < limit; i++) {
+            items.push((nodes[i].innerText || '').substring(0, maxLength));
+        }
+        result.push(items);
+    }
+    return result;
+};
+var firstSrc = function(selectors) {
+    var result = [];
+    for (var s = 0; s < selectors.length; s++) {
+        var node = document.querySelector(selectors[s]);
+        result.push(node ? (node.currentSrc || node.src || '') : '');
+    }
+    return result;
+};
+var thumbnails = [];
+var links = document.querySelectorAll(config.thumbnail);
+for (var t = 0; t < links.length; t++) {
+    var img = links[t].querySelector('img');
+    thumbnails.push(img ? (img.currentSrc || img.src || '') : '');
+}
+return {
+    url: location.href,
+    titles: texts(config.title, 20, 500),
+    prices: texts(config.price, 50, 100),
+    descriptions: texts(config.description, 20, 5000),
+    main_images: firstSrc(config.main_image),
+    thumbnails: thumbnails,
+    detail_images: collectImages(config.detail_image)
+};
+"""
+
+
+class DomSnapshot:
+    """상품 페이지 DOM 스냅샷 (1회 호출로 수집, 파이썬에서 필터링)"""
+
+    def __init__(self, data):
+        """
+        초기화
+
+        Args:
+            data: SNAPSHOT_JS 실행 결과 dict
+        """
+        self.data = data or {}
+
+    @classmethod
+    def capture(cls, driver, title_selectors=None, price_selectors=None, description_selectors=None,
+                main_image_selectors=None, thumbnail_selector=None, detail_image_selectors=None):
+        """
+        현재 페이지 스냅샷 수집 (execute_script 1회)
+
+        Args:
+            driver: Selenium WebDriver
+            *_selectors: 항목별 셀렉터 리스트 (기본값: 모듈 상단 상수)
+
+        Returns:
+            DomSnapshot: 스냅샷
+        """
+        config = {
+            'title': title_selectors or TITLE_SELECTORS,
+            'price': price_selectors or PRICE_SELECTORS,
+            'description': description_selectors or DESCRIPTION_SELECTORS,
+            'main_image': main_image_selectors or MAIN_IMAGE_SELECTORS,
+            'thumbnail': thumbnail_selector or THUMBNAIL_SELECTOR,
+            'detail_image': detail_image_selectors or DETAIL_IMAGE_SELECTORS,
+        }
+        data = driver.execute_script(SNAPSHOT_JS, config)
+        if not isinstance(data, dict):
+            raise ValueError("스냅샷 결과가 올바르지 않습니다")
+        return cls(data)
+
+    def title(self):
+        """제품명 (없으면 None)"""
+        for items in self.data.get('titles', []):
+            for text in items:
+                title = (text or '').strip()
+                if title and len(title) > 3:
+                    # [히든딜], [커넥트 히든딜] 등 대괄호 패턴 제거
+                    return re.sub(r'^\[.*?\]\s*', '', title)
+        return None
+
+    def price(self):
+        """가격 (없으면 None)"""
+        for items in self.data.get('prices', []):
+            for text in items:
+                price = (text or '').strip()
+                if price and ('원' in price or ',' in price):
+                    return price
+        return None
+
+    def description(self, max_length=500, exclude_keywords=None):
+        """
+        상세 설명 텍스트 (없으면 None)
+
+        Args:
+            max_length: 최대 글자 수
+            exclude_keywords: 이 단어가 들어간 블록은 제외 (기본: 배송/반품 등)
+        """
+        exclude_keywords = exclude_keywords or DESCRIPTION_EXCLUDE_KEYWORDS
+        parts = []
+
+        for items in self.data.get('descriptions', []):
+            for text in items:
+                text = (text or '').strip()
+                if text and len(text) > 10 and not any(keyword in text for keyword in exclude_keywords):
+                    parts.append(text)
+                    if len(' '.join(parts)) > max_length:
+                        break
+            if len(' '.join(parts)) > max_length:
+                break
+
+        if parts:
+            return ' '.join(parts)[:max_length]
+        return None
+
+    def thumbnail_count(self):
+        """썸네일 개수"""
+        return len(self.data.get('thumbnails', []))
+
+    def product_images(self, max_images=6):
+        """
+        대표 이미지 URL 리스트
+        썸네일 이미지 주소를 고화질(?type=f640)로 바꿔서 사용 (썸네일 클릭 불필요)
+        썸네일 주소를 쓸 수 없으면 현재 메인 이미지 1개
+
+        Args:
+            max_images: 최대 개수
+
+        Returns:
+            list: 이미지 URL 리스트 (없으면 빈 리스트 → 셀렉터 방식으로 대체)
+        """
+        image_urls = []
+        for src in self.data.get('thumbnails', []):
+            # 원본 주소로 바꿀 수 있는 이미지 서버 주소만 사용
+            if not src or not src.startswith('http') or '?type=' not in src:
+                continue
+            src = normalize_image_url(src)
+            if src not in image_urls:
+                image_urls.append(src)
+                if len(image_urls) >= max_images:
+                    break
+
+        # 썸네일은 있는데 주소를 못 쓰면 클릭 방식으로 대체하도록 빈 리스트 반환
+        if image_urls or self.thumbnail_count():
+            return image_urls
+
+        for src in self.data.get('main_images', []):
+            if src and src.startswith('http'):
+                return [normalize_image_url(src)]
+        return []
+
+    def detail_images(self, limit=10, max_candidates=30):
+        """상세 이미지 URL 리스트 (점수 기반 선택, image_selection 참고)"""
+        return select_detail_images(self.data.get('detail_images', []), limit=limit, max_candidates=max_candidates)
@@ -0,0 +1,244 @@
+"""
+에디터 HTML 삽입 모듈
+- 문단 + 강조(굵게/색상/크기/배경)를 HTML 한 덩어리로 만들어 스크립트 1회로 붙여넣기
+  (조각마다 클립보드 복사 + Ctrl+V + 툴바 클릭 수십 번 → 1번)
+- 에디터가 붙여넣기를 받았는지 본문 텍스트로 확인
+- 실패하면 False 반환 → 호출하는 쪽에서 기존 키 입력 방식으로 대체
+- select_text: 이미 입력된 본문에서 키워드 선택 (스트리밍 입력 후 강조 적용용)
+"""
+
+import re
+from html import escape
+
+
+# 강조 스타일 → (태그 리스트, 색상 종류)
+STYLE_TAGS = {
+    'bold': (['b'], None),
+    'italic': (['i'], None),
+    'underline': (['u'], None),
+    'font_color': ([], 'font'),
+    'bg_color': ([], 'bg'),
+    'font_size': ([], None),
+    'bold_font': (['b'], 'font'),
+    'bold_bg': (['b'], 'bg'),
+}
+
+FONT_SIZE = '19px'  # 툴바 fs19와 같은 크기
+
+# 본문 영역 (붙여넣기 확인용)
+EDITOR_CONTENT_SELECTORS = ['.se-components-wrap', '.se-content']
+
+# arguments[0]: HTML, arguments[1]: 일반 텍스트
+# 포커스된 입력 요소(iframe 안 입력 버퍼 포함)에 paste 이벤트 전달 → 에디터가 처리했는지 반환
+PASTE_JS = """
+var target = document.activeElement;
+while (target && target.tagName === 'IFRAME' && target.contentDocument) {
+    target = target.contentDocument.activeElement;
+}
+if (!target || target === document.body) {
+    var selection = window.getSelection();
+    var node = selection && selection.anchorNode;
+    target = node ? (node.nodeType === 1 ? node : node.parentElement) : null;
+}
+if (!target) return null;
+var data = new DataTransfer();
+data.setData('text/html', arguments[0]);
+data.setData('text/plain', arguments[1]);
+var event = new ClipboardEvent('paste', {clipboardData: data, bubbles: true, cancelable: true});
+target.dispatchEvent(event);
+return event.defaultPrevented;
+"""
+
+EDITOR_TEXT_JS = """
+var selectors = arguments[0];
+for (var i = 0; i < selectors.length; i++) {
+    var node = document.querySelector(selectors[i]);
+    if (node) return (node.innerText || '').replace(/\\u00a0/g, ' ');
+}
+return '';
+"""
+
+# arguments[0]: 찾을 텍스트 → 본문(제목 영역 제외)에서 처음 나오는 위치를 선택, 찾으면 true
+SELECT_TEXT_JS = """
+var keyword = arguments[0];
+var found = false;
+
+function findAndSelect(node) {
+    if (found) return;
+
+    if (node.nodeType === 3) {  // 텍스트 노드
+        var index = node.textContent.indexOf(keyword);
+        if (index >= 0) {
+            var range = document.createRange();
+            range.setStart(node, index);
+            range.setEnd(node, index + keyword.length);
+
+            var selection = window.getSelection();
+            selection.removeAllRanges();
+            selection.addRange(range);
+
+            found = true;
+            return;
+        }
+    } else {
+        for (var i = 0; i < node.childNodes.length; i++) {
+            findAndSelect(node.childNodes[i]);
+            if (found) return;
+        }
+    }
+}
+
+// 본문 에디터 영역들 (첫 번째 제목 영역은 건너뜀)
+var editors = document.querySelectorAll('.se-component-content');
+for (var e = 0; e < editors.length && !found; e++) {
+    if (editors[e].querySelector('.se-title-text')) continue;
+    findAndSelect(editors[e]);
+}
+return found;
+"""
+
+
+def select_text(driver, text):
+    """
+    본문에서 텍스트를 찾아 선택 (툴바 버튼으로 스타일을 나중에 적용할 때)
+
+    Args:
+        driver: Selenium WebDriver
+        text: 찾을 텍스트
+
+    Returns:
+        bool: 찾아서 선택했으면 True
+    """
+    try:
+        return bool(driver.execute_script(SELECT_TEXT_JS, text))
+    except Exception:
+        return False
+
+
+def _normalize(text):
+    """공백 정리 (확인용 비교)"""
+    return re.sub(r'\s+', ' ', text or '').strip()
+
+
+def _styled(fragment, style, pick_color=None):
+    """강조 조각 1개 → HTML"""
+    tags, color_type = STYLE_TAGS.get(style, (['b'], None))
+    html = escape(fragment)
+
+    css = []
+    if color_type and pick_color:
+        color = pick_color(color_type)
+        css.append(f"color:{color}" if color_type == 'font' else f"background-color:{color}")
+    if style == 'font_size':
+        css.append(f"font-size:{FONT_SIZE}")
+    if css:
+        html = f'<span style="{";".join(css)}">{html}</span>'
+
+    for tag in reversed(tags):
+        html = f"<{tag}>{html}</{tag}>"
+    return html
+
+
+def build_section_html(text, positions=None, pick_color=None):
+    """
+    섹션 텍스트 + 강조 위치 → 붙여넣기용 HTML
+
+    Args:
+        text: 문단 텍스트 (줄바꿈 = 문단 구분)
+        positions: [{'start', 'end', 'style'}] (start 순서, 겹치지 않음)
+        pick_color: 색상 선택 함수 (color_type: 'font' / 'bg' → '#rrggbb')
+
+    Returns:
+        str: <p> 문단들로 된 HTML (빈 줄은 <p><br></p>)
+    """
+    positions = positions or []
+    paragraphs = []
+    offset = 0
+    for line in text.split('\n'):
+        line_end = offset + len(line)
+        if not line.strip():
+            paragraphs.append("<p><br></p>")
+        else:
+            # 이 줄에 걸친 강조 위치만 줄 기준으로 잘라서 적용
+            pieces = []
+            last = offset
+            for pos in positions:
+                start, end = max(pos['start'], last), min(pos['end'], line_end)
+                if start >= end:
+                    continue
+                pieces.append(escape(text[last:start]))
+                pieces.append(_styled(text[start:end], pos.get('style', 'bold'), pick_color))
+                last = end
+            pieces.append(escape(text[last:line_end]))
+            paragraphs.append(f"<p>{''.join(pieces)}</p>")
+        offset = line_end + 1
+    return ''.join(paragraphs)
+
+
+class EditorInjector:
+    """스마트에디터에 HTML을 한 번에 붙여넣는 클래스"""
+
+    def __init__(self, driver, waits, confirm_timeout=3):
+        """
+        초기화
+
+        Args:
+            driver: Selenium WebDriver
+            waits: Waits (붙여넣기 반영 확인용)
+            confirm_timeout: 반영 확인 최대 대기 시간(초)
+        """
+        self.driver = driver
+        self.waits = waits
+        self.confirm_timeout = confirm_timeout
+        self.enabled = True
+
+    def insert_section(self, text, positions=None, pick_color=None):
+        """
+        섹션 1개를 HTML로 붙여넣기 (현재 커서 위치)
+
+        Args:
+            text: 문단 텍스트
+            positions: 강조 위치 리스트 (build_section_html 참고)
+            pick_color: 색상 선택 함수
+
+        Returns:
+            bool: 성공 여부 (False면 키 입력 방식으로 대체 - 본문이 전혀 바뀌지 않았을 때만 False)
+        """
+        if not self.enabled or not text.strip():
+            return False
+
+        try:
+            probe = _normalize(text.strip().split('\n')[-1])[-30:]
+            before_text = self._editor_text()
+            before = before_text.count(probe)
+
+            html = build_section_html(text, positions, pick_color)
+            handled = self.driver.execute_script(PASTE_JS, html, text)
+            if handled is None:
+                print(f"         ⚠️ HTML 삽입: 입력 위치를 찾지 못함")
+                return False
+
+            # 에디터가 처리했으면 반영될 때까지, 아니면 짧게만 확인
+            timeout = self.confirm_timeout if handled else 0.5
+            if self.waits.until(lambda: self._editor_text().count(probe) > before, timeout):
+                return True
+
+            # 에디터가 처리했는데 확인 문구가 안 보이면 본문이 바뀌었는지 다시 확인
+            # (에디터가 공백/기호를 바꿔서 넣었을 수 있음 - 여기서 키 입력으로 또 넣으면 같은 글이 두 번 들어감)
+            if handled and self._editor_text() != before_text:
+                print(f"         ⚠️ HTML 삽입 확인 문구는 못 찾았지만 본문이 바뀜 - 삽입된 것으로 처리")
+                return True
+
+            # 다음 섹션부터는 바로 키 입력 방식 사용 (같은 실패 반복 방지)
+            print(f"         ⚠️ HTML 삽입이 반영되지 않음 - 키 입력 방식으로 전환")
+            self.enabled = False
+            return False
+
+        except Exception as e:
+            print(f"         ⚠️ HTML 삽입 실패: {e}")
+            self.enabled = False
+            return False
+
+    def _editor_text(self):
+        """본문 영역 텍스트 (공백 정리)"""
+        return _normalize(self.driver.execute_script(EDITOR_TEXT_JS, EDITOR_CONTENT_SELECTORS))
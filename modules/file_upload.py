@@ -0,0 +1,114 @@
+"""
+에디터 이미지 업로드 모듈 (OS 공통)
+- CDP Page.setInterceptFileChooserDialog로 파일 선택 창이 아예 뜨지 않게 막고
+  에디터의 file input에 경로를 바로 넣음 (send_keys → DOM.setFileInputFiles)
+- Windows 창 제어(win32gui) 없이 동작 → 리눅스 서버/헤드리스 모드에서도 업로드 가능
+- CDP를 못 쓰는 드라이버면 기존처럼 열린 "열기" 창을 닫음 (Windows + pywin32가 있을 때만)
+"""
+
+from selenium.webdriver.common.by import By
+
+try:
+    import win32gui
+    import win32con
+except ImportError:  # 리눅스/맥 또는 pywin32 미설치
+    win32gui = None
+    win32con = None
+
+
+class EditorImageUploader:
+    """스마트에디터 사진 버튼으로 이미지 업로드"""
+
+    PHOTO_BUTTON_SELECTOR = "button[data-name='image']"
+
+    def __init__(self, driver, waits):
+        """
+        초기화
+
+        Args:
+            driver: Selenium WebDriver
+            waits: Waits
+        """
+        self.driver = driver
+        self.waits = waits
+
+    def upload(self, image_files):
+        """
+        이미지 파일을 에디터에 업로드 (업로드 완료 대기는 호출하는 쪽에서)
+
+        Args:
+            image_files: 이미지 파일 절대 경로 리스트
+
+        Returns:
+            bool: 파일 전달 성공 여부
+        """
+        intercepted = self._set_intercept(True)
+        try:
+            photo_btn = self.driver.find_element(By.CSS_SELECTOR, self.PHOTO_BUTTON_SELECTOR)
+            photo_btn.click()
+
+            file_input = self._find_file_input()
+            if not file_input:
+                print(f"      ⚠️ 파일 입력창을 찾지 못함")
+                return False
+
+            # 여러 파일은 줄바꿈으로 구분
+            file_input.send_keys('\n'.join(image_files))
+
+            if not intercepted:
+                self._close_native_dialog()
+            return True
+
+        finally:
+            if intercepted:
+                self._set_intercept(False)
+
+    def _find_file_input(self):
+        """이미지용 file input (나타날 때까지 대기)"""
+        file_inputs = self.waits.until(
+            lambda: self.driver.find_elements(By.CSS_SELECTOR, "input[type='file']"), 10, "파일 입력창"
+        ) or []
+
+        for inp in file_inputs:
+            try:
+                accept = inp.get_attribute('accept')
+                if accept and 'image' in accept:
+                    return inp
+            except Exception:
+                pass
+
+        return file_inputs[0] if file_inputs else None
+
+    def _set_intercept(self, enabled):
+        """파일 선택 창 가로채기 켜기/끄기 (CDP 지원 여부 반환)"""
+        if not hasattr(self.driver, 'execute_cdp_cmd'):
+            return False
+        try:
+            self.driver.execute_cdp_cmd('Page.setInterceptFileChooserDialog', {'enabled': enabled})
+            return True
+        except Exception as e:
+            if enabled:
+                print(f"      ⚠️ 파일 선택 창 가로채기 실패: {e}")
+            return False
+
+    def _close_native_dialog(self):
+        """열린 "열기" 창 닫기 (Windows 전용, 그 외에는 아무것도 안 함)"""
+        if win32gui is None:
+            return
+
+        def find_window_by_title(title_part):
+            def callback(hwnd, windows):
+                if win32gui.IsWindowVisible(hwnd):
+                    window_title = win32gui.GetWindowText(hwnd)
+                    if title_part in window_title:
+                        windows.append(hwnd)
+                return True
+
+            windows = []
+            win32gui.EnumWindows(callback, windows)
+            return windows[0] if windows else None
+
+        hwnd = self.waits.until(lambda: find_window_by_title("열기"), timeout=5)
+        if hwnd:
+            # WM_CLOSE 메시지로 창 닫기
+            win32gui.PostMessage(hwnd, win32con.WM_CLOSE, 0, 0)
@@ -0,0 +1,204 @@
+"""
+Gemini 클라이언트 모듈
+- API 키마다 클라이언트 1개를 프로세스 전체에서 공유 (GeminiClient.shared)
+- 모델 객체는 이름별로 처음 쓸 때 1번만 만들고 계속 재사용 (연결도 재사용)
+- genai.configure / GenerativeModel 생성 / google.generativeai import를 매 호출마다 반복하지 않음
+- 모든 호출에 API 키별 요청 수 제한, 지터 백오프 재시도, 호출 마감 시간, 모델별 서킷 브레이커 적용
+"""
+
+import time
+import threading
+from concurrent.futures import CancelledError
+
+from .rate_limit import CircuitBreaker, TokenBucket, backoff_delay, is_quota_error, is_transient_error
+
+
+DEFAULT_MODEL = 'gemini-2.5-pro'
+
+_genai = None
+_import_lock = threading.Lock()
+
+
+def _load_genai():
+    """google.generativeai 지연 import (처음 1번만)"""
+    global _genai
+    with _import_lock:
+        if _genai is None:
+            import google.generativeai as genai
+            _genai = genai
+        return _genai
+
+
+class GeminiClient:
+    """API 키 1개에 대한 Gemini 클라이언트 (모델 객체 캐시)"""
+
+    _clients = {}
+    _clients_lock = threading.Lock()
+
+    # genai.configure는 프로세스 전역 설정이라 키를 바꿔가며 모델을 만들 때는 한 번에 하나씩
+    _configure_lock = threading.Lock()
+
+    REQUESTS_PER_MINUTE = 60   # API 키별 분당 요청 수 (set_rate_limit으로 할당량에 맞게 변경)
+    MAX_RETRIES = 3            # 일시적 오류(429/503/시간 초과) 재시도 횟수
+    CALL_TIMEOUT = 180         # 마감 시간을 안 주면 호출 1건(재시도 포함) 제한 시간(초)
+
+    def __init__(self, api_key):
+        """
+        초기화 (직접 만들기보다 GeminiClient.shared(api_key) 사용)
+
+        Args:
+            api_key: Gemini API 키
+        """
+        self.api_key = api_key
+        self._models = {}
+        self._lock = threading.Lock()
+        self.limiter = TokenBucket(self.REQUESTS_PER_MINUTE)
+        self._breakers = {}
+
+    @classmethod
+    def shared(cls, api_key):
+        """
+        API 키별 공유 클라이언트
+
+        Args:
+            api_key: Gemini API 키
+
+        Returns:
+            GeminiClient: 같은 키면 항상 같은 인스턴스
+        """
+        with cls._clients_lock:
+            client = cls._clients.get(api_key)
+            if client is None:
+                client = cls(api_key)
+                cls._clients[api_key] = client
+            return client
+
+    def model(self, name=DEFAULT_MODEL):
+        """
+        모델 객체 (이름별로 1번만 생성)
+
+        Args:
+            name: 모델 이름 (예: 'gemini-2.5-pro', 'gemini-2.5-flash')
+
+        Returns:
+            genai.GenerativeModel: 캐시된 모델
+        """
+        model = self._models.get(name)
+        if model is not None:
+            return model
+
+        with self._lock:
+            model = self._models.get(name)
+            if model is None:
+                model = self._create_model(name)
+                self._models[name] = model
+            return model
+
+    def _create_model(self, name):
+        """이 키로 설정된 모델 생성"""
+        genai = _load_genai()
+        with self._configure_lock:
+            genai.configure(api_key=self.api_key)
+            model = genai.GenerativeModel(name)
+            # 모델이 지금 설정(이 키)의 API 클라이언트를 붙잡아 두도록 바로 연결
+            # (나중에 다른 키로 configure해도 이 모델은 이 키를 계속 사용)
+            try:
+                from google.generativeai import client as genai_client
+                if getattr(model, '_client', None) is None:
+                    model._client = genai_client.get_default_generative_client()
+            except Exception:
+                pass
+        return model
+
+    def set_rate_limit(self, per_minute, burst=None):
+        """
+        이 키의 분당 요청 수 제한 변경 (Gemini 할당량에 맞춰 설정하면 429 없이 최대 속도)
+
+        Args:
+            per_minute: 분당 요청 수
+            burst: 한 번에 몰아서 보낼 수 있는 요청 수 (선택)
+        """
+        self.limiter.configure(per_minute, burst)
+
+    def breaker(self, model=DEFAULT_MODEL):
+        """모델별 서킷 브레이커 (연속 실패 시 잠시 차단)"""
+        with self._lock:
+            breaker = self._breakers.get(model)
+            if breaker is None:
+                breaker = CircuitBreaker()
+                self._breakers[model] = breaker
+            return breaker
+
+    def generate(self, contents, model=DEFAULT_MODEL, deadline=None, max_retries=None, cancel_event=None,
+                 **kwargs):
+        """
+        콘텐츠 생성 (요청 수 제한 + 일시적 오류 재시도 + 마감 시간 + 서킷 브레이커)
+
+        Args:
+            contents: 프롬프트 문자열 또는 [프롬프트, 이미지...] 리스트
+            model: 모델 이름
+            deadline: 마감 시각 (time.time() 기준, 재시도 포함, 기본: 지금 + CALL_TIMEOUT)
+            max_retries: 일시적 오류 재시도 횟수 (기본: MAX_RETRIES)
+            cancel_event: 설정되면 더 이상 요청/재시도하지 않음 (헤지 요청에서 진 쪽, 선택)
+            **kwargs: generate_content 옵션 (generation_config 등)
+
+        Returns:
+            GenerateContentResponse: 응답
+
+        Raises:
+            CircuitOpenError: 이 모델이 연속 실패로 차단 중
+            TimeoutError: 마감 시간 안에 요청하지/끝내지 못함
+            CancelledError: cancel_event로 취소됨
+        """
+        deadline = deadline or time.time() + self.CALL_TIMEOUT
+        max_retries = self.MAX_RETRIES if max_retries is None else max_retries
+        breaker = self.breaker(model)
+        generative_model = self.model(model)
+
+        attempt = 0
+        while True:
+            if cancel_event is not None and cancel_event.is_set():
+                raise CancelledError(f"{model} 요청 취소")
+            breaker.before_call()
+            remaining = deadline - time.time()
+            if remaining <= 0 or not self.limiter.acquire(timeout=remaining):
+                breaker.release()  # 모델 잘못이 아니므로 시험 요청 자리만 반납
+                raise TimeoutError(f"{model} 호출 마감 시간 초과")
+
+            # 요청 자체도 남은 시간 안에서만 기다림
+            options = dict(kwargs.get('request_options') or {})
+            remaining = max(1.0, deadline - time.time())
+            options['timeout'] = min(options.get('timeout', remaining), remaining)
+            try:
+                response = generative_model.generate_content(contents, **dict(kwargs, request_options=options))
+            except Exception as e:
+                if not is_transient_error(e):
+                    breaker.record_success()  # 요청 내용 문제(400 등) → 모델은 정상 응답 중
+                    raise
+                breaker.record_failure()
+                if is_quota_error(e):
+                    self.limiter.drain()  # 같은 키를 쓰는 다른 스레드도 잠시 쉬도록
+
+                delay = backoff_delay(attempt)
+                if attempt >= max_retries or time.time() + delay >= deadline:
+                    raise
+                attempt += 1
+                print(f"   ⚠️ {model} 일시 오류 ({type(e).__name__}), {delay:.1f}초 후 재시도 ({attempt}/{max_retries})")
+                if cancel_event is not None:
+                    cancel_event.wait(delay)
+                else:
+                    time.sleep(delay)
+                continue
+
+            breaker.record_success()
+            return response
+
+    @staticmethod
+    def generation_config(**kwargs):
+        """
+        생성 옵션 (genai.GenerationConfig)
+
+        Args:
+            **kwargs: temperature, top_p 등
+        """
+        return _load_genai().GenerationConfig(**kwargs)
@@ -0,0 +1,331 @@
+"""
+HTTP 상품 정보 추출 모듈 (브라우저 없이)
+- naver.me 짧은 URL은 HTTP 리다이렉트로 바로 해석
+- 상품 페이지 HTML에 포함된 __PRELOADED_STATE__ JSON과 메타 태그를 직접 파싱
+- 실패하면 None 반환 → 호출하는 쪽에서 Selenium 방식으로 대체
+- parse_html()은 네트워크 없이 동작 (저장해 둔 HTML로 확인 가능)
+"""
+
+import re
+import json
+from html.parser import HTMLParser
+
+import requests
+
+from .ai_cache import product_id_from_url
+from .dom_snapshot import DESCRIPTION_EXCLUDE_KEYWORDS
+from .image_selection import normalize_image_url, select_detail_images
+
+
+USER_AGENT = ('Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
+              '(KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36')
+
+STATE_PATTERN = re.compile(r'window\.__PRELOADED_STATE__\s*=\s*')
+
+
+class _MetaParser(HTMLParser):
+    """<meta property/name=... content=...> 수집"""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.meta = {}
+
+    def handle_starttag(self, tag, attrs):
+        if tag != 'meta':
+            return
+        attrs = dict(attrs)
+        key = attrs.get('property') or attrs.get('name')
+        if key and attrs.get('content') and key not in self.meta:
+            self.meta[key] = attrs['content']
+
+
+class _DetailParser(HTMLParser):
+    """상세 설명 HTML에서 문단 텍스트와 이미지 정보 수집"""
+
+    BLOCK_TAGS = {'p', 'div', 'li', 'br', 'h1', 'h2', 'h3', 'h4', 'tr', 'section'}
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.blocks = []
+        self.images = []
+        self._buffer = []
+        self._skip = 0
+
+    def _flush(self):
+        text = re.sub(r'\s+', ' ', ''.join(self._buffer)).strip()
+        if text:
+            self.blocks.append(text)
+        self._buffer = []
+
+    def handle_starttag(self, tag, attrs):
+        if tag in ('script', 'style'):
+            self._skip += 1
+            return
+        if tag in self.BLOCK_TAGS:
+            self._flush()
+        if tag == 'img':
+            attrs = dict(attrs)
+            src = attrs.get('data-src') or attrs.get('src') or ''
+            self.images.append({
+                'src': src,
+                'attr_width': _to_int(attrs.get('width')),
+                'attr_height': _to_int(attrs.get('height')),
+                'order': len(self.images),
+                'selector': 0
+            })
+
+    def handle_endtag(self, tag):
+        if tag in ('script', 'style'):
+            self._skip = max(0, self._skip - 1)
+            return
+        if tag in self.BLOCK_TAGS:
+            self._flush()
+
+    def handle_data(self, data):
+        if not self._skip:
+            self._buffer.append(data)
+
+    def close(self):
+        super().close()
+        self._flush()
+
+
+def _to_int(value):
+    """'860px' 같은 값 → 정수 (실패 시 0)"""
+    try:
+        return int(str(value).replace('px', '').strip())
+    except (TypeError, ValueError):
+        return 0
+
+
+def _format_price(value):
+    """숫자 가격 → '12,900원'"""
+    try:
+        return f"{int(value):,}원"
+    except (TypeError, ValueError):
+        return None
+
+
+class HttpProductExtractor:
+    """브라우저 없이 HTTP 요청 + HTML 파싱으로 상품 정보를 가져오는 클래스"""
+
+    def __init__(self, session=None, timeout=10):
+        """
+        초기화
+
+        Args:
+            session: requests.Session (없으면 새로 생성)
+            timeout: 요청 타임아웃(초)
+        """
+        self.timeout = timeout
+        self.session = session or requests.Session()
+        self.session.headers.setdefault('User-Agent', USER_AGENT)
+        self.session.headers.setdefault('Accept-Language', 'ko-KR,ko;q=0.9')
+
+    def fetch(self, shopping_url):
+        """
+        페이지 요청 (naver.me 리다이렉트 포함)
+
+        Args:
+            shopping_url: 쇼핑 URL
+
+        Returns:
+            tuple: (최종 URL, HTML) - 실패 시 (None, None)
+        """
+        response = self.session.get(shopping_url, timeout=self.timeout, allow_redirects=True)
+        if response.status_code != 200:
+            print(f"   ⚠️ HTTP 응답 코드 {response.status_code}")
+            return None, None
+        if not response.encoding or response.encoding.lower() == 'iso-8859-1':
+            response.encoding = 'utf-8'
+        return response.url, response.text
+
+    def extract(self, shopping_url):
+        """
+        쇼핑 URL에서 제품 정보 추출 (브라우저 없이)
+
+        Args:
+            shopping_url: 네이버 쇼핑 URL
+
+        Returns:
+            dict: ProductExtractor와 같은 형식 (실패 시 None)
+        """
+        print(f"   ⚡ HTTP 방식으로 제품 정보 추출 시도...")
+
+        try:
+            final_url, html = self.fetch(shopping_url)
+            if not html:
+                return None
+            if final_url != shopping_url:
+                print(f"   ✅ 리다이렉트: {final_url}")
+
+            product_info = self.parse_html(html, link=shopping_url, url=final_url)
+            if not product_info:
+                print(f"   ⚠️ HTML에서 제품 정보를 찾지 못함 (캡차/차단 페이지일 수 있음)")
+                return None
+
+            print(f"   ✅ HTTP 방식 추출 성공")
+            return product_info
+
+        except Exception as e:
+            print(f"   ⚠️ HTTP 방식 추출 실패: {e}")
+            return None
+
+    @classmethod
+    def parse_html(cls, html, link=None, url=None, max_images=6, detail_limit=10, max_detail_candidates=30):
+        """
+        상품 페이지 HTML 파싱 (네트워크 사용 안 함)
+
+        Args:
+            html: 상품 페이지 HTML
+            link: 결과에 넣을 원본 URL
+            url: 리다이렉트된 최종 URL (상품 번호 추출용, 선택)
+            max_images: 대표 이미지 최대 개수
+            detail_limit: 상세 이미지 우선 사용 개수
+            max_detail_candidates: 상세 이미지 후보 최대 개수
+
+        Returns:
+            dict: {'title', 'price', 'description', 'images', 'detail_images', 'link', 'product_id'}
+                  상품 페이지가 아니거나 상품명/대표 이미지를 못 찾으면 None
+        """
+        meta_parser = _MetaParser()
+        meta_parser.feed(html)
+        meta = meta_parser.meta
+
+        product = cls._find_product(cls._load_state(html)) or {}
+
+        title = product.get('name') or product.get('productName')
+        if not title and meta.get('og:title'):
+            # og:title은 '상품명 : 스토어명' 형식
+            title = re.sub(r'\s*:\s*[^:]+$', '', meta['og:title'])
+        if title:
+            # [히든딜], [커넥트 히든딜] 등 대괄호 패턴 제거
+            title = re.sub(r'^\[.*?\]\s*', '', title.strip())
+
+        price = cls._extract_price(product) or meta.get('product:price:amount')
+        if price and price.isdigit():
+            price = _format_price(price)
+
+        images = cls._extract_images(product, meta, max_images)
+
+        detail_html = cls._find_detail_html(product)
+        detail = _DetailParser()
+        if detail_html:
+            detail.feed(detail_html)
+            detail.close()
+
+        description = cls._build_description(detail.blocks) or meta.get('og:description') or ''
+        detail_images = select_detail_images(detail.images, limit=detail_limit,
+                                             max_candidates=max_detail_candidates)
+
+        # 상품 상태 JSON도 상품 메타 태그도 없으면 상품 페이지가 아님 (캡차/오류 페이지)
+        if not product and 'product:price:amount' not in meta:
+            return None
+        if not title or not images:
+            return None
+
+        return {
+            'title': title,
+            'price': price or "가격 정보 없음",
+            'description': description or "제품 설명을 찾을 수 없습니다",
+            'images': images,
+            'detail_images': detail_images,
+            'link': link,
+            'product_id': cls._extract_product_id(product, url or link)
+        }
+
+    @staticmethod
+    def _load_state(html):
+        """window.__PRELOADED_STATE__ = {...} JSON 읽기 (없으면 None)"""
+        match = STATE_PATTERN.search(html)
+        if not match:
+            return None
+        try:
+            state, _ = json.JSONDecoder().raw_decode(html, match.end())
+            return state
+        except ValueError:
+            return None
+
+    @classmethod
+    def _find_product(cls, node, depth=0):
+        """상태 JSON에서 상품 객체(name + 이미지 정보가 있는 dict) 찾기"""
+        if depth > 8 or node is None:
+            return None
+        if isinstance(node, dict):
+            if node.get('name') and ('productImages' in node or 'representativeImage' in node):
+                return node
+            for value in node.values():
+                found = cls._find_product(value, depth + 1)
+                if found:
+                    return found
+        elif isinstance(node, list):
+            for value in node[:50]:
+                found = cls._find_product(value, depth + 1)
+                if found:
+                    return found
+        return None
+
+    @staticmethod
+    def _extract_product_id(product, url):
+        """상품 번호 (URL의 /products/<번호> 우선, 없으면 상태 JSON의 id)"""
+        product_id = product_id_from_url(url)
+        if product_id:
+            return product_id
+        for value in (product.get('id'), product.get('channelProductNo')):
+            if value and str(value).isdigit():
+                return str(value)
+        return None
+
+    @staticmethod
+    def _extract_price(product):
+        """할인가 우선, 없으면 판매가"""
+        benefits = product.get('benefitsView') or {}
+        for value in (benefits.get('discountedSalePrice'), product.get('discountedSalePrice'),
+                      product.get('salePrice')):
+            if value:
+                return _format_price(value)
+        return None
+
+    @staticmethod
+    def _extract_images(product, meta, max_images):
+        """대표 이미지 URL (대표 → 추가 이미지 순, 없으면 og:image)"""
+        entries = list(product.get('productImages') or [])
+        representative = product.get('representativeImage')
+        if isinstance(representative, dict):
+            entries.insert(0, representative)
+
+        entries.sort(key=lambda e: 0 if e.get('imageType') == 'REPRESENTATIVE' else 1)
+
+        image_urls = []
+        for entry in entries:
+            src = entry.get('url') if isinstance(entry, dict) else entry
+            if not src or not str(src).startswith('http'):
+                continue
+            src = normalize_image_url(src)
+            if src not in image_urls:
+                image_urls.append(src)
+            if len(image_urls) >= max_images:
+                break
+
+        if not image_urls and meta.get('og:image'):
+            image_urls.append(normalize_image_url(meta['og:image']))
+        return image_urls
+
+    @staticmethod
+    def _find_detail_html(product):
+        """상세 설명 HTML (스마트에디터 본문)"""
+        contents = product.get('detailContents') or {}
+        if isinstance(contents, dict):
+            return contents.get('detailContentText') or contents.get('editorContent')
+        return None
+
+    @staticmethod
+    def _build_description(blocks, max_length=500):
+        """문단 중 배송/반품 등 안내문을 제외하고 max_length자까지 연결"""
+        parts = []
+        for text in blocks:
+            if len(text) > 10 and not any(keyword in text for keyword in DESCRIPTION_EXCLUDE_KEYWORDS):
+                parts.append(text)
+                if len(' '.join(parts)) > max_length:
+                    break
+        return ' '.join(parts)[:max_length] if parts else None
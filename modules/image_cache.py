@@ -0,0 +1,281 @@
+"""
+이미지 캐시 모듈
+- 이미지 URL(실제로 받는 URL 그대로, ?type= 크기별로 따로) → 콘텐츠 해시(sha256) 매핑
+- 같은 내용의 이미지는 한 번만 저장 (콘텐츠 주소 방식)
+- 조건부 요청(ETag / Last-Modified)으로 변경된 경우에만 재다운로드
+- 용량 제한 LRU 삭제
+- 스레드/프로세스 동시 접근 안전 (URL별 잠금 + 원자적 파일 교체)
+"""
+
+import os
+import json
+import time
+import shutil
+import hashlib
+import threading
+import tempfile
+
+from .utils import get_app_data_dir
+
+
+class ImageCache:
+    """다운로드한 상품 이미지를 앱 데이터 폴더에 보관하는 디스크 캐시"""
+
+    INDEX_FILE = 'index-v2.json'  # v1(index.json)은 ?type= 크기가 다른 URL을 한 키로 저장했으므로 사용 안 함
+    CHUNK_SIZE = 64 * 1024
+
+    _shared = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, cache_dir=None, max_bytes=500 * 1024 * 1024, revalidate_after=7 * 24 * 3600):
+        """
+        초기화
+
+        Args:
+            cache_dir: 캐시 폴더 (기본: ColdAPP 데이터 폴더/image_cache)
+            max_bytes: 캐시 최대 용량 (초과 시 오래 안 쓴 이미지부터 삭제)
+            revalidate_after: 이 시간(초) 안에 확인한 이미지는 서버에 묻지 않고 바로 사용
+        """
+        self.cache_dir = cache_dir or get_app_data_dir('image_cache')
+        self.blobs_dir = os.path.join(self.cache_dir, 'blobs')
+        self.index_path = os.path.join(self.cache_dir, self.INDEX_FILE)
+        self.max_bytes = max_bytes
+        self.revalidate_after = revalidate_after
+
+        os.makedirs(self.blobs_dir, exist_ok=True)
+
+        self._lock = threading.RLock()
+        self._url_locks = {}
+        self._removed = set()
+        self._index = self._load_index()
+
+    @classmethod
+    def shared(cls):
+        """
+        프로세스 전체에서 공유하는 기본 캐시
+
+        Returns:
+            ImageCache: 기본 설정 캐시 인스턴스
+        """
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    @staticmethod
+    def normalize_url(url):
+        """
+        캐시 키용 URL 정규화 (공백/#fragment만 제거)
+        ?type= 크기 값은 그대로 두어야 함 - 요청은 원래 URL로 하므로 크기가 다른 이미지가 한 키에 섞이지 않도록
+
+        Args:
+            url: 이미지 URL
+
+        Returns:
+            str: 정규화된 URL
+        """
+        return url.strip().split('#')[0]
+
+    def _blob_path(self, content_hash):
+        """콘텐츠 해시 → 저장 경로"""
+        return os.path.join(self.blobs_dir, content_hash[:2], content_hash)
+
+    def _load_index(self):
+        """디스크의 인덱스 읽기"""
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_index(self):
+        """
+        인덱스 저장 (다른 프로세스가 기록한 항목과 병합 후 원자적으로 교체)
+        병합 중 경쟁이 생겨도 최악의 경우 해당 이미지를 한 번 더 받을 뿐 손상은 없음
+        """
+        on_disk = self._load_index()
+        for key in self._removed:
+            on_disk.pop(key, None)
+        for key, entry in self._index.items():
+            current = on_disk.get(key)
+            if not current or entry.get('last_access', 0) >= current.get('last_access', 0):
+                on_disk[key] = entry
+        self._index = on_disk
+        self._removed.clear()
+
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(on_disk, f)
+            os.replace(tmp_path, self.index_path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def _url_lock(self, key):
+        """같은 URL을 여러 스레드가 동시에 받지 않도록 URL별 잠금"""
+        with self._lock:
+            if key not in self._url_locks:
+                self._url_locks[key] = threading.Lock()
+            return self._url_locks[key]
+
+    def _touch(self, key, checked=False):
+        """사용 시각(LRU) / 확인 시각 갱신"""
+        now = time.time()
+        with self._lock:
+            entry = self._index.get(key)
+            if entry:
+                entry['last_access'] = now
+                if checked:
+                    entry['checked_at'] = now
+
+    def fetch(self, session, url, timeout=10):
+        """
+        캐시를 거쳐 이미지 가져오기
+
+        Args:
+            session: requests.Session
+            url: 이미지 URL
+            timeout: 요청 타임아웃(초)
+
+        Returns:
+            str: 캐시에 저장된 이미지 경로 (실패 시 None)
+        """
+        key = self.normalize_url(url)
+
+        with self._url_lock(key):
+            with self._lock:
+                entry = dict(self._index.get(key) or {})
+
+            blob_path = self._blob_path(entry['hash']) if entry.get('hash') else None
+            if blob_path and not os.path.exists(blob_path):
+                entry, blob_path = {}, None
+
+            # 최근에 확인한 이미지는 요청 없이 바로 사용
+            if blob_path and time.time() - entry.get('checked_at', 0) < self.revalidate_after:
+                self._touch(key)
+                return blob_path
+
+            # 조건부 요청 헤더
+            headers = {}
+            if blob_path:
+                if entry.get('etag'):
+                    headers['If-None-Match'] = entry['etag']
+                if entry.get('last_modified'):
+                    headers['If-Modified-Since'] = entry['last_modified']
+
+            with session.get(url, timeout=timeout, stream=True, headers=headers) as response:
+                if response.status_code == 304 and blob_path:
+                    self._touch(key, checked=True)
+                    with self._lock:
+                        self._save_index()
+                    return blob_path
+
+                if response.status_code != 200:
+                    return None
+
+                content_hash, size = self._store_body(response)
+
+                with self._lock:
+                    now = time.time()
+                    self._index[key] = {
+                        'hash': content_hash,
+                        'size': size,
+                        'etag': response.headers.get('ETag'),
+                        'last_modified': response.headers.get('Last-Modified'),
+                        'checked_at': now,
+                        'last_access': now
+                    }
+                    self._removed.discard(key)
+                    self._evict()
+                    self._save_index()
+
+                return self._blob_path(content_hash)
+
+    def _store_body(self, response):
+        """
+        응답 본문을 청크 단위로 저장하면서 해시 계산
+
+        Returns:
+            tuple: (sha256 해시, 바이트 수)
+        """
+        digest = hashlib.sha256()
+        size = 0
+        fd, tmp_path = tempfile.mkstemp(dir=self.blobs_dir, suffix='.part')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                for chunk in response.iter_content(chunk_size=self.CHUNK_SIZE):
+                    if chunk:
+                        digest.update(chunk)
+                        f.write(chunk)
+                        size += len(chunk)
+
+            content_hash = digest.hexdigest()
+            blob_path = self._blob_path(content_hash)
+            os.makedirs(os.path.dirname(blob_path), exist_ok=True)
+
+            if os.path.exists(blob_path):
+                # 다른 URL로 이미 저장된 같은 내용
+                os.remove(tmp_path)
+            else:
+                os.replace(tmp_path, blob_path)
+            return content_hash, size
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def _evict(self):
+        """용량 초과 시 가장 오래 사용하지 않은 이미지부터 삭제 (self._lock 보유 상태에서 호출)"""
+        # 해시별 (크기, 마지막 사용 시각) - 여러 URL이 같은 해시를 가리킬 수 있음
+        blobs = {}
+        for entry in self._index.values():
+            h = entry.get('hash')
+            if not h:
+                continue
+            size, last = blobs.get(h, (entry.get('size', 0), 0))
+            blobs[h] = (size, max(last, entry.get('last_access', 0)))
+
+        total = sum(size for size, _ in blobs.values())
+        if total <= self.max_bytes:
+            return
+
+        for h, (size, _) in sorted(blobs.items(), key=lambda item: item[1][1]):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(self._blob_path(h))
+            except OSError:
+                pass
+            total -= size
+            for key in [k for k, e in self._index.items() if e.get('hash') == h]:
+                del self._index[key]
+                self._removed.add(key)
+
+        print(f"   🧹 이미지 캐시 정리 완료 ({total // 1024 // 1024}MB 사용 중)")
+
+    @staticmethod
+    def materialize(blob_path, dest_path):
+        """
+        캐시 이미지를 작업 폴더에 배치 (하드링크, 불가하면 복사)
+
+        Args:
+            blob_path: 캐시 이미지 경로
+            dest_path: 작업 폴더 내 파일 경로
+        """
+        if os.path.exists(dest_path):
+            os.remove(dest_path)
+        try:
+            os.link(blob_path, dest_path)
+        except OSError:
+            shutil.copyfile(blob_path, dest_path)
+
+    def clear(self):
+        """캐시 전체 삭제"""
+        with self._lock:
+            shutil.rmtree(self.blobs_dir, ignore_errors=True)
+            os.makedirs(self.blobs_dir, exist_ok=True)
+            self._removed.update(self._index.keys())
+            self._index = {}
+            self._save_index()
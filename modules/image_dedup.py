@@ -0,0 +1,282 @@
+"""
+이미지 중복 제거 모듈
+- 지각 해시(dHash/aHash)로 URL이 달라도 같은 그림이면 중복으로 판단
+- 여러 상품에서 반복되는 배송/이벤트 배너(보일러플레이트)를 기억해서 제외
+- 배너 목록은 앱 데이터 폴더에 저장 (다음 실행에도 유지)
+- 직접 배너로 지정하기도 가능 (mark_boilerplate)
+"""
+
+import os
+import json
+import time
+import threading
+import tempfile
+
+from PIL import Image
+
+from .utils import get_app_data_dir
+
+
+def dhash(image, hash_size=8):
+    """
+    차이 해시 (가로로 인접한 픽셀 밝기 비교)
+    재압축/리사이즈에 강하고 계산이 빠름
+
+    Args:
+        image: 파일 경로 또는 PIL.Image
+        hash_size: 해시 한 변 크기 (8 → 64비트)
+
+    Returns:
+        int: 해시 값
+    """
+    pixels = _grayscale_pixels(image, hash_size + 1, hash_size)
+    value = 0
+    for row in range(hash_size):
+        offset = row * (hash_size + 1)
+        for col in range(hash_size):
+            value = (value << 1) | (pixels[offset + col] > pixels[offset + col + 1])
+    return value
+
+
+def ahash(image, hash_size=8):
+    """
+    평균 해시 (평균 밝기보다 밝은지 여부)
+
+    Args:
+        image: 파일 경로 또는 PIL.Image
+        hash_size: 해시 한 변 크기 (8 → 64비트)
+
+    Returns:
+        int: 해시 값
+    """
+    pixels = _grayscale_pixels(image, hash_size, hash_size)
+    average = sum(pixels) / len(pixels)
+    value = 0
+    for pixel in pixels:
+        value = (value << 1) | (pixel > average)
+    return value
+
+
+def hamming(a, b):
+    """두 해시의 다른 비트 수"""
+    return bin(a ^ b).count('1')
+
+
+def _grayscale_pixels(image, width, height):
+    """작게 줄인 흑백 픽셀 리스트"""
+    if isinstance(image, str):
+        with Image.open(image) as img:
+            return list(img.convert('L').resize((width, height), Image.LANCZOS).getdata())
+    return list(image.convert('L').resize((width, height), Image.LANCZOS).getdata())
+
+
+class ImageFingerprint:
+    """이미지 1개의 해시 묶음 (dHash + aHash 둘 다 가까워야 같은 이미지로 판단)"""
+
+    def __init__(self, d, a):
+        self.d = d
+        self.a = a
+
+    @classmethod
+    def from_image(cls, image):
+        """파일 경로/PIL.Image에서 생성"""
+        if isinstance(image, str):
+            with Image.open(image) as img:
+                img.load()
+                return cls(dhash(img), ahash(img))
+        return cls(dhash(image), ahash(image))
+
+    @classmethod
+    def from_key(cls, key):
+        """저장용 문자열('dhash:ahash' 16진수)에서 생성"""
+        d, a = key.split(':')
+        return cls(int(d, 16), int(a, 16))
+
+    @property
+    def key(self):
+        """저장용 문자열"""
+        return f"{self.d:016x}:{self.a:016x}"
+
+    def matches(self, other, threshold):
+        """두 해시가 모두 threshold 비트 이하로 다르면 같은 이미지"""
+        return hamming(self.d, other.d) <= threshold and hamming(self.a, other.a) <= threshold
+
+
+class BoilerplateRegistry:
+    """여러 상품에 반복 등장하는 배너 이미지 기록 (디스크 저장)"""
+
+    FILE_NAME = 'boilerplate_images.json'
+
+    _shared = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, path=None, min_products=3, threshold=6, max_entries=5000):
+        """
+        초기화
+
+        Args:
+            path: 저장 파일 경로 (기본: ColdAPP 데이터 폴더/image_hashes/boilerplate_images.json)
+            min_products: 이 개수 이상의 서로 다른 상품에서 보이면 배너로 판단
+            threshold: 같은 이미지로 볼 해시 거리(비트)
+            max_entries: 기록할 최대 이미지 수 (초과 시 오래 안 보인 것부터 삭제)
+        """
+        self.path = path or os.path.join(get_app_data_dir('image_hashes'), self.FILE_NAME)
+        self.min_products = min_products
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self._lock = threading.RLock()
+        self._entries = self._load()
+
+    @classmethod
+    def shared(cls):
+        """
+        프로세스 전체에서 공유하는 기본 기록
+
+        Returns:
+            BoilerplateRegistry: 기본 설정 인스턴스
+        """
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    def _load(self):
+        """저장 파일 읽기"""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save(self):
+        """저장 파일 원자적 교체"""
+        directory = os.path.dirname(self.path) or '.'
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(self._entries, f)
+            os.replace(tmp_path, self.path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def _find(self, fingerprint):
+        """가까운 기록 찾기 (없으면 None)"""
+        for key in self._entries:
+            if fingerprint.matches(ImageFingerprint.from_key(key), self.threshold):
+                return key
+        return None
+
+    def is_boilerplate(self, fingerprint):
+        """
+        배너 이미지인지 확인
+
+        Args:
+            fingerprint: ImageFingerprint
+
+        Returns:
+            bool: 직접 지정됐거나 min_products개 이상의 상품에서 보였으면 True
+        """
+        with self._lock:
+            key = self._find(fingerprint)
+            if not key:
+                return False
+            entry = self._entries[key]
+            return entry.get('manual', False) or len(entry.get('products', [])) >= self.min_products
+
+    def record(self, product_key, fingerprints):
+        """
+        상품 1개에서 사용한 이미지 기록
+
+        Args:
+            product_key: 상품 식별자 (ai_cache.product_key 결과 - 같은 상품을 다른 짧은 URL로 올려도 같은 값)
+            fingerprints: ImageFingerprint 리스트
+        """
+        if not product_key or not fingerprints:
+            return
+
+        with self._lock:
+            now = time.time()
+            for fingerprint in fingerprints:
+                key = self._find(fingerprint) or fingerprint.key
+                entry = self._entries.setdefault(key, {'products': []})
+                if product_key not in entry['products']:
+                    # 판단에 필요한 만큼만 보관
+                    entry['products'] = (entry['products'] + [product_key])[-self.min_products:]
+                entry['last_seen'] = now
+            self._trim()
+            self._save()
+
+    def mark_boilerplate(self, image):
+        """
+        이미지를 배너로 직접 지정 (다음부터 항상 제외)
+
+        Args:
+            image: 파일 경로, PIL.Image 또는 ImageFingerprint
+        """
+        fingerprint = image if isinstance(image, ImageFingerprint) else ImageFingerprint.from_image(image)
+        with self._lock:
+            key = self._find(fingerprint) or fingerprint.key
+            entry = self._entries.setdefault(key, {'products': []})
+            entry['manual'] = True
+            entry['last_seen'] = time.time()
+            self._save()
+        print(f"   🚫 배너 이미지로 지정: {key}")
+
+    def _trim(self):
+        """기록이 너무 많으면 오래 안 보인 것부터 삭제 (직접 지정한 배너는 유지)"""
+        overflow = len(self._entries) - self.max_entries
+        if overflow <= 0:
+            return
+        candidates = sorted(
+            (key for key, entry in self._entries.items() if not entry.get('manual')),
+            key=lambda key: self._entries[key].get('last_seen', 0)
+        )
+        for key in candidates[:overflow]:
+            del self._entries[key]
+
+
+class ImageDeduplicator:
+    """상품 1개 안에서 중복/배너 이미지를 걸러내는 클래스"""
+
+    def __init__(self, registry=None, threshold=6):
+        """
+        초기화
+
+        Args:
+            registry: BoilerplateRegistry (None이면 배너 필터 없이 중복만 제거)
+            threshold: 같은 이미지로 볼 해시 거리(비트)
+        """
+        self.registry = registry
+        self.threshold = threshold
+        self.kept = []
+
+    def check(self, path):
+        """
+        이미지를 사용할지 판단하고, 사용하면 목록에 추가
+
+        Args:
+            path: 다운로드된 이미지 경로
+
+        Returns:
+            str: 제외 사유 ('duplicate' / 'boilerplate' / 'unreadable'), 사용하면 None
+        """
+        try:
+            fingerprint = ImageFingerprint.from_image(path)
+        except Exception:
+            return 'unreadable'
+
+        if any(fingerprint.matches(other, self.threshold) for other in self.kept):
+            return 'duplicate'
+        if self.registry and self.registry.is_boilerplate(fingerprint):
+            return 'boilerplate'
+
+        self.kept.append(fingerprint)
+        return None
+
+    def commit(self, product_key):
+        """이번 상품에서 사용한 이미지들을 배너 판단용으로 기록"""
+        if self.registry:
+            self.registry.record(product_key, self.kept)
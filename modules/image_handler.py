@@ -1,32 +1,150 @@
 """
 이미지 처리 모듈
 - 이미지 다운로드 (상품 이미지 + 상세 설명 이미지)
+- 공유 HTTP 세션(커넥션 풀) + 워커 스레드로 병렬 다운로드
+- 디스크 이미지 캐시 (재발행/재시도 시 재다운로드 없음)
+- 상세 이미지 지각 해시 중복 제거 + 반복 배너 제외
 - base64 인코딩 (Gemini Vision API용)
 - 이미지 파일 관리
+
+※ GUI/CLI(NaverBlogAutomation)는 download_product_images()로 대표 이미지만 받음 (글 생성이 텍스트 기반)
+  상세 이미지 다운로드/중복·배너 제거(download_all_images, download_detail_images)는
+  AIContentGenerator.generate_content_with_vision()과 함께 쓰는 모듈 API 전용
 """
 
 import os
+import threading
 import requests
 import base64
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+
+from .ai_cache import product_key as get_product_key
+from .image_cache import ImageCache
+from .image_dedup import BoilerplateRegistry, ImageDeduplicator
 
 
 class ImageHandler:
     """이미지 다운로드 및 처리 클래스"""
     
-    def __init__(self, temp_dir='temp_images'):
+    # 모든 ImageHandler가 함께 쓰는 HTTP 세션 (TCP/TLS 연결 재사용)
+    _session = None
+    _session_lock = threading.Lock()
+    
+    CHUNK_SIZE = 64 * 1024
+    
+    def __init__(self, temp_dir='temp_images', max_workers=6, timeout=10, use_cache=True, dedup=True):
         """
         초기화
         
         Args:
             temp_dir: 임시 이미지 저장 폴더 경로
+            max_workers: 동시 다운로드 워커 개수
+            timeout: 이미지 1개 요청 타임아웃(초)
+            use_cache: 디스크 이미지 캐시 사용 여부
+            dedup: 상세 이미지 중복/배너 제거 사용 여부
         """
         self.temp_dir = temp_dir
+        self.max_workers = max(1, max_workers)
+        self.timeout = timeout
+        self.cache = ImageCache.shared() if use_cache else None
+        self.dedup = dedup
+        self.boilerplate = BoilerplateRegistry.shared() if dedup else None
         
         # temp_images 폴더 생성
         if not os.path.exists(self.temp_dir):
             os.makedirs(self.temp_dir)
             print(f"✅ 임시 폴더 생성: {self.temp_dir}")
     
+    @classmethod
+    def get_session(cls, pool_size=16):
+        """
+        공유 HTTP 세션 가져오기 (최초 호출 시 생성)
+        
+        Args:
+            pool_size: 호스트별 최대 유지 연결 수
+            
+        Returns:
+            requests.Session: 커넥션 풀이 설정된 세션
+        """
+        with cls._session_lock:
+            if cls._session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+                session.mount('https://', adapter)
+                session.mount('http://', adapter)
+                cls._session = session
+            return cls._session
+    
+    def _download_one(self, url, filepath):
+        """
+        이미지 1개 다운로드 (청크 단위로 디스크에 바로 기록)
+        
+        Args:
+            url: 이미지 URL
+            filepath: 저장 경로
+            
+        Returns:
+            str: 저장된 절대 경로 (실패 시 None)
+        """
+        session = self.get_session()
+        
+        # 캐시 사용 시: 캐시에 받아두고 작업 폴더에는 링크/복사본만 배치
+        if self.cache:
+            blob_path = self.cache.fetch(session, url, timeout=self.timeout)
+            if not blob_path:
+                print(f"   ⚠️ {os.path.basename(filepath)} 다운로드 실패 (캐시)")
+                return None
+            ImageCache.materialize(blob_path, filepath)
+            return os.path.abspath(filepath)
+        
+        part_path = filepath + '.part'
+        
+        with session.get(url, timeout=self.timeout, stream=True) as response:
+            if response.status_code != 200:
+                print(f"   ⚠️ {os.path.basename(filepath)} 응답 코드 {response.status_code}")
+                return None
+            
+            with open(part_path, 'wb') as f:
+                for chunk in response.iter_content(chunk_size=self.CHUNK_SIZE):
+                    if chunk:
+                        f.write(chunk)
+        
+        # 다 받은 뒤에만 최종 파일명으로 교체 (중간에 끊긴 파일 노출 방지)
+        os.replace(part_path, filepath)
+        return os.path.abspath(filepath)
+    
+    def download_many(self, jobs):
+        """
+        여러 이미지 병렬 다운로드
+        
+        Args:
+            jobs: (URL, 파일명) 튜플 리스트
+            
+        Returns:
+            list: 다운로드 결과 경로 리스트 (jobs와 같은 순서, 실패한 항목은 None)
+        """
+        def worker(job):
+            url, filename = job
+            filepath = os.path.join(self.temp_dir, filename)
+            try:
+                path = self._download_one(url, filepath)
+                if path:
+                    print(f"   ✅ {filename} 다운로드 완료")
+                return path
+            except Exception as e:
+                print(f"   ⚠️ {filename} 다운로드 실패: {e}")
+                if os.path.exists(filepath + '.part'):
+                    os.remove(filepath + '.part')
+                return None
+        
+        if not jobs:
+            return []
+        
+        # executor.map은 입력 순서대로 결과를 돌려줌
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(jobs))) as executor:
+            return list(executor.map(worker, jobs))
+    
     def download_product_images(self, image_urls):
         """
         상품 대표 이미지들 다운로드
@@ -44,72 +162,116 @@ class ImageHandler:
             print("   ⚠️ 이미지 URL이 없습니다!")
             return []
         
-        downloaded_files = []
-        
-        for idx, url in enumerate(image_urls):
-            try:
-                response = requests.get(url, timeout=10)
-                if response.status_code == 200:
-                    filename = f"product_{idx+1}.jpg"
-                    filepath = os.path.join(self.temp_dir, filename)
-                    
-                    with open(filepath, 'wb') as f:
-                        f.write(response.content)
-                    
-                    abs_path = os.path.abspath(filepath)
-                    downloaded_files.append(abs_path)
-                    print(f"   ✅ {filename} 다운로드 완료")
-                    
-            except Exception as e:
-                print(f"   ⚠️ 이미지 {idx+1} 다운로드 실패: {e}")
-                continue
+        jobs = [(url, f"product_{idx+1}.jpg") for idx, url in enumerate(image_urls)]
+        downloaded_files = [path for path in self.download_many(jobs) if path]
         
         print(f"✅ {len(downloaded_files)}개 상품 이미지 다운로드 완료")
         return downloaded_files
     
-    def download_detail_images(self, detail_image_urls, max_images=10):
+    def download_detail_images(self, detail_image_urls, max_images=10, product_key=None):
         """
         상품 상세 설명 이미지들 다운로드
         (Vision API로 분석할 이미지들)
         
         Args:
-            detail_image_urls: 상세 설명 이미지 URL 리스트
-            max_images: 최대 다운로드 개수 (토큰 절약)
+            detail_image_urls: 상세 설명 이미지 URL 리스트 (페이지 순서, 후보 전체)
+            max_images: 최대 사용 개수 (토큰 절약)
+            product_key: 배너 판단용 상품 식별자 (ai_cache.product_key 결과, 선택)
             
         Returns:
             list: 다운로드된 파일 경로 리스트
         """
         print(f"\n💾 상세 설명 이미지 다운로드 중...")
-        print(f"   📊 다운로드할 이미지: {min(len(detail_image_urls), max_images)}개")
+        print(f"   📊 후보 이미지: {len(detail_image_urls)}개 (최대 {max_images}개 사용)")
         
         if not detail_image_urls:
             print("   ⚠️ 상세 이미지 URL이 없습니다!")
             return []
         
-        downloaded_files = []
-        
-        # 최대 개수만큼만 다운로드
-        for idx, url in enumerate(detail_image_urls[:max_images]):
-            try:
-                response = requests.get(url, timeout=10)
-                if response.status_code == 200:
-                    filename = f"detail_{idx+1}.jpg"
-                    filepath = os.path.join(self.temp_dir, filename)
-                    
-                    with open(filepath, 'wb') as f:
-                        f.write(response.content)
-                    
-                    abs_path = os.path.abspath(filepath)
-                    downloaded_files.append(abs_path)
-                    print(f"   ✅ {filename} 다운로드 완료")
-                    
-            except Exception as e:
-                print(f"   ⚠️ 상세 이미지 {idx+1} 다운로드 실패: {e}")
-                continue
+        downloaded_files = self._select_detail_images(detail_image_urls, max_images, product_key)
         
         print(f"✅ {len(downloaded_files)}개 상세 이미지 다운로드 완료")
         return downloaded_files
     
+    def _select_detail_images(self, detail_image_urls, max_images, product_key=None, first_results=None):
+        """
+        중복/배너를 걸러내면서 유효한 상세 이미지를 max_images개까지 채움
+        (걸러진 만큼 다음 후보를 추가로 다운로드)
+        
+        Args:
+            detail_image_urls: 상세 이미지 URL 후보 리스트
+            max_images: 최대 사용 개수
+            product_key: 배너 판단용 상품 식별자 (선택)
+            first_results: 첫 묶음(후보 앞쪽 max_images개)을 이미 받은 경우 그 결과
+            
+        Returns:
+            list: 사용할 이미지 경로 리스트 (페이지 순서)
+        """
+        deduplicator = ImageDeduplicator(self.boilerplate) if self.dedup else None
+        selected = []
+        skipped = {'duplicate': 0, 'boilerplate': 0, 'unreadable': 0}
+        pos = 0
+        
+        while len(selected) < max_images and pos < len(detail_image_urls):
+            batch = detail_image_urls[pos:pos + max_images - len(selected)]
+            if pos == 0 and first_results is not None:
+                results = first_results
+            else:
+                jobs = [(url, f"detail_{pos+idx+1}.jpg") for idx, url in enumerate(batch)]
+                results = self.download_many(jobs)
+            pos += len(batch)
+            
+            for path in results:
+                if not path:
+                    continue
+                reason = deduplicator.check(path) if deduplicator else None
+                if reason:
+                    skipped[reason] += 1
+                    os.remove(path)
+                    continue
+                selected.append(path)
+        
+        if deduplicator:
+            deduplicator.commit(product_key)
+            if any(skipped.values()):
+                print(f"   🧹 제외: 중복 {skipped['duplicate']}개, 배너 {skipped['boilerplate']}개, "
+                      f"손상 {skipped['unreadable']}개")
+        
+        return selected
+    
+    def download_all_images(self, product_info, max_detail_images=10):
+        """
+        대표 이미지와 상세 이미지를 한 번에 병렬 다운로드
+        
+        Args:
+            product_info: 제품 정보 dict ('images', 'detail_images', 'product_id'/'link')
+            max_detail_images: 상세 이미지 최대 개수
+            
+        Returns:
+            tuple: (대표 이미지 경로 리스트, 상세 이미지 경로 리스트)
+        """
+        product_urls = product_info.get('images', [])
+        detail_candidates = product_info.get('detail_images', [])
+        detail_urls = detail_candidates[:max_detail_images]
+        
+        print(f"\n💾 이미지 다운로드 중... (대표 {len(product_urls)}개 + 상세 {len(detail_urls)}개)")
+        
+        product_jobs = [(url, f"product_{idx+1}.jpg") for idx, url in enumerate(product_urls)]
+        detail_jobs = [(url, f"detail_{idx+1}.jpg") for idx, url in enumerate(detail_urls)]
+        results = self.download_many(product_jobs + detail_jobs)
+        
+        product_files = [path for path in results[:len(product_jobs)] if path]
+        
+        # 상세 이미지: 중복/배너로 빠진 만큼 다음 후보로 채움
+        detail_files = self._select_detail_images(
+            detail_candidates, max_detail_images,
+            product_key=get_product_key(product_info),
+            first_results=results[len(product_jobs):]
+        )
+        
+        print(f"✅ 대표 이미지 {len(product_files)}개, 상세 이미지 {len(detail_files)}개 다운로드 완료")
+        return product_files, detail_files
+    
     def encode_image_to_base64(self, image_path):
         """
         이미지 파일을 base64로 인코딩
@@ -157,6 +319,7 @@ class ImageHandler:
     def cleanup_temp_files(self):
         """
         임시 파일 정리 (선택사항)
+        이미지 캐시는 앱 데이터 폴더에 따로 있으므로 지워지지 않음
         """
         try:
             import shutil
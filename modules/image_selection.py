@@ -0,0 +1,161 @@
+"""
+상세 이미지 선택 모듈
+- JavaScript 1회 호출로 상세 영역의 모든 이미지 정보 수집 (src, 원본 크기, DOM 순서, 위치)
+- 크기/비율/위치 점수로 정보가 많은 이미지를 우선 선택
+- 같은 페이지면 항상 같은 결과 (점수 동률은 DOM 순서로 결정)
+"""
+
+# 상세 설명 영역 셀렉터 (앞에 있을수록 우선)
+DETAIL_IMAGE_SELECTORS = [
+    'div.se-main-container img',  # 상세정보 메인 영역의 이미지
+    'div.se-viewer img',           # 백업
+    'div.nKuwJ img',               # 추가 셀렉터
+    'div._3cWR_0Clkt img',         # 추가 셀렉터
+]
+
+# arguments[0]: 셀렉터 리스트 → 이미지 정보 리스트 (DOM 순서)
+COLLECT_IMAGES_JS = """
+var selectors = arguments[0];
+var seen = new Set();
+var elements = [];
+var result = [];
+var scrollTop = window.pageYOffset || document.documentElement.scrollTop || 0;
+for (var s = 0; s < selectors.length; s++) {
+    var nodes = document.querySelectorAll(selectors[s]);
+    for (var i = 0; i < nodes.length; i++) {
+        var img = nodes[i];
+        if (seen.has(img)) continue;
+        seen.add(img);
+        elements.push(img);
+        var src = img.currentSrc || img.src || img.getAttribute('data-src') || '';
+        var rect = img.getBoundingClientRect();
+        result.push({
+            src: src,
+            natural_width: img.naturalWidth || 0,
+            natural_height: img.naturalHeight || 0,
+            attr_width: parseInt(img.getAttribute('width') || '0', 10) || 0,
+            attr_height: parseInt(img.getAttribute('height') || '0', 10) || 0,
+            rendered_width: Math.round(rect.width),
+            rendered_height: Math.round(rect.height),
+            top: Math.round(rect.top + scrollTop),
+            selector: s
+        });
+    }
+}
+var all = document.getElementsByTagName('img');
+var order = new Map();
+for (var j = 0; j < all.length; j++) order.set(all[j], j);
+for (var k = 0; k < result.length; k++) result[k].order = order.get(elements[k]);
+return result;
+"""
+
+
+def collect_detail_images(driver, selectors=None):
+    """
+    상세 영역 이미지 정보를 JavaScript 1회 호출로 수집
+
+    Args:
+        driver: Selenium WebDriver
+        selectors: 상세 영역 셀렉터 리스트 (기본: DETAIL_IMAGE_SELECTORS)
+
+    Returns:
+        list: 이미지 정보 dict 리스트
+    """
+    return driver.execute_script(COLLECT_IMAGES_JS, selectors or DETAIL_IMAGE_SELECTORS) or []
+
+
+def normalize_image_url(src):
+    """고화질 변환 (?type=f640)"""
+    if '?type=' in src:
+        src = src.split('?type=')[0] + '?type=f640'
+    return src
+
+
+def _image_size(info):
+    """원본 크기 (아직 로드 전이면 width/height 속성 또는 화면 크기 사용)"""
+    width = info.get('natural_width') or info.get('attr_width') or info.get('rendered_width') or 0
+    height = info.get('natural_height') or info.get('attr_height') or info.get('rendered_height') or 0
+    return width, height
+
+
+def score_image(info):
+    """
+    이미지 1개의 정보량 점수 (높을수록 우선)
+
+    Args:
+        info: collect_detail_images 결과 항목
+
+    Returns:
+        float: 점수 (사용하지 않을 이미지는 0 이하)
+    """
+    width, height = _image_size(info)
+
+    # 크기를 모르면 중간 점수 (지연 로딩 이미지)
+    if not width or not height:
+        return 1.0
+
+    # 아이콘/구분선/여백 이미지 제외
+    if width < 100 or height < 100:
+        return 0.0
+
+    # 면적: 클수록 정보가 많지만 일정 크기 이상은 같은 점수
+    area_score = min(width * height, 860 * 2000) / (860 * 2000)
+
+    # 비율: 가로로 너무 긴 띠(구분선/배너)는 감점, 세로 긴 상세 이미지는 그대로
+    aspect = width / height
+    if aspect > 4:
+        aspect_score = 0.3
+    elif aspect > 2.5:
+        aspect_score = 0.7
+    else:
+        aspect_score = 1.0
+
+    # 셀렉터: 메인 상세 영역 이미지 우선
+    selector_score = 1.0 - 0.1 * info.get('selector', 0)
+
+    return 1.0 + area_score * aspect_score * selector_score
+
+
+def select_detail_images(infos, limit=10, max_candidates=30):
+    """
+    점수 기반 상세 이미지 선택
+
+    Args:
+        infos: collect_detail_images 결과 리스트
+        limit: 우선 사용할 이미지 개수
+        max_candidates: 반환할 최대 후보 개수 (limit 초과분은 중복 제외 시 보충용)
+
+    Returns:
+        list: 이미지 URL 리스트
+              앞 limit개는 점수 상위 이미지(페이지 순서), 나머지는 보충 후보(점수 순서)
+    """
+    # 같은 URL은 처음 나온 것만
+    candidates = []
+    seen = set()
+    for position, info in enumerate(infos):
+        src = info.get('src') or ''
+        if not src.startswith('http'):
+            continue
+        src = normalize_image_url(src)
+        if src in seen:
+            continue
+        seen.add(src)
+
+        score = score_image(info)
+        if score <= 0:
+            continue
+
+        order = info.get('order')
+        candidates.append({
+            'src': src,
+            'score': score,
+            'order': order if order is not None else position,
+            'top': info.get('top', 0)
+        })
+
+    # 점수 내림차순, 동률이면 DOM 순서 (항상 같은 결과)
+    ranked = sorted(candidates, key=lambda c: (-c['score'], c['order']))[:max_candidates]
+
+    primary = sorted(ranked[:limit], key=lambda c: (c['order'], c['top']))
+    backup = ranked[limit:]
+    return [c['src'] for c in primary + backup]
@@ -0,0 +1,234 @@
+"""
+실행 시간 기록 모듈
+- 단계별 소요 시간 기록 (로그인 확인, 캡차 확인, 쿠키 복원 등)
+- 프로세스 전체에서 공유 (TimingRecorder.shared())
+- 배치가 끝나면 단계별 횟수/평균/최대 요약 출력
+- Gemini 토큰 사용량/모델 전환 횟수/헤지 요청 기록 (TokenUsage.shared())
+"""
+
+import time
+import threading
+from contextlib import contextmanager
+
+
+class TimingRecorder:
+    """단계별 소요 시간 기록"""
+
+    _shared = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, max_samples=1000):
+        """
+        초기화
+
+        Args:
+            max_samples: 단계별로 보관할 최대 기록 수 (오래된 것부터 삭제)
+        """
+        self.max_samples = max_samples
+        self._samples = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def shared(cls):
+        """
+        프로세스 전체에서 공유하는 기본 기록
+
+        Returns:
+            TimingRecorder: 기본 인스턴스
+        """
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    def record(self, name, seconds):
+        """
+        소요 시간 1건 기록
+
+        Args:
+            name: 단계 이름
+            seconds: 소요 시간(초)
+        """
+        with self._lock:
+            samples = self._samples.setdefault(name, [])
+            samples.append(seconds)
+            if len(samples) > self.max_samples:
+                del samples[0]
+
+    @contextmanager
+    def measure(self, name):
+        """
+        with 블록 소요 시간 기록 (예외가 나도 기록)
+
+        Args:
+            name: 단계 이름
+        """
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - started)
+
+    def percentile(self, name, q, min_samples=1):
+        """
+        단계 소요 시간 백분위
+
+        Args:
+            name: 단계 이름
+            q: 백분위 (0~1, 예: 0.9)
+            min_samples: 기록이 이보다 적으면 None
+
+        Returns:
+            float: 소요 시간(초) 또는 None
+        """
+        with self._lock:
+            samples = sorted(self._samples.get(name, []))
+        if not samples or len(samples) < min_samples:
+            return None
+        index = min(len(samples) - 1, max(0, int(round(q * len(samples))) - 1))
+        return samples[index]
+
+    def summary(self):
+        """
+        단계별 요약
+
+        Returns:
+            dict: {단계 이름: {'count', 'total', 'avg', 'max'}} (초 단위)
+        """
+        with self._lock:
+            return {
+                name: {
+                    'count': len(samples),
+                    'total': round(sum(samples), 3),
+                    'avg': round(sum(samples) / len(samples), 3),
+                    'max': round(max(samples), 3)
+                }
+                for name, samples in self._samples.items() if samples
+            }
+
+    def report(self):
+        """
+        요약 문자열 (기록이 없으면 빈 문자열)
+
+        Returns:
+            str: 단계별 한 줄씩
+        """
+        summary = self.summary()
+        if not summary:
+            return ''
+        lines = ["⏱️ 단계별 소요 시간:"]
+        for name, stats in sorted(summary.items()):
+            lines.append(f"   {name}: {stats['count']}회, 평균 {stats['avg'] * 1000:.0f}ms, "
+                         f"최대 {stats['max'] * 1000:.0f}ms")
+        return '\n'.join(lines)
+
+    def reset(self):
+        """기록 전체 삭제"""
+        with self._lock:
+            self._samples.clear()
+
+
+class TokenUsage:
+    """Gemini 작업/모델별 호출 수와 토큰 사용량 기록"""
+
+    _shared = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self):
+        self._usage = {}
+        self._fallbacks = {}
+        self._hedges = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def shared(cls):
+        """
+        프로세스 전체에서 공유하는 기본 기록
+
+        Returns:
+            TokenUsage: 기본 인스턴스
+        """
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    def record(self, name, prompt_tokens=0, output_tokens=0):
+        """
+        호출 1건 기록
+
+        Args:
+            name: 작업/모델 이름 (예: 'tags (gemini-2.5-flash-lite)')
+            prompt_tokens: 입력 토큰 수
+            output_tokens: 출력 토큰 수
+        """
+        with self._lock:
+            usage = self._usage.setdefault(name, {'calls': 0, 'prompt_tokens': 0, 'output_tokens': 0})
+            usage['calls'] += 1
+            usage['prompt_tokens'] += prompt_tokens
+            usage['output_tokens'] += output_tokens
+
+    def record_fallback(self, task):
+        """다음 모델로 넘어간 횟수 기록"""
+        with self._lock:
+            self._fallbacks[task] = self._fallbacks.get(task, 0) + 1
+
+    def record_hedge(self, task, hedged, won=False):
+        """
+        헤지 사용 가능한 호출 1건 기록
+
+        Args:
+            task: 작업 이름
+            hedged: 헤지 요청을 보냈는지
+            won: 헤지 요청이 먼저 성공했는지
+        """
+        with self._lock:
+            hedge = self._hedges.setdefault(task, {'calls': 0, 'hedged': 0, 'won': 0})
+            hedge['calls'] += 1
+            hedge['hedged'] += int(hedged)
+            hedge['won'] += int(won)
+
+    def summary(self):
+        """
+        작업/모델별 요약
+
+        Returns:
+            dict: {'usage': {이름: {'calls', 'prompt_tokens', 'output_tokens'}}, 'fallbacks': {작업: 횟수},
+                   'hedges': {작업: {'calls', 'hedged', 'won'}}}
+        """
+        with self._lock:
+            return {
+                'usage': {name: dict(usage) for name, usage in self._usage.items()},
+                'fallbacks': dict(self._fallbacks),
+                'hedges': {task: dict(hedge) for task, hedge in self._hedges.items()}
+            }
+
+    def report(self):
+        """
+        요약 문자열 (기록이 없으면 빈 문자열)
+
+        Returns:
+            str: 작업/모델별 한 줄씩
+        """
+        summary = self.summary()
+        if not any(summary.values()):
+            return ''
+        lines = ["🔢 Gemini 토큰 사용량:"]
+        for name, usage in sorted(summary['usage'].items()):
+            lines.append(f"   {name}: {usage['calls']}회, 입력 {usage['prompt_tokens']:,} / "
+                         f"출력 {usage['output_tokens']:,} 토큰")
+        for task, count in sorted(summary['fallbacks'].items()):
+            lines.append(f"   {task}: 다른 모델로 전환 {count}회")
+        for task, hedge in sorted(summary['hedges'].items()):
+            hedge_rate = hedge['hedged'] / hedge['calls'] * 100 if hedge['calls'] else 0
+            win_rate = hedge['won'] / hedge['hedged'] * 100 if hedge['hedged'] else 0
+            lines.append(f"   {task}: 헤지 요청 {hedge['hedged']}/{hedge['calls']}회 ({hedge_rate:.0f}%), "
+                         f"헤지 승리 {hedge['won']}회 ({win_rate:.0f}%)")
+        return '\n'.join(lines)
+
+    def reset(self):
+        """기록 전체 삭제"""
+        with self._lock:
+            self._usage.clear()
+            self._fallbacks.clear()
+            self._hedges.clear()
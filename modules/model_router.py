@@ -0,0 +1,305 @@
+"""
+Gemini 모델 라우팅 모듈
+- 작업 종류(본문/태그/캡차/상품 정보 추출)마다 모델 등급을 나눠서 사용
+  (본문만 Pro, 태그/캡차 같은 짧은 작업은 Flash / Flash-Lite)
+- 할당량 초과(429), 서버 과부하(503), 시간 초과, 차단(서킷 브레이커)이면 실제로 다음 모델로 다시 요청
+  (같은 모델 재시도/요청 수 제한은 GeminiClient.generate에서)
+- 작업/모델별 소요 시간은 TimingRecorder, 토큰 사용량은 TokenUsage에 기록
+  (성공한 호출만 따로 'gemini <작업> ok (<모델>)'로 기록, 스트리밍은 끝까지 읽은 뒤 'gemini <작업> stream (<모델>)')
+- 헤지 요청(선택): 응답이 평소(기록된 소요 시간의 백분위)보다 늦으면 같은/더 싼 모델로 한 번 더 요청하고
+  먼저 온 응답 사용 (나머지는 취소, 헤지 비율/승률은 TokenUsage에 기록)
+"""
+
+import time
+import queue
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from .gemini_client import GeminiClient
+from .metrics import TimingRecorder, TokenUsage
+from .rate_limit import is_transient_error
+
+
+PRO = 'gemini-2.5-pro'
+FLASH = 'gemini-2.5-flash'
+FLASH_LITE = 'gemini-2.5-flash-lite'
+
+# 작업 → 시도할 모델 순서 (앞에서부터, 실패하면 다음 모델)
+DEFAULT_ROUTES = {
+    'body': [PRO, FLASH],              # 블로그 본문 + 강조 키워드 (품질이 중요)
+    'tags': [FLASH_LITE, FLASH],       # 해시태그 30개
+    'captcha': [FLASH, PRO],           # 캡차 질문 읽기 (숫자 답 1개)
+    'facts': [FLASH, PRO],             # 상세 이미지 → 제품 사실 정보 JSON (Vision)
+}
+
+# 작업별 모델 1개당 제한 시간(초, 재시도 포함) - 호출하는 쪽에서 deadline을 주면 그 안에서만
+DEFAULT_TIMEOUTS = {
+    'body': 180,
+    'tags': 60,
+    'captcha': 30,
+    'facts': 120,
+}
+
+
+class ModelRouter:
+    """작업 종류에 맞는 모델로 요청 (실패 시 다음 등급으로)"""
+
+    _executor = None
+    _executor_lock = threading.Lock()
+
+    def __init__(self, client, routes=None, timeouts=None, hedge=False, hedge_tasks=('body',),
+                 hedge_routes=None, hedge_percentile=0.9, hedge_min_samples=5):
+        """
+        초기화
+
+        Args:
+            client: GeminiClient (또는 API 키 문자열)
+            routes: 작업별 모델 순서 dict (DEFAULT_ROUTES를 덮어씀, 선택)
+            timeouts: 작업별 요청 제한 시간 dict (DEFAULT_TIMEOUTS를 덮어씀, 선택)
+            hedge: 헤지 요청 사용 여부
+            hedge_tasks: 헤지할 작업 이름들
+            hedge_routes: 헤지 요청에 쓸 모델 순서 dict (기본: 원래 작업과 같은 모델, 예: {'body': [FLASH]})
+            hedge_percentile: 이 백분위 소요 시간이 지나도 응답이 없으면 헤지 (0.9 = 상위 10%만큼 느릴 때)
+            hedge_min_samples: 소요 시간 기록이 이만큼 쌓이기 전에는 헤지하지 않음
+        """
+        self.client = GeminiClient.shared(client) if isinstance(client, str) else client
+        self.routes = dict(DEFAULT_ROUTES)
+        self.routes.update(routes or {})
+        self.timeouts = dict(DEFAULT_TIMEOUTS)
+        self.timeouts.update(timeouts or {})
+        self.hedge = hedge
+        self.hedge_tasks = set(hedge_tasks)
+        self.hedge_routes = dict(hedge_routes or {})
+        self.hedge_percentile = hedge_percentile
+        self.hedge_min_samples = hedge_min_samples
+
+    @classmethod
+    def _hedge_executor(cls):
+        """헤지용 공유 스레드 풀 (처음 쓸 때 생성)"""
+        with cls._executor_lock:
+            if cls._executor is None:
+                cls._executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix='gemini-hedge')
+            return cls._executor
+
+    def models_for(self, task):
+        """
+        작업에 사용할 모델 순서
+
+        Args:
+            task: 작업 이름 ('body', 'tags', 'captcha', 'facts')
+
+        Returns:
+            list: 모델 이름 리스트
+        """
+        return list(self.routes.get(task) or self.routes['body'])
+
+    def generate(self, task, contents, deadline=None, **kwargs):
+        """
+        작업에 맞는 모델로 콘텐츠 생성 (할당량/과부하/시간 초과면 다음 모델)
+
+        Args:
+            task: 작업 이름
+            contents: 프롬프트 문자열 또는 [프롬프트, 이미지...] 리스트
+            deadline: 전체 마감 시각 (time.time() 기준, 모든 모델/재시도 포함, 선택)
+            **kwargs: generate_content 옵션 (generation_config 등)
+
+        Returns:
+            GenerateContentResponse: 응답 (어떤 모델이 답했는지는 response.routed_model)
+        """
+        # 스트리밍 응답은 헤지하지 않음 (조각을 이미 에디터로 넘기고 있으므로)
+        hedged = self.hedge and task in self.hedge_tasks and not kwargs.get('stream')
+        delay = self.hedge_delay(task) if hedged else None
+        if delay is None:
+            return self._generate(task, self.models_for(task), contents, deadline, **kwargs)
+        return self._generate_hedged(task, contents, deadline, delay, **kwargs)
+
+    def hedge_delay(self, task):
+        """
+        헤지 요청을 보내기까지 기다릴 시간 (첫 모델의 성공한 호출 소요 시간 백분위)
+
+        실패한 호출(429/400/서킷 차단 등)은 금방 끝나서 백분위를 0초 가깝게 끌어내리므로 제외
+
+        Args:
+            task: 작업 이름
+
+        Returns:
+            float: 대기 시간(초, 기록이 부족하면 None)
+        """
+        name = f"gemini {task} ok ({self.models_for(task)[0]})"
+        return TimingRecorder.shared().percentile(name, self.hedge_percentile, min_samples=self.hedge_min_samples)
+
+    def _generate_hedged(self, task, contents, deadline, delay, **kwargs):
+        """원래 요청이 delay초 안에 안 끝나면 헤지 요청을 보내고 먼저 성공한 응답 사용"""
+        executor = self._hedge_executor()
+        usage = TokenUsage.shared()
+        primary_cancel = threading.Event()
+        primary = executor.submit(self._generate, task, self.models_for(task), contents, deadline,
+                                  primary_cancel, **kwargs)
+
+        done, _ = wait([primary], timeout=delay)
+        if done:
+            usage.record_hedge(task, hedged=False)
+            return primary.result()
+
+        hedge_models = self.hedge_routes.get(task) or self.models_for(task)
+        print(f"   🔀 {task} 응답이 {delay:.1f}초 넘게 없음 → {hedge_models[0]}로 헤지 요청")
+        hedge_cancel = threading.Event()
+        hedge = executor.submit(self._generate, task, hedge_models, contents, deadline, hedge_cancel, **kwargs)
+
+        pending = {primary: primary_cancel, hedge: hedge_cancel}
+        error = None
+        while pending:
+            timeout = max(0.0, deadline - time.time()) if deadline else None
+            done, _ = wait(list(pending), timeout=timeout, return_when=FIRST_COMPLETED)
+            if not done:
+                break
+            for future in done:
+                pending.pop(future)
+                try:
+                    response = future.result()
+                except Exception as e:
+                    error = error or e
+                    continue
+                # 늦은 쪽은 취소 (이미 보낸 HTTP 요청은 끝까지 기다리지 않고 결과만 버림, 재시도는 중단)
+                for other, cancel_event in pending.items():
+                    cancel_event.set()
+                    other.cancel()
+                won = future is hedge
+                usage.record_hedge(task, hedged=True, won=won)
+                if won:
+                    print(f"   🔀 헤지 요청이 먼저 응답 ({getattr(response, 'routed_model', hedge_models[0])})")
+                return response
+
+        for other, cancel_event in pending.items():
+            cancel_event.set()
+            other.cancel()
+        usage.record_hedge(task, hedged=True, won=False)
+        raise error or TimeoutError(f"{task} 헤지 요청 마감 시간 초과")
+
+    def _generate(self, task, models, contents, deadline=None, cancel_event=None, **kwargs):
+        """모델 순서대로 요청 (일시적 오류면 다음 모델)"""
+        recorder = TimingRecorder.shared()
+        stream = bool(kwargs.get('stream'))
+
+        for index, name in enumerate(models):
+            model_deadline = time.time() + self.timeouts.get(task, 180)
+            if deadline:
+                model_deadline = min(model_deadline, deadline)
+            print(f"   🤖 모델: {name} ({task})")
+            started = time.perf_counter()
+            try:
+                # 스트리밍은 첫 조각 전에 응답 객체가 오므로 요청 시작 시간만 따로 기록
+                with recorder.measure(f"gemini {task} {'stream-open ' if stream else ''}({name})"):
+                    # 다음 모델이 있으면 같은 모델 재시도는 1번만 (빨리 넘기는 편이 빠름)
+                    retries = None if index + 1 == len(models) else 1
+                    response = self.client.generate(contents, model=name, deadline=model_deadline,
+                                                    max_retries=retries, cancel_event=cancel_event, **kwargs)
+            except Exception as e:
+                if cancel_event is not None and cancel_event.is_set():
+                    raise
+                if index + 1 < len(models) and is_transient_error(e) and not (deadline and time.time() >= deadline):
+                    print(f"   ⚠️ {name} 응답 실패 ({type(e).__name__}) → {models[index + 1]}로 다시 시도")
+                    TokenUsage.shared().record_fallback(task)
+                    continue
+                raise
+
+            if stream:
+                # 소요 시간/토큰 사용량은 스트림을 끝까지 읽은 뒤에 기록, 조각을 읽는 동안에도 마감 시각 적용
+                response = RecordedStream(response, task, name, started, deadline=model_deadline)
+            else:
+                recorder.record(f"gemini {task} ok ({name})", time.perf_counter() - started)
+                record_usage(task, name, response)
+            try:
+                response.routed_model = name
+            except Exception:
+                pass
+            return response
+
+
+def record_usage(task, name, response):
+    """응답의 토큰 사용량 기록 (usage_metadata가 없으면 호출 수만)"""
+    usage = getattr(response, 'usage_metadata', None)
+    TokenUsage.shared().record(
+        f"{task} ({name})",
+        prompt_tokens=getattr(usage, 'prompt_token_count', 0) or 0,
+        output_tokens=getattr(usage, 'candidates_token_count', 0) or 0
+    )
+
+
+class RecordedStream:
+    """
+    스트리밍 응답 래퍼
+    - 끝까지 읽으면 전체 소요 시간과 토큰 사용량 기록
+    - deadline이 있으면 조각을 기다리는 시간까지 포함해서 마감 시각이 지나면 TimeoutError
+      (스트림 도중 429/503 등 오류는 그대로 전달 - 읽는 쪽에서 다시 요청)
+    """
+
+    _END = object()
+
+    def __init__(self, response, task, name, started, deadline=None):
+        """
+        초기화
+
+        Args:
+            response: 스트리밍 GenerateContentResponse
+            task: 작업 이름
+            name: 모델 이름
+            started: 요청 시작 시각 (time.perf_counter())
+            deadline: 스트림 전체 마감 시각 (time.time() 기준, 선택)
+        """
+        self._response = response
+        self._task = task
+        self._name = name
+        self._started = started
+        self._deadline = deadline
+        self._recorded = False
+
+    def __iter__(self):
+        completed = False
+        try:
+            for chunk in self._chunks():
+                yield chunk
+            completed = True
+        finally:
+            self._finish(completed)
+
+    def __getattr__(self, attr):
+        return getattr(self._response, attr)
+
+    def _chunks(self):
+        """응답 조각 (마감 시각이 있으면 별도 스레드에서 읽고 남은 시간만큼만 대기)"""
+        if not self._deadline:
+            yield from self._response
+            return
+
+        chunks = queue.Queue()
+
+        def read():
+            try:
+                for chunk in self._response:
+                    chunks.put((chunk, None))
+                chunks.put((self._END, None))
+            except Exception as e:
+                chunks.put((None, e))
+
+        threading.Thread(target=read, name='gemini-stream-reader', daemon=True).start()
+        while True:
+            try:
+                chunk, error = chunks.get(timeout=max(0.0, self._deadline - time.time()))
+            except queue.Empty:
+                raise TimeoutError(f"{self._task} 스트림 마감 시간 초과 ({self._name})")
+            if error is not None:
+                raise error
+            if chunk is self._END:
+                return
+            yield chunk
+
+    def _finish(self, completed):
+        """한 번만 기록 (중간에 끊기면 소요 시간은 빼고 호출/토큰만)"""
+        if self._recorded:
+            return
+        self._recorded = True
+        if completed:
+            TimingRecorder.shared().record(f"gemini {self._task} stream ({self._name})",
+                                           time.perf_counter() - self._started)
+        record_usage(self._task, self._name, self._response)
@@ -0,0 +1,193 @@
+"""
+네이버 로그인 세션 모듈
+- 로그인 쿠키(NID_AUT/NID_SES) 확인을 CDP로 바로 조회 (페이지 이동/HTML 검색 없음)
+- 쿠키 파일 복원도 CDP Network.setCookies 1회 (naver.com 이동 + add_cookie 반복 + 새로고침 없음)
+- 계정별 고정 Chrome 프로필 폴더 (브라우저를 다시 켜도 로그인 유지)
+- 캡차 화면 감지: page_source 전체를 받지 않고 브라우저 안에서 요소/문구만 확인
+- 각 확인에 걸린 시간은 TimingRecorder에 기록
+"""
+
+import os
+import re
+import time
+
+from .metrics import TimingRecorder
+from .utils import get_app_data_dir
+
+
+# 로그인 쿠키가 붙는 주소 (.naver.com 도메인 쿠키 포함)
+NAVER_COOKIE_URLS = ['https://www.naver.com', 'https://nid.naver.com', 'https://blog.naver.com']
+
+LOGIN_COOKIES = ('NID_AUT', 'NID_SES')
+
+SAME_SITE_VALUES = ('Strict', 'Lax', 'None')
+
+# 캡차 화면 요소 (입력창/이미지/폼, 화면에 보이는 것만)
+CAPTCHA_SELECTORS = [
+    '#rcpt_form',
+    '#rcpt_answer',
+    '#captcha',
+    'img[src*="captcha"]',
+]
+
+# 캡차 안내 문구 (보안 확인 화면, 영수증 질문)
+CAPTCHA_TEXTS = ['보안 확인', '보안 학인', '몇 개 입니까']
+
+# arguments[0]: 셀렉터 리스트, arguments[1]: 문구 리스트 → 캡차 화면이면 true
+# 문구는 XPath로 텍스트 노드만 검사 (DOM 직렬화/전송 없음), 숨겨진 요소는 제외
+CAPTCHA_DETECT_JS = """
+var visible = function(el) { return !!(el && el.getClientRects().length); };
+var selectors = arguments[0];
+for (var i = 0; i < selectors.length; i++) {
+    try {
+        var nodes = document.querySelectorAll(selectors[i]);
+        for (var k = 0; k < nodes.length; k++) if (visible(nodes[k])) return true;
+    } catch (e) {}
+}
+var texts = arguments[1];
+for (var j = 0; j < texts.length; j++) {
+    var query = "//body//text()[contains(., '" + texts[j] + "')]";
+    var found = document.evaluate(query, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    for (var n = 0; n < found.snapshotLength; n++) {
+        if (visible(found.snapshotItem(n).parentElement)) return true;
+    }
+}
+return false;
+"""
+
+
+def account_key(naver_id):
+    """계정 ID → 폴더/파일 이름에 쓸 수 있는 문자열"""
+    return re.sub(r'[^\w.-]', '_', naver_id)
+
+
+def profile_dir(naver_id, base_dir=None):
+    """
+    계정별 Chrome 프로필 폴더 (없으면 생성)
+
+    Args:
+        naver_id: 네이버 ID
+        base_dir: 프로필 폴더들의 위치 (기본: ColdAPP 데이터 폴더/profiles)
+
+    Returns:
+        str: 프로필 폴더 경로
+    """
+    path = os.path.join(base_dir or get_app_data_dir('profiles'), account_key(naver_id))
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def get_naver_cookies(driver):
+    """
+    브라우저의 네이버 쿠키 전체 (현재 페이지와 상관없이)
+
+    Returns:
+        list: Selenium 형식 쿠키 dict 리스트
+    """
+    if hasattr(driver, 'execute_cdp_cmd'):
+        try:
+            result = driver.execute_cdp_cmd('Network.getCookies', {'urls': NAVER_COOKIE_URLS})
+            return [_to_selenium_cookie(c) for c in result.get('cookies', [])]
+        except Exception:
+            pass
+    # CDP를 못 쓰면 현재 페이지 도메인 쿠키만
+    return driver.get_cookies()
+
+
+def has_login_cookies(driver):
+    """
+    로그인 쿠키가 있고 만료되지 않았는지 (페이지 이동 없이 확인)
+
+    Returns:
+        bool: 로그인 상태로 볼 수 있으면 True
+    """
+    try:
+        with TimingRecorder.shared().measure('login_probe'):
+            cookies = {c['name']: c for c in get_naver_cookies(driver)}
+    except Exception:
+        return False
+
+    now = time.time()
+    for name in LOGIN_COOKIES:
+        cookie = cookies.get(name)
+        if not cookie or not cookie.get('value'):
+            return False
+        expiry = cookie.get('expiry')
+        if expiry and expiry < now:
+            return False
+    return True
+
+
+def restore_cookies(driver, cookies):
+    """
+    저장해 둔 쿠키를 CDP로 한 번에 복원 (페이지 이동 없음)
+
+    Args:
+        driver: Selenium WebDriver
+        cookies: 쿠키 dict 리스트 (Selenium 또는 CDP 형식)
+
+    Returns:
+        bool: 복원 성공 여부 (False면 기존 add_cookie 방식 사용)
+    """
+    if not hasattr(driver, 'execute_cdp_cmd'):
+        return False
+
+    now = time.time()
+    params = []
+    for cookie in cookies:
+        expires = cookie.get('expiry', cookie.get('expires'))
+        if expires and 0 < expires < now:
+            continue  # 이미 만료
+        param = {
+            'name': cookie['name'],
+            'value': cookie['value'],
+            'domain': cookie.get('domain') or '.naver.com',
+            'path': cookie.get('path', '/'),
+            'secure': cookie.get('secure', False),
+            'httpOnly': cookie.get('httpOnly', False),
+        }
+        if expires and expires > 0:
+            param['expires'] = expires
+        if cookie.get('sameSite') in SAME_SITE_VALUES:
+            param['sameSite'] = cookie['sameSite']
+        params.append(param)
+
+    try:
+        with TimingRecorder.shared().measure('cookie_restore'):
+            driver.execute_cdp_cmd('Network.setCookies', {'cookies': params})
+        return True
+    except Exception as e:
+        print(f"⚠️ CDP 쿠키 복원 실패: {e}")
+        return False
+
+
+def _to_selenium_cookie(cookie):
+    """CDP 쿠키 → Selenium 형식 (add_cookie에 그대로 사용 가능)"""
+    result = {
+        'name': cookie['name'],
+        'value': cookie['value'],
+        'domain': cookie.get('domain'),
+        'path': cookie.get('path', '/'),
+        'secure': cookie.get('secure', False),
+        'httpOnly': cookie.get('httpOnly', False),
+    }
+    if not cookie.get('session') and cookie.get('expires', -1) > 0:
+        result['expiry'] = int(cookie['expires'])
+    if cookie.get('sameSite') in SAME_SITE_VALUES:
+        result['sameSite'] = cookie['sameSite']
+    return result
+
+
+def is_captcha_page(driver):
+    """
+    현재 페이지가 캡차(보안 확인) 화면인지 확인 (스크립트 1회, page_source 사용 안 함)
+
+    Returns:
+        bool: 캡차 화면이면 True
+    """
+    try:
+        with TimingRecorder.shared().measure('captcha_check'):
+            return bool(driver.execute_script(CAPTCHA_DETECT_JS, CAPTCHA_SELECTORS, CAPTCHA_TEXTS))
+    except Exception as e:
+        print(f"⚠️ 캡차 확인 실패: {e}")
+        return False
@@ -0,0 +1,144 @@
+"""
+파이프라인 실행 모듈
+- 브라우저가 필요한 단계(추출/작성)는 호출 스레드에서 순서대로 실행
+- 브라우저가 필요 없는 단계(이미지 다운로드/AI 생성)는 워커 스레드에서 미리 실행
+- 글 N을 에디터에 입력하는 동안 글 N+1의 다운로드와 Gemini 호출을 진행
+- 준비된 글 수를 제한해서 메모리 사용량 일정하게 유지
+"""
+
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from .workspace import JobWorkspace
+
+
+class PostPipeline:
+    """추출 → (다운로드 + AI 생성) → 작성 단계를 겹쳐서 실행하는 클래스"""
+
+    def __init__(self, bot, max_ahead=1, workers=2, progress_callback=None,
+                 result_callback=None, ensure_session=None):
+        """
+        초기화
+
+        Args:
+            bot: NaverBlogAutomation 인스턴스 (브라우저 시작/로그인 완료 상태)
+            max_ahead: 작성 중인 글 외에 미리 준비해둘 글 개수 (대기열 크기)
+            workers: 다운로드/AI 생성 워커 스레드 개수
+            progress_callback: 진행 메시지 콜백 (선택)
+            result_callback: URL별 결과 콜백 (url, success, message, elapsed)
+            ensure_session: 브라우저 단계 전에 호출할 세션 확인 함수 (선택)
+        """
+        self.bot = bot
+        self.max_ahead = max(1, max_ahead)
+        self.workers = max(1, workers)
+        self.progress_callback = progress_callback
+        self.result_callback = result_callback
+        self.ensure_session = ensure_session
+
+    def _emit(self, msg):
+        """진행 메시지 출력"""
+        if self.progress_callback:
+            self.progress_callback(msg)
+        else:
+            print(msg)
+
+    def _report(self, url, success, message, started):
+        """URL별 결과 전달"""
+        if self.result_callback:
+            self.result_callback(url, success, message, time.time() - started)
+
+    def _prepare(self, product_info, workspace):
+        """
+        워커 스레드 단계: 이미지 다운로드 + AI 글 생성 (브라우저 미사용)
+
+        Returns:
+            tuple: (이미지 파일 리스트, AI 결과, 실패 메시지)
+        """
+        image_files = self.bot.download_images(product_info['images'], target_dir=workspace.path)
+        if not image_files:
+            return None, None, "이미지 다운로드 실패 - 최소 1개"
+
+        ai_result = self.bot.generate_ai_content(product_info)
+        if not ai_result:
+            return image_files, None, "AI 글 생성 실패"
+
+        return image_files, ai_result, None
+
+    def _write(self, job):
+        """호출 스레드 단계: 준비된 글을 에디터에 작성/발행"""
+        url = job['url']
+        product_info = job['product_info']
+
+        try:
+            image_files, ai_result, error = job['future'].result()
+            if error:
+                self._report(url, False, error, job['started'])
+                return
+
+            self._emit(f"✅ [{job['idx']+1}] 준비 완료: 이미지 {len(image_files)}개, "
+                       f"AI 글 {len(ai_result['content'])}자, 태그 {len(ai_result['tags'])}개")
+
+            if self.ensure_session and not self.ensure_session():
+                self._report(url, False, "브라우저 세션 복구 실패", job['started'])
+                return
+
+            self._emit(f"📝 [{job['idx']+1}] 블로그 글 작성 및 발행 중...")
+            if self.bot.write_blog_post(product_info['title'], ai_result, image_files, url):
+                self._report(url, True, "블로그 글 발행 완료! 🎉", job['started'])
+            else:
+                self._report(url, False, "블로그 글 작성 실패", job['started'])
+
+        except Exception as e:
+            self._report(url, False, f"오류 발생: {str(e)}", job['started'])
+        finally:
+            job['workspace'].cleanup()
+
+    def run(self, urls):
+        """
+        파이프라인 실행
+
+        Args:
+            urls: 쇼핑 URL 리스트
+        """
+        total = len(urls)
+        pending = deque()  # 준비 중/준비 완료된 글 (최대 max_ahead + 1개)
+
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            for idx, url in enumerate(urls):
+                started = time.time()
+                self._emit(f"\n📌 [{idx+1}/{total}] 제품 정보 추출: {url}")
+
+                try:
+                    if self.ensure_session and not self.ensure_session():
+                        self._report(url, False, "브라우저 세션 복구 실패", started)
+                        continue
+
+                    product_info = self.bot.extract_product_info(url)
+                except Exception as e:
+                    self._report(url, False, f"오류 발생: {str(e)}", started)
+                    continue
+
+                if not product_info:
+                    self._report(url, False, "제품 정보 추출 실패", started)
+                    continue
+
+                self._emit(f"✅ [{idx+1}] 제품명: {product_info['title'][:50]}... (다운로드/AI 생성 시작)")
+                # 글마다 고유 작업 폴더 (동시에 준비되는 글끼리 파일명 충돌 방지)
+                workspace = JobWorkspace(self.bot.temp_images_dir, label=f"post{idx+1}")
+                pending.append({
+                    'idx': idx,
+                    'url': url,
+                    'started': started,
+                    'product_info': product_info,
+                    'workspace': workspace,
+                    'future': executor.submit(self._prepare, product_info, workspace)
+                })
+
+                # 대기열이 차면 가장 오래된 글 작성 (그동안 다음 글은 워커에서 준비)
+                while len(pending) > self.max_ahead:
+                    self._write(pending.popleft())
+
+            # 남은 글 모두 작성
+            while pending:
+                self._write(pending.popleft())
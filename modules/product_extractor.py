@@ -5,22 +5,38 @@
 - 상세 설명 이미지 추출 (Vision API용) ⭐ 신규
 """
 
-import time
 import re
 from selenium.webdriver.common.by import By
 
+from .ai_cache import product_id_from_url
+from .dom_snapshot import DomSnapshot, TITLE_SELECTORS
+from .http_extractor import HttpProductExtractor
+from .image_selection import collect_detail_images, select_detail_images
+from .waits import Waits
+
 
 class ProductExtractor:
     """상품 정보 추출 클래스"""
     
-    def __init__(self, driver):
+    # 상세 이미지 우선 사용 개수 / 후보 최대 개수 (중복/배너 제외 후 다운로드 단계에서 10개 선택)
+    DETAIL_IMAGE_LIMIT = 10
+    MAX_DETAIL_CANDIDATES = 30
+    
+    def __init__(self, driver, use_snapshot=True, use_http=True, timing_profile='normal'):
         """
         초기화
         
         Args:
             driver: Selenium WebDriver 객체
+            use_snapshot: DOM 스냅샷(스크립트 1회 호출) 방식 사용 여부
+                          (실패하거나 값이 비면 셀렉터 방식으로 대체)
+            use_http: 브라우저 없이 HTTP로 먼저 추출 시도 (실패 시 브라우저 사용)
+            timing_profile: 실행 속도 프로필 ('fast' / 'normal' / 'slow')
         """
         self.driver = driver
+        self.waits = Waits(driver, timing_profile)
+        self.use_snapshot = use_snapshot
+        self.http_extractor = HttpProductExtractor() if use_http else None
     
     def extract_product_info(self, shopping_url):
         """
@@ -36,49 +52,65 @@ class ProductExtractor:
                 'description': 텍스트 설명,
                 'images': 대표 이미지 URL 리스트,
                 'detail_images': 상세 설명 이미지 URL 리스트, ⭐ 신규
-                'link': 원본 URL
+                'link': 원본 URL,
+                'product_id': 상품 번호 (리다이렉트된 최종 URL 기준, 없으면 None)
             }
         """
         print(f"\n📦 제품 정보 추출 중...")
         print(f"   URL: {shopping_url}")
         
+        # 브라우저 없이 먼저 시도 (페이지 로드/대기 시간 없음)
+        if self.http_extractor:
+            product_info = self.http_extractor.extract(shopping_url)
+            if product_info:
+                self._print_summary(product_info)
+                return product_info
+            print("   ↩️ 브라우저 방식으로 대체")
+        
         try:
             # URL 접근
             if 'naver.me' in shopping_url:
                 print("   🔄 짧은 URL 리다이렉트 확인...")
                 self.driver.get(shopping_url)
-                time.sleep(3)
+                self.waits.until(lambda: 'naver.me' not in self.driver.current_url, 10, "리다이렉트")
                 final_url = self.driver.current_url
                 print(f"   ✅ 리다이렉트: {final_url}")
-                time.sleep(3)
             else:
                 print(f"   🔄 URL 접근 중...")
                 self.driver.get(shopping_url)
-                time.sleep(5)
-                print(f"   ✅ 페이지 로드 완료")
             
-            # 제품 정보 추출
-            title = self._extract_title()
-            price = self._extract_price()
-            description = self._extract_description()
-            images = self._extract_images()
-            detail_images = self._extract_detail_images()  # ⭐ 신규
+            # 상품명이 그려질 때까지 대기 (고정 대기 없음)
+            self.waits.any_element(TITLE_SELECTORS, timeout=10)
+            print(f"   ✅ 페이지 로드 완료")
             
-            print(f"\n✅ 제품 정보 추출 완료:")
-            print(f"   - 제품명: {title[:50]}...")
-            print(f"   - 가격: {price}")
-            print(f"   - 텍스트 설명: {len(description)}자")
-            print(f"   - 대표 이미지: {len(images)}개")
-            print(f"   - 상세 이미지: {len(detail_images)}개")  # ⭐ 신규
+            # 제품 정보 추출 (스냅샷 우선, 비어 있는 항목만 셀렉터 방식으로 대체)
+            snapshot = self._capture_snapshot()
+            if snapshot:
+                title = snapshot.title() or self._extract_title()
+                price = snapshot.price() or self._extract_price()
+                description = snapshot.description() or self._extract_description()
+                images = snapshot.product_images() or self._extract_images()
+                detail_images = snapshot.detail_images(
+                    limit=self.DETAIL_IMAGE_LIMIT, max_candidates=self.MAX_DETAIL_CANDIDATES
+                ) or self._extract_detail_images()
+            else:
+                title = self._extract_title()
+                price = self._extract_price()
+                description = self._extract_description()
+                images = self._extract_images()
+                detail_images = self._extract_detail_images()  # ⭐ 신규
             
-            return {
+            product_info = {
                 'title': title,
                 'price': price,
                 'description': description,
                 'images': images,
                 'detail_images': detail_images,  # ⭐ 신규
-                'link': shopping_url
+                'link': shopping_url,
+                'product_id': product_id_from_url(self.driver.current_url)
             }
+            self._print_summary(product_info)
+            return product_info
             
         except Exception as e:
             print(f"❌ 제품 정보 추출 실패: {e}")
@@ -86,6 +118,33 @@ class ProductExtractor:
             traceback.print_exc()
             return None
     
+    def _print_summary(self, product_info):
+        """추출 결과 요약 출력"""
+        print(f"\n✅ 제품 정보 추출 완료:")
+        print(f"   - 제품명: {product_info['title'][:50]}...")
+        print(f"   - 가격: {product_info['price']}")
+        print(f"   - 텍스트 설명: {len(product_info['description'])}자")
+        print(f"   - 대표 이미지: {len(product_info['images'])}개")
+        print(f"   - 상세 이미지: {len(product_info['detail_images'])}개")  # ⭐ 신규
+    
+    def _capture_snapshot(self):
+        """
+        DOM 스냅샷 수집 (실패 시 None → 셀렉터 방식 사용)
+        
+        Returns:
+            DomSnapshot: 스냅샷
+        """
+        if not self.use_snapshot:
+            return None
+        
+        try:
+            snapshot = DomSnapshot.capture(self.driver)
+            print(f"   ⚡ DOM 스냅샷 수집 완료 (썸네일 {snapshot.thumbnail_count()}개)")
+            return snapshot
+        except Exception as e:
+            print(f"   ⚠️ DOM 스냅샷 실패 - 셀렉터 방식 사용: {e}")
+            return None
+    
     def _extract_title(self):
         """제품명 추출"""
         selectors = [
@@ -183,7 +242,7 @@ class ProductExtractor:
                 for idx, thumbnail in enumerate(thumbnails[:6]):  # 최대 6개
                     try:
                         thumbnail.click()
-                        time.sleep(0.8)
+                        self.waits.pause(0.8)
                         
                         # 메인 이미지 찾기
                         selectors = [
@@ -258,73 +317,21 @@ class ProductExtractor:
         """
         상세 설명 이미지 URL 추출 ⭐ 신규 기능
         Vision API로 분석할 이미지들
+        (JavaScript 1회 호출로 수집 → 점수 기반으로 항상 같은 순서로 선택)
         
         Returns:
-            list: 상세 설명 이미지 URL 리스트
+            list: 상세 설명 이미지 URL 리스트 (앞 10개는 페이지 순서, 나머지는 보충 후보)
         """
         print("   📸 상세 설명 이미지 수집 중...")
-        detail_image_urls = []
         
         try:
-            # 상세 설명 영역의 이미지들 찾기
-            selectors = [
-                'div.se-main-container img',  # 상세정보 메인 영역의 이미지
-                'div.se-viewer img',           # 백업
-                'div.nKuwJ img',               # 추가 셀렉터
-                'div._3cWR_0Clkt img',         # 추가 셀렉터
-            ]
-            
-            collected_urls = set()  # 중복 제거용
-            
-            for selector in selectors:
-                try:
-                    images = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    
-                    for img in images:
-                        try:
-                            src = img.get_attribute('src')
-                            
-                            # 유효한 이미지 URL만 수집
-                            if src and src.startswith('http'):
-                                # 작은 아이콘 제외 (width/height 체크)
-                                width = img.get_attribute('width')
-                                height = img.get_attribute('height')
-                                
-                                # 너무 작은 이미지는 아이콘일 가능성이 높으므로 제외
-                                if width and height:
-                                    try:
-                                        w = int(width.replace('px', ''))
-                                        h = int(height.replace('px', ''))
-                                        if w < 100 or h < 100:
-                                            continue
-                                    except:
-                                        pass
-                                
-                                # 고화질 변환
-                                if '?type=' in src:
-                                    src = src.split('?type=')[0] + '?type=f640'
-                                
-                                collected_urls.add(src)
-                                
-                        except Exception as e:
-                            continue
-                    
-                    # 충분히 수집했으면 중단
-                    if len(collected_urls) >= 15:
-                        break
-                        
-                except Exception as e:
-                    print(f"      ⚠️ {selector} 에서 이미지 추출 실패: {e}")
-                    continue
-            
-            detail_image_urls = list(collected_urls)
-            print(f"   ✅ 총 {len(detail_image_urls)}개 상세 이미지 추출 완료")
-            
-            # 처음 10개만 반환 (토큰 절약)
-            if len(detail_image_urls) > 10:
-                print(f"   ℹ️  토큰 절약을 위해 처음 10개만 사용")
-                return detail_image_urls[:10]
+            infos = collect_detail_images(self.driver)
+            detail_image_urls = select_detail_images(
+                infos, limit=self.DETAIL_IMAGE_LIMIT, max_candidates=self.MAX_DETAIL_CANDIDATES
+            )
+            print(f"   ✅ 총 {len(infos)}개 이미지 중 {len(detail_image_urls)}개 상세 이미지 후보 선택")
             
+            # 10개 제한은 다운로드 단계에서 적용 (중복/배너를 뺀 뒤 앞에서부터 10개 사용)
             return detail_image_urls
             
         except Exception as e:
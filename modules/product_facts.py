@@ -0,0 +1,237 @@
+"""
+상품 사실 정보 모듈 (2단계 생성의 1단계)
+- Vision으로 상세 이미지에서 제품 사실 정보(스펙/소재/기능/구성품 등)만 JSON으로 추출
+- 상품 번호별로 저장 → 재발행/재시도/다른 관점 글은 이미지 단계 없이 텍스트만으로 작성
+- 배송/이벤트/회사 소개 등 제품 외 정보는 추출 단계에서 제외
+"""
+
+import re
+import json
+import hashlib
+
+from .ai_cache import AICache, product_key
+from .gemini_client import GeminiClient
+from .utils import get_app_data_dir
+
+
+# 추출 형식이 바뀌면 올려서 이전 저장값을 쓰지 않도록
+FACTS_VERSION = 1
+
+# 목록형 항목 (키 → 글쓰기 프롬프트에 보일 이름)
+FACT_FIELDS = {
+    'specs': '스펙',
+    'materials': '소재',
+    'features': '기능/특징',
+    'components': '구성품',
+    'usage': '사용 방법/활용',
+    'design': '디자인/색상',
+    'cautions': '주의사항/제약',
+}
+
+
+def parse_facts(text):
+    """
+    추출 응답(JSON)을 사실 정보 dict로 정리
+
+    Args:
+        text: Gemini 응답 텍스트 (JSON 또는 ```json 블록)
+
+    Returns:
+        dict: {'product_type': str, 'specs': [{'name', 'value'}], 'materials': [str], ...}
+              (파싱 실패거나 내용이 없으면 None)
+    """
+    match = re.search(r'```(?:json)?\s*(\{.*\})\s*```', text, re.DOTALL)
+    raw = match.group(1) if match else text[text.find('{'):text.rfind('}') + 1]
+    try:
+        data = json.loads(raw)
+    except ValueError as e:
+        print(f"   ⚠️ 사실 정보 JSON 파싱 실패: {e}")
+        return None
+    if not isinstance(data, dict):
+        return None
+
+    facts = {'product_type': str(data.get('product_type') or '').strip()}
+    for field in FACT_FIELDS:
+        items = []
+        for item in _as_list(data.get(field), field):
+            if field == 'specs' and isinstance(item, dict):
+                name = str(item.get('name') or '').strip()
+                value = str(item.get('value') or '').strip()
+                if value:
+                    items.append({'name': name, 'value': value})
+            elif isinstance(item, str) and item.strip():
+                items.append(item.strip())
+        facts[field] = items
+
+    if not any(facts[field] for field in FACT_FIELDS):
+        return None
+    return facts
+
+
+def _as_list(value, field):
+    """
+    항목 값을 리스트로 (모델이 리스트 대신 문자열 하나/객체 하나를 주는 경우)
+
+    문자열을 그대로 돌면 글자 하나씩 항목이 되므로 [문자열]로 감싸고,
+    객체는 specs일 때만 [객체], 그 밖의 값은 무시
+    """
+    if isinstance(value, list):
+        return value
+    if isinstance(value, str):
+        return [value]
+    if isinstance(value, dict) and field == 'specs':
+        return [value]
+    return []
+
+
+def format_facts(facts):
+    """
+    사실 정보를 글쓰기 프롬프트에 넣을 텍스트로 변환
+
+    Args:
+        facts: parse_facts() 결과
+
+    Returns:
+        str: 항목별 목록 텍스트
+    """
+    lines = []
+    if facts.get('product_type'):
+        lines.append(f"- 제품 종류: {facts['product_type']}")
+    for field, label in FACT_FIELDS.items():
+        items = facts.get(field) or []
+        if not items:
+            continue
+        lines.append(f"- {label}:")
+        for item in items:
+            if isinstance(item, dict):
+                lines.append(f"  · {item['name']}: {item['value']}" if item['name'] else f"  · {item['value']}")
+            else:
+                lines.append(f"  · {item}")
+    return '\n'.join(lines)
+
+
+class ProductFactStore(AICache):
+    """상품별 사실 정보 저장소 (AI 응답 캐시와 별도 폴더, 유효 기간 30일)"""
+
+    _shared = None
+
+    def __init__(self, cache_dir=None, ttl=30 * 24 * 3600, max_entries=2000, max_bytes=20 * 1024 * 1024):
+        """
+        초기화
+
+        Args:
+            cache_dir: 저장 폴더 (기본: ColdAPP 데이터 폴더/product_facts)
+            ttl: 유효 기간(초, 상세 페이지가 바뀌었을 수 있으므로 기간이 지나면 다시 추출)
+            max_entries: 최대 저장 개수
+            max_bytes: 최대 저장 용량(바이트)
+        """
+        super().__init__(cache_dir or get_app_data_dir('product_facts'), ttl, max_entries, max_bytes)
+
+    @staticmethod
+    def key_for(product_info):
+        """
+        상품별 저장 키 (상품 번호 기준, 모델/프롬프트/작성 관점과 무관)
+
+        Args:
+            product_info: 제품 정보 dict
+
+        Returns:
+            str: 키 (sha256 hex)
+        """
+        raw = f"facts:v{FACTS_VERSION}:{product_key(product_info)}"
+        return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+
+class ProductFactExtractor:
+    """상세 이미지 → 제품 사실 정보 추출 (상품별 저장, 있으면 재사용)"""
+
+    def __init__(self, router, store=None):
+        """
+        초기화
+
+        Args:
+            router: ModelRouter ('facts' 작업으로 요청)
+            store: ProductFactStore (기본: 공유 저장소)
+        """
+        self.router = router
+        self.store = store or ProductFactStore.shared()
+
+    def lookup(self, product_info, bypass=False):
+        """
+        저장된 사실 정보 (없거나 기간이 지났으면 None)
+
+        Args:
+            product_info: 제품 정보 dict
+            bypass: True면 읽지 않고 None (다시 추출하도록)
+
+        Returns:
+            dict: 사실 정보 또는 None
+        """
+        return self.store.get(self.store.key_for(product_info), bypass=bypass)
+
+    def extract(self, product_info, detail_images):
+        """
+        상세 이미지에서 사실 정보 추출 후 저장
+
+        Args:
+            product_info: 제품 정보 dict
+            detail_images: 전처리된 상세 이미지(타일) 리스트
+
+        Returns:
+            dict: 사실 정보 (추출 실패면 None)
+        """
+        print(f"   🔍 상세 이미지 {len(detail_images)}개에서 제품 정보 추출 중...")
+        prompt = self._build_prompt(product_info, len(detail_images))
+        try:
+            response = self.router.generate(
+                'facts', [prompt] + list(detail_images),
+                generation_config=GeminiClient.generation_config(
+                    temperature=0.2, response_mime_type='application/json'
+                )
+            )
+            facts = parse_facts(response.text)
+        except Exception as e:
+            print(f"   ⚠️ 제품 정보 추출 실패: {e}")
+            return None
+
+        if not facts:
+            print(f"   ⚠️ 추출된 제품 정보 없음")
+            return None
+
+        count = sum(len(facts[field]) for field in FACT_FIELDS)
+        print(f"   ✅ 제품 정보 {count}개 항목 추출 (상품별 저장)")
+        self.store.set(self.store.key_for(product_info), facts)
+        return facts
+
+    def _build_prompt(self, product_info, image_count):
+        """사실 정보 추출 프롬프트"""
+        fields = '\n'.join(f"- {field}: {label}" for field, label in FACT_FIELDS.items())
+        return f"""
+첨부된 {image_count}개의 이미지는 아래 제품의 상세 페이지 설명 이미지입니다.
+(세로로 긴 이미지는 위에서부터 순서대로 잘라낸 조각이므로 이어서 읽으세요.)
+
+제품명: {product_info.get('title', '')}
+
+이미지에 실제로 적혀 있거나 보이는 제품 자체의 사실 정보만 추출하세요.
+- 포함: 기능, 특징, 스펙(크기/무게/용량/전력/소재 등 수치는 단위까지), 구성품, 사용 방법, 디자인/색상, 주의사항
+- 제외: 배송/반품/교환 안내, 이벤트/할인/쿠폰, 회사 소개/브랜드 스토리, 고객센터/AS 연락처,
+  구매/결제 방법, 상품평/리뷰 스크린샷
+- 이미지에 없는 내용은 추측하지 말고 비워 두세요.
+
+항목:
+- product_type: 제품 종류 (예: 가습기)
+{fields}
+(specs는 {{"name", "value"}} 객체 리스트, 나머지는 짧은 문장/구절 문자열 리스트)
+
+아래 JSON 형식으로만 출력하세요 (주석 없이):
+{{
+  "product_type": "가습기",
+  "specs": [{{"name": "용량", "value": "5L"}}, {{"name": "소음", "value": "25dB"}}],
+  "materials": ["BPA-free 트라이탄 물통"],
+  "features": ["자연기화식으로 백화현상 없음"],
+  "components": ["본체", "필터 2개"],
+  "usage": ["물통을 분리해 윗면으로 급수"],
+  "design": ["화이트/그레이 2가지 색상"],
+  "cautions": ["필터는 2주마다 세척 필요"]
+}}
+"""
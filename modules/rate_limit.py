@@ -0,0 +1,198 @@
+"""
+Gemini 호출 보호 모듈
+- TokenBucket: API 키별 분당 요청 수 제한 (여러 스레드가 같은 키를 써도 할당량 안에서)
+- CircuitBreaker: 모델이 연속으로 실패하면 잠시 요청 중단 (실패가 쌓이지 않도록 바로 다음 모델로)
+- backoff_delay: 지터를 넣은 지수 백오프 대기 시간
+- is_transient_error: 잠시 후 다시 하면 될 오류인지 (429/500/503/504, 시간 초과)
+"""
+
+import time
+import random
+import threading
+
+
+# 잠시 후 다시 시도할 오류 (google.api_core 예외 이름 / HTTP 상태 코드)
+TRANSIENT_ERRORS = (
+    'ResourceExhausted', 'TooManyRequests', 'ServiceUnavailable',
+    'DeadlineExceeded', 'GatewayTimeout', 'InternalServerError', 'Timeout', 'CircuitOpen'
+)
+TRANSIENT_CODES = ('429', '500', '503', '504')
+
+
+class CircuitOpenError(Exception):
+    """모델이 연속 실패로 잠시 차단된 상태"""
+
+
+def is_transient_error(error):
+    """
+    잠시 후 다시 하거나 다른 모델로 넘기면 될 오류인지 (할당량/과부하/시간 초과)
+
+    Args:
+        error: 발생한 예외
+
+    Returns:
+        bool: 일시적인 오류면 True
+    """
+    if isinstance(error, (TimeoutError, CircuitOpenError)):
+        return True
+    name = type(error).__name__
+    if any(key in name for key in TRANSIENT_ERRORS):
+        return True
+    try:
+        code = str(int(getattr(error, 'code', None)))
+    except (TypeError, ValueError):
+        code = ''
+    message = str(error)
+    return any(c == code or message.startswith(c) for c in TRANSIENT_CODES) or 'quota' in message.lower()
+
+
+def is_quota_error(error):
+    """할당량 초과(429) 오류인지"""
+    name = type(error).__name__
+    message = str(error)
+    return ('ResourceExhausted' in name or 'TooManyRequests' in name
+            or message.startswith('429') or 'quota' in message.lower())
+
+
+def backoff_delay(attempt, base=1.0, cap=30.0):
+    """
+    지수 백오프 + 전체 지터 (여러 스레드가 동시에 다시 몰리지 않도록)
+
+    Args:
+        attempt: 재시도 순번 (0부터)
+        base: 첫 대기 기준(초)
+        cap: 최대 대기(초)
+
+    Returns:
+        float: 대기 시간(초)
+    """
+    return random.uniform(0, min(cap, base * (2 ** attempt)))
+
+
+class TokenBucket:
+    """분당 요청 수 제한 (토큰 버킷)"""
+
+    def __init__(self, per_minute=60, burst=None):
+        """
+        초기화
+
+        Args:
+            per_minute: 분당 허용 요청 수
+            burst: 한 번에 몰아서 보낼 수 있는 최대 요청 수 (기본: 분당 허용량의 1/6, 최소 1)
+        """
+        self._lock = threading.Lock()
+        self.configure(per_minute, burst)
+
+    def configure(self, per_minute, burst=None):
+        """
+        허용량 변경 (남은 토큰은 새 최대치에 맞춤)
+
+        Args:
+            per_minute: 분당 허용 요청 수
+            burst: 최대 몰아 보내기 수
+        """
+        with self._lock:
+            self.per_minute = per_minute
+            self.capacity = burst or max(1, per_minute // 6)
+            self._rate = per_minute / 60.0
+            self._tokens = float(self.capacity)
+            self._updated = time.monotonic()
+
+    def _refill(self):
+        """지난 시간만큼 토큰 채우기 (잠금 안에서 호출)"""
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self._rate)
+        self._updated = now
+
+    def acquire(self, timeout=None):
+        """
+        요청 1개 허가 받기 (토큰이 없으면 생길 때까지 대기)
+
+        Args:
+            timeout: 최대 대기 시간(초, None이면 무제한)
+
+        Returns:
+            bool: 허가 받으면 True, 시간 안에 못 받으면 False
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return True
+                wait = (1 - self._tokens) / self._rate
+            if deadline is not None and time.monotonic() + wait > deadline:
+                return False
+            time.sleep(wait)
+
+    def drain(self):
+        """할당량 초과 응답을 받으면 남은 토큰 비우기 (같은 키를 쓰는 다른 스레드도 같이 쉼)"""
+        with self._lock:
+            self._refill()
+            self._tokens = min(self._tokens, 0.0)
+
+
+class CircuitBreaker:
+    """연속 실패 시 일정 시간 요청 차단 (이후 1건 시험 요청으로 복구 확인)"""
+
+    def __init__(self, failure_threshold=5, reset_timeout=60):
+        """
+        초기화
+
+        Args:
+            failure_threshold: 이 횟수만큼 연속 실패하면 차단
+            reset_timeout: 차단 후 시험 요청까지 대기 시간(초)
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at = None
+        self._trial_running = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self):
+        """'closed' (정상) / 'open' (차단) / 'half_open' (시험 요청 가능)"""
+        if self.opened_at is None:
+            return 'closed'
+        if time.monotonic() - self.opened_at >= self.reset_timeout:
+            return 'half_open'
+        return 'open'
+
+    def before_call(self):
+        """
+        요청 전 확인 (차단 중이면 CircuitOpenError)
+
+        Raises:
+            CircuitOpenError: 차단 중이거나 다른 스레드가 시험 요청 중
+        """
+        with self._lock:
+            state = self.state
+            if state == 'closed':
+                return
+            if state == 'half_open' and not self._trial_running:
+                self._trial_running = True
+                return
+            remaining = self.reset_timeout - (time.monotonic() - self.opened_at)
+            raise CircuitOpenError(f"연속 {self.failures}회 실패로 차단 중 (약 {max(0, remaining):.0f}초 후 재시도)")
+
+    def record_success(self):
+        """요청 성공 → 정상 상태로"""
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+            self._trial_running = False
+
+    def release(self):
+        """요청을 보내지 못했을 때 시험 요청 자리만 반납 (상태는 그대로)"""
+        with self._lock:
+            self._trial_running = False
+
+    def record_failure(self):
+        """요청 실패 → 연속 실패가 기준을 넘거나 시험 요청이 실패하면 차단"""
+        with self._lock:
+            self.failures += 1
+            if self._trial_running or self.failures >= self.failure_threshold:
+                self.opened_at = time.monotonic()
+            self._trial_running = False
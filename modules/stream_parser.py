@@ -0,0 +1,290 @@
+"""
+AI 본문 태그 파서 모듈
+- [QUOTE:VERTICAL] / [QUOTE:UNDERLINE] / [TEXT] / [IMAGE:x,y] / [LINK] 태그를 에디터 요소 dict로 변환
+- 조각(chunk) 단위로 넣으면 완성된 줄만 바로 요소로 반환 (스트리밍 응답을 받는 중에 에디터 입력 시작)
+- 본문 뒤 ```json 블록(강조 키워드)은 요소로 만들지 않고 따로 모아서 highlights로 제공
+- AIStream: Gemini 스트리밍 스레드 → 에디터 입력 스레드로 조각 전달
+  (스트림이 중간에 끊겨서 전체 본문을 다시 받으면 reset() → 입력 쪽은 StreamReset을 받고 전체 결과로 다시 작성)
+"""
+
+import json
+import queue
+import re
+import threading
+
+
+# 단점 섹션 감지 키워드
+DISADVANTAGE_KEYWORDS = ['아쉬운', '불편', '단점', '아쉽', '불만']
+
+JSON_BLOCK_PATTERN = re.compile(r'```json\s*(\{.*?\})\s*```', re.DOTALL)
+
+
+def parse_highlights(text):
+    """
+    AI 응답의 ```json 블록에서 강조 키워드 추출
+
+    Args:
+        text: AI 응답 전체 (또는 JSON 블록 부분)
+
+    Returns:
+        list: highlights 리스트 (없거나 파싱 실패면 빈 리스트)
+    """
+    match = JSON_BLOCK_PATTERN.search(text)
+    if not match:
+        return []
+    try:
+        return json.loads(match.group(1)).get('highlights', [])
+    except Exception as e:
+        print(f"   ⚠️ JSON 파싱 실패: {e}")
+        return []
+
+
+def parse_content(content, image_files, shopping_link):
+    """
+    AI 본문 전체를 한 번에 요소 리스트로 변환
+
+    Args:
+        content: AI 본문 (태그 포함)
+        image_files: 이미지 파일 경로 리스트 ([IMAGE:n]의 n번째)
+        shopping_link: [LINK] 자리에 넣을 쇼핑 링크
+
+    Returns:
+        list: 요소 dict 리스트
+    """
+    parser = ContentStreamParser(image_files, shopping_link)
+    return parser.feed(content) + parser.close()
+
+
+class ContentStreamParser:
+    """조각 단위로 받은 AI 본문을 에디터 요소로 변환 (줄이 완성되는 대로)"""
+
+    def __init__(self, image_files, shopping_link, transform=None):
+        """
+        초기화
+
+        Args:
+            image_files: 이미지 파일 경로 리스트
+            shopping_link: 쇼핑 링크
+            transform: 줄마다 적용할 후처리 함수 (예: 상투 문구 치환, 선택)
+        """
+        self.image_files = image_files
+        self.shopping_link = shopping_link
+        self.transform = transform
+
+        self._buffer = ''
+        self._pending_tag = None    # 다음 줄을 내용으로 받을 태그 ([TEXT], [QUOTE:...])
+        self._in_json = False
+        self._json_lines = []
+
+        # 섹션 추적
+        self.current_section = 'intro'  # 시작은 도입부
+        self.advantage_count = 0        # 장점 카운터
+        self.is_disadvantage = False    # 단점 섹션 플래그
+
+    @property
+    def json_text(self):
+        """지금까지 받은 ```json 블록 내용"""
+        return '\n'.join(self._json_lines)
+
+    @property
+    def highlights(self):
+        """JSON 블록의 강조 키워드 (블록이 끝나기 전이면 빈 리스트)"""
+        return parse_highlights(self.json_text)
+
+    def feed(self, chunk):
+        """
+        응답 조각 추가
+
+        Args:
+            chunk: 새로 받은 텍스트 조각
+
+        Returns:
+            list: 이번 조각으로 완성된 요소 dict 리스트
+        """
+        self._buffer += chunk
+        elements = []
+        while '\n' in self._buffer:
+            line, self._buffer = self._buffer.split('\n', 1)
+            element = self._handle_line(line)
+            if element:
+                elements.append(element)
+        return elements
+
+    def close(self):
+        """
+        응답 끝 (마지막 줄 처리)
+
+        Returns:
+            list: 남은 요소 dict 리스트
+        """
+        elements = []
+        if self._buffer:
+            line, self._buffer = self._buffer, ''
+            element = self._handle_line(line)
+            if element:
+                elements.append(element)
+        return elements
+
+    def _handle_line(self, raw_line):
+        """줄 1개 처리 → 완성된 요소 (없으면 None)"""
+        line = raw_line.strip()
+
+        # 강조 키워드 JSON 블록은 따로 모음
+        if self._in_json:
+            self._json_lines.append(raw_line)
+            if line.startswith('```'):
+                self._in_json = False
+            return None
+        if line.startswith('```json'):
+            self._in_json = True
+            self._json_lines.append(raw_line)
+            return None
+
+        if self.transform and line:
+            line = self.transform(line)
+
+        # 태그 바로 다음 줄 = 태그 내용
+        if self._pending_tag:
+            tag, self._pending_tag = self._pending_tag, None
+            return self._tag_element(tag, line)
+
+        if not line:
+            return None
+
+        if line in ('[QUOTE:VERTICAL]', '[QUOTE:UNDERLINE]', '[TEXT]'):
+            if line == '[QUOTE:UNDERLINE]':
+                self.advantage_count += 1
+                self.current_section = f'advantage_{self.advantage_count}'
+            self._pending_tag = line
+            return None
+
+        # [IMAGE:x,y] or [IMAGE:x]
+        if line.startswith('[IMAGE:'):
+            nums_str = line.replace('[IMAGE:', '').replace(']', '')
+            img_nums = [int(n.strip()) for n in nums_str.split(',') if n.strip().isdigit()]
+            img_files = [self.image_files[num - 1] for num in img_nums if 0 < num <= len(self.image_files)]
+            if not img_files:
+                return None
+            return {
+                'type': 'image',
+                'images': img_files,
+                'single': len(img_files) == 1,  # 단일 이미지 표시
+                'section': self.current_section
+            }
+
+        if line == '[LINK]':
+            return {
+                'type': 'text',
+                'content': self.shopping_link,
+                'section': 'conclusion'
+            }
+
+        return None
+
+    def _tag_element(self, tag, content):
+        """[QUOTE:...] / [TEXT] 태그 + 내용 줄 → 요소"""
+        # [QUOTE:VERTICAL] - 제목 인용구
+        if tag == '[QUOTE:VERTICAL]':
+            return {'type': 'quote', 'style': 'vertical', 'content': content, 'section': 'title'}
+
+        # [QUOTE:UNDERLINE] - 장점 인용구
+        if tag == '[QUOTE:UNDERLINE]':
+            return {'type': 'quote', 'style': 'underline', 'content': content, 'section': self.current_section}
+
+        # [TEXT] - 단점 섹션 감지 (키워드 기반)
+        if any(keyword in content for keyword in DISADVANTAGE_KEYWORDS):
+            self.is_disadvantage = True
+            section = 'disadvantage'
+        elif self.is_disadvantage:
+            # 단점 섹션 끝나고 마무리
+            self.is_disadvantage = False
+            section = 'conclusion'
+            self.current_section = 'conclusion'
+        elif self.advantage_count == 0:
+            # 장점 시작 전 = 도입부
+            section = 'intro'
+        else:
+            # 장점 섹션 유지
+            section = self.current_section
+
+        return {'type': 'text', 'content': content, 'section': section}
+
+
+class StreamReset(Exception):
+    """이미 보낸 조각은 버리고 최종 결과(stream.result())로 다시 작성해야 함"""
+
+
+class AIStream:
+    """Gemini 스트리밍 응답 조각 전달 통로 (생성 스레드 → 에디터 입력 스레드)"""
+
+    _END = object()
+    _RESET = object()
+
+    def __init__(self):
+        self._queue = queue.Queue()
+        self._done = threading.Event()
+        self._result = None
+        self._error = None
+
+    def put(self, chunk):
+        """응답 조각 전달 (생성 스레드)"""
+        if chunk:
+            self._queue.put(chunk)
+
+    def reset(self):
+        """
+        지금까지 보낸 조각 취소 (생성 스레드, 스트림이 중간에 끊겨 전체 본문을 다시 받을 때)
+        입력 스레드의 chunks()는 StreamReset을 일으키고, 새 본문은 finish()의 결과로 전달
+        """
+        self._queue.put(self._RESET)
+
+    def finish(self, result=None, error=None):
+        """
+        생성 종료 (생성 스레드, 성공/실패 모두 반드시 호출)
+
+        Args:
+            result: generate_ai_content 결과 dict (실패면 None)
+            error: 발생한 예외 (선택)
+        """
+        self._result = result
+        self._error = error
+        self._done.set()
+        self._queue.put(self._END)
+
+    def chunks(self, timeout=None):
+        """
+        응답 조각을 받는 대로 반환 (입력 스레드)
+
+        Args:
+            timeout: 다음 조각을 기다릴 최대 시간(초, None이면 무제한)
+
+        Yields:
+            str: 응답 조각
+
+        Raises:
+            TimeoutError: timeout 동안 새 조각이 없음
+            StreamReset: 생성 쪽에서 reset() 호출 (이미 받은 조각은 버리고 result()로 다시 작성)
+        """
+        while True:
+            try:
+                chunk = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                raise TimeoutError("AI 응답 스트림 대기 시간 초과")
+            if chunk is self._END:
+                return
+            if chunk is self._RESET:
+                raise StreamReset()
+            yield chunk
+
+    def result(self, timeout=None):
+        """
+        최종 결과 (생성이 끝날 때까지 대기)
+
+        Returns:
+            dict: generate_ai_content 결과 (실패면 None)
+        """
+        if not self._done.wait(timeout):
+            raise TimeoutError("AI 생성 결과 대기 시간 초과")
+        if self._error:
+            print(f"   ⚠️ AI 스트리밍 생성 실패: {self._error}")
+        return self._result
@@ -0,0 +1,133 @@
+"""
+텍스트 입력 모듈 (클립보드 없이)
+- OS 클립보드(pyperclip)는 컴퓨터 전체에 하나뿐이라 브라우저 여러 개를 동시에 돌리면 서로 덮어씀
+- 브라우저별로 입력 이벤트를 직접 보내서 입력
+  · cdp: Chrome DevTools Input.insertText (IME 입력과 같은 방식)
+  · script: document.execCommand('insertText') (포커스된 입력창/에디터)
+  · keys: WebDriver 키 입력 (느리지만 항상 동작)
+  · clipboard: 기존 방식 (pyperclip + Ctrl+V, 명시적으로 선택할 때만)
+- 여러 줄은 줄마다 입력 + Enter (붙여넣기와 같은 문단 구성)
+"""
+
+from selenium.webdriver.common.keys import Keys
+from selenium.webdriver.common.action_chains import ActionChains
+
+
+# 포커스된 요소(iframe 안 입력 버퍼 포함)의 문서에서 insertText 실행
+INSERT_TEXT_JS = """
+var doc = document;
+var active = doc.activeElement;
+while (active && active.tagName === 'IFRAME' && active.contentDocument) {
+    doc = active.contentDocument;
+    active = doc.activeElement;
+}
+if (!active || active === doc.body && !doc.body.isContentEditable) return false;
+return doc.execCommand('insertText', false, arguments[0]);
+"""
+
+# 포커스된 요소(iframe 안 입력 버퍼 포함)가 입력 가능한지 (cdp는 포커스가 없어도 오류 없이 무시되므로 먼저 확인)
+EDITABLE_FOCUS_JS = """
+var active = document.activeElement;
+while (active && active.tagName === 'IFRAME' && active.contentDocument) {
+    active = active.contentDocument.activeElement;
+}
+if (!active) return false;
+if (active.isContentEditable) return true;
+return (active.tagName === 'TEXTAREA' || active.tagName === 'INPUT') && !active.readOnly && !active.disabled;
+"""
+
+BACKENDS = ('auto', 'cdp', 'script', 'keys', 'clipboard')
+
+
+class TextInput:
+    """브라우저 1개 전용 텍스트 입력 (현재 커서 위치에 입력)"""
+
+    def __init__(self, driver, waits=None, backend='auto'):
+        """
+        초기화
+
+        Args:
+            driver: Selenium WebDriver
+            waits: Waits (줄 사이 짧은 대기용, 선택)
+            backend: 'auto' / 'cdp' / 'script' / 'keys' / 'clipboard'
+                     auto는 cdp → script → keys 순서로 처음 성공한 방식을 계속 사용
+        """
+        if backend not in BACKENDS:
+            print(f"   ⚠️ 알 수 없는 입력 방식 '{backend}' - auto 사용")
+            backend = 'auto'
+        self.driver = driver
+        self.waits = waits
+        self.backend = backend
+        self._working = None  # auto에서 성공한 방식
+
+    def insert(self, text):
+        """
+        텍스트 입력 (여러 줄이면 줄 사이에 Enter)
+
+        Args:
+            text: 입력할 텍스트
+        """
+        if not text:
+            return
+
+        if self.backend == 'clipboard':
+            # 여러 줄도 한 번에 붙여넣기 (기존 방식 그대로)
+            self._insert_clipboard(text)
+            return
+
+        lines = text.split('\n')
+        for index, line in enumerate(lines):
+            if line:
+                self._insert_line(line)
+            if index < len(lines) - 1:
+                ActionChains(self.driver).send_keys(Keys.ENTER).perform()
+                if self.waits:
+                    self.waits.pause(0.05)
+
+    def _insert_line(self, line):
+        """한 줄 입력 (auto면 성공하는 방식을 찾아서 기억)"""
+        if self.backend != 'auto':
+            if not self._try(self.backend, line):
+                raise RuntimeError(f"텍스트 입력 실패 ({self.backend})")
+            return
+
+        # 성공했던 방식 먼저, 실패하면 나머지 순서대로
+        candidates = ['cdp', 'script', 'keys']
+        if self._working:
+            candidates.remove(self._working)
+            candidates.insert(0, self._working)
+
+        for backend in candidates:
+            if self._try(backend, line):
+                if self._working != backend:
+                    self._working = backend
+                    print(f"   ⌨️ 텍스트 입력 방식: {backend}")
+                return
+        raise RuntimeError("텍스트 입력 실패 (모든 방식)")
+
+    def _try(self, backend, line):
+        """지정한 방식으로 한 줄 입력 (성공 여부)"""
+        try:
+            if backend == 'cdp':
+                if not hasattr(self.driver, 'execute_cdp_cmd'):
+                    return False
+                # 입력 위치가 없으면 보내지 않음 (auto면 script/keys로 넘어감)
+                if not self.driver.execute_script(EDITABLE_FOCUS_JS):
+                    return False
+                self.driver.execute_cdp_cmd('Input.insertText', {'text': line})
+                return True
+            if backend == 'script':
+                return bool(self.driver.execute_script(INSERT_TEXT_JS, line))
+            if backend == 'keys':
+                ActionChains(self.driver).send_keys(line).perform()
+                return True
+        except Exception as e:
+            print(f"   ⚠️ 텍스트 입력 실패 ({backend}): {e}")
+        return False
+
+    def _insert_clipboard(self, text):
+        """OS 클립보드 + Ctrl+V (동시 실행 불가)"""
+        import pyperclip
+
+        pyperclip.copy(text)
+        ActionChains(self.driver).key_down(Keys.CONTROL).send_keys('v').key_up(Keys.CONTROL).perform()
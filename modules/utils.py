@@ -3,12 +3,31 @@
 - 색상 선택
 - 텍스트 처리
 - 스타일 관련 헬퍼 함수
+- 앱 데이터 폴더 경로
 """
 
+import os
 import random
 import re
 
 
+def get_app_data_dir(*subdirs):
+    """
+    ColdAPP 데이터 폴더 경로 (없으면 생성)
+    Windows는 AppData\\Roaming\\ColdAPP, 그 외 OS는 ~/.config/ColdAPP
+    
+    Args:
+        *subdirs: 하위 폴더 이름들 (선택)
+        
+    Returns:
+        str: 폴더 절대 경로
+    """
+    base = os.getenv('APPDATA') or os.path.join(os.path.expanduser('~'), '.config')
+    path = os.path.join(base, 'ColdAPP', *subdirs)
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
 class StyleUtils:
     """스타일 관련 유틸리티 클래스"""
     
@@ -47,12 +66,13 @@ class StyleUtils:
             return random.choice(bg_colors)
     
     @staticmethod
-    def soft_avoid_phrases(text):
+    def soft_avoid_phrases(text, seen=None):
         """
         상투적인 문구를 동의어로 치환하여 자연스럽게 만들기
         
         Args:
             text: 원본 텍스트
+            seen: 줄 단위로 나눠 처리할 때 이미 등장한 그룹 번호 set (스트리밍, 선택)
             
         Returns:
             str: 처리된 텍스트
@@ -83,9 +103,9 @@ class StyleUtils:
             }
         ]
         
-        for group in groups:
+        for group_idx, group in enumerate(groups):
             pattern = re.compile('|'.join(re.escape(t) for t in group['targets']))
-            cnt = {'n': 0}
+            cnt = {'n': 1 if seen is not None and group_idx in seen else 0}
             
             def repl(m):
                 cnt['n'] += 1
@@ -95,6 +115,8 @@ class StyleUtils:
                 return random.choice(group['alts'])
             
             text = pattern.sub(repl, text)
+            if seen is not None and cnt['n']:
+                seen.add(group_idx)
         
         return text
     
@@ -0,0 +1,174 @@
+"""
+Vision 이미지 전처리 모듈
+- 상세 이미지를 Gemini에 보내기 전에 축소/분할/재압축
+- 스마트스토어 상세 이미지(860×10000px 이상 세로 이미지)는 여러 장의 타일로 분할
+- 거의 빈(단색) 타일은 제외
+- JPEG/WebP로 다시 압축해서 업로드 크기·지연·토큰 비용 절감
+- 타일 개수/크기/화질 예산은 요청마다 지정 가능
+"""
+
+import io
+import os
+
+from PIL import Image, ImageStat
+
+
+class VisionPreprocessor:
+    """Gemini Vision 업로드용 이미지 전처리 클래스"""
+
+    # 기본 예산 (요청마다 일부만 덮어쓸 수 있음)
+    DEFAULTS = {
+        'max_long_edge': 1536,   # 일반 이미지의 긴 변 최대 길이(px)
+        'tile_width': 768,       # 세로로 긴 이미지의 타일 가로 길이(px)
+        'tile_height': 1536,     # 타일 세로 길이(px)
+        'tile_overlap': 48,      # 타일 경계에서 글자가 잘리지 않도록 겹치는 길이(px)
+        'max_aspect': 2.5,       # 세로/가로 비율이 이보다 크면 타일로 분할
+        'max_tiles': 16,         # 요청 1회당 최대 이미지(타일) 개수
+        'max_total_bytes': 4 * 1024 * 1024,  # 요청 1회당 최대 이미지 용량
+        'blank_stddev': 6.0,     # 밝기 표준편차가 이보다 작으면 빈 타일로 보고 제외
+        'format': 'JPEG',        # 'JPEG' 또는 'WEBP'
+        'quality': 80
+    }
+
+    def __init__(self, **budget):
+        """
+        초기화
+
+        Args:
+            **budget: DEFAULTS 중 덮어쓸 항목 (예: max_tiles=8, format='WEBP')
+        """
+        unknown = set(budget) - set(self.DEFAULTS)
+        if unknown:
+            raise ValueError(f"알 수 없는 전처리 옵션: {', '.join(sorted(unknown))}")
+
+        self.budget = dict(self.DEFAULTS)
+        self.budget.update(budget)
+        self.budget['format'] = self.budget['format'].upper()
+
+    def prepare(self, image_paths):
+        """
+        이미지 파일들을 Gemini 업로드용 데이터로 변환
+
+        Args:
+            image_paths: 이미지 파일 경로 리스트 (순서 유지)
+
+        Returns:
+            list: [{'mime_type': ..., 'data': bytes}, ...] (generate_content에 그대로 전달 가능)
+        """
+        b = self.budget
+        parts = []
+        total_bytes = 0
+        original_bytes = 0
+        skipped_blank = 0
+
+        for path in image_paths:
+            if len(parts) >= b['max_tiles']:
+                break
+
+            try:
+                with Image.open(path) as img:
+                    img.load()
+                    original_bytes += self._file_size(path)
+                    tiles = self._split(self._to_rgb(img))
+            except Exception as e:
+                print(f"      ⚠️ 이미지 전처리 실패 ({path}): {e}")
+                continue
+
+            for tile in tiles:
+                if len(parts) >= b['max_tiles']:
+                    break
+                if self._is_blank(tile):
+                    skipped_blank += 1
+                    continue
+
+                part = self._encode(tile)
+                if total_bytes + len(part['data']) > b['max_total_bytes']:
+                    print(f"      ⚠️ 이미지 용량 예산 초과 - 나머지 타일 제외")
+                    return self._finish(parts, total_bytes, original_bytes, skipped_blank)
+
+                parts.append(part)
+                total_bytes += len(part['data'])
+
+        return self._finish(parts, total_bytes, original_bytes, skipped_blank)
+
+    def _finish(self, parts, total_bytes, original_bytes, skipped_blank):
+        """전처리 결과 로그 출력"""
+        print(f"   🗜️ Vision 전처리: 타일 {len(parts)}개, "
+              f"{original_bytes // 1024}KB → {total_bytes // 1024}KB"
+              + (f", 빈 타일 {skipped_blank}개 제외" if skipped_blank else ""))
+        return parts
+
+    @staticmethod
+    def _file_size(path):
+        """파일 크기 (실패 시 0)"""
+        try:
+            return os.path.getsize(path)
+        except OSError:
+            return 0
+
+    @staticmethod
+    def _to_rgb(img):
+        """투명 배경은 흰색으로 채우고 RGB로 변환"""
+        if img.mode in ('RGBA', 'LA') or (img.mode == 'P' and 'transparency' in img.info):
+            rgba = img.convert('RGBA')
+            background = Image.new('RGB', rgba.size, (255, 255, 255))
+            background.paste(rgba, mask=rgba.split()[-1])
+            return background
+        if img.mode != 'RGB':
+            return img.convert('RGB')
+        return img.copy()
+
+    def _split(self, img):
+        """
+        축소 + (세로로 긴 이미지는) 타일 분할
+
+        Returns:
+            list: PIL.Image 리스트 (위에서 아래 순서)
+        """
+        b = self.budget
+        width, height = img.size
+
+        # 일반 비율 이미지: 긴 변 기준 축소만
+        if height <= width * b['max_aspect']:
+            scale = min(1.0, b['max_long_edge'] / max(width, height))
+            if scale < 1.0:
+                img = img.resize((max(1, int(width * scale)), max(1, int(height * scale))), Image.LANCZOS)
+            return [img]
+
+        # 세로로 긴 이미지: 가로를 tile_width로 맞춘 뒤 위에서부터 잘라냄
+        scale = min(1.0, b['tile_width'] / width)
+        if scale < 1.0:
+            img = img.resize((max(1, int(width * scale)), max(1, int(height * scale))), Image.LANCZOS)
+        width, height = img.size
+
+        tile_height = b['tile_height']
+        step = max(1, tile_height - b['tile_overlap'])
+        tiles = []
+        top = 0
+        while top < height:
+            bottom = min(top + tile_height, height)
+            # 마지막 자투리가 너무 짧으면 앞 타일과 겹치게 당겨서 자름
+            if bottom - top < tile_height // 4 and tiles:
+                top = max(0, bottom - tile_height)
+            tiles.append(img.crop((0, top, width, bottom)))
+            if bottom >= height:
+                break
+            top += step
+        return tiles
+
+    def _is_blank(self, tile):
+        """여백/단색 배경만 있는 타일인지 확인"""
+        stddev = ImageStat.Stat(tile.convert('L')).stddev[0]
+        return stddev < self.budget['blank_stddev']
+
+    def _encode(self, tile):
+        """타일을 JPEG/WebP로 압축"""
+        fmt = self.budget['format']
+        buffer = io.BytesIO()
+        if fmt == 'WEBP':
+            tile.save(buffer, format='WEBP', quality=self.budget['quality'], method=4)
+            mime_type = 'image/webp'
+        else:
+            tile.save(buffer, format='JPEG', quality=self.budget['quality'], optimize=True, progressive=True)
+            mime_type = 'image/jpeg'
+        return {'mime_type': mime_type, 'data': buffer.getvalue()}
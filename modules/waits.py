@@ -0,0 +1,237 @@
+"""
+대기 모듈
+- 고정 time.sleep 대신 조건이 충족될 때까지만 기다림 (WebDriverWait 기반)
+  (페이지 로드, 요소 표시, 에디터 준비, 이미지 업로드 완료, DOM/네트워크 안정)
+- 단계별 타임아웃
+- 실행 속도 프로필 (fast / normal / slow): 느린 PC는 slow로 대기 시간 늘리기
+"""
+
+import time
+
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.common.exceptions import TimeoutException
+
+
+class TimingProfile:
+    """실행 속도 프로필"""
+
+    # pause_scale: 키 입력 사이 짧은 대기 배율 / timeout_scale: 조건 대기 최대 시간 배율
+    PROFILES = {
+        'fast': {'pause_scale': 0.5, 'timeout_scale': 0.75, 'poll': 0.05},
+        'normal': {'pause_scale': 1.0, 'timeout_scale': 1.0, 'poll': 0.1},
+        'slow': {'pause_scale': 1.8, 'timeout_scale': 2.0, 'poll': 0.2},
+    }
+
+    def __init__(self, name='normal'):
+        """
+        초기화
+
+        Args:
+            name: 'fast' / 'normal' / 'slow' (알 수 없는 값은 normal)
+        """
+        if name not in self.PROFILES:
+            print(f"   ⚠️ 알 수 없는 속도 프로필 '{name}' - normal 사용")
+            name = 'normal'
+        self.name = name
+        self.pause_scale = self.PROFILES[name]['pause_scale']
+        self.timeout_scale = self.PROFILES[name]['timeout_scale']
+        self.poll = self.PROFILES[name]['poll']
+
+    @classmethod
+    def get(cls, profile):
+        """이름 또는 TimingProfile → TimingProfile"""
+        if isinstance(profile, cls):
+            return profile
+        return cls(profile or 'normal')
+
+
+# 에디터 안 이미지 요소 (단일/콜라주/슬라이드)
+EDITOR_IMAGE_SELECTOR = '.se-component.se-image, .se-component.se-imageGroup, .se-component.se-imageStrip'
+
+# MutationObserver를 한 번 설치하고 마지막 변경 시각을 기록
+_DOM_QUIET_JS = """
+if (!window.__coldappLastMutation) {
+    window.__coldappLastMutation = Date.now();
+    new MutationObserver(function() { window.__coldappLastMutation = Date.now(); })
+        .observe(document.documentElement, {childList: true, subtree: true, attributes: true, characterData: true});
+}
+return Date.now() - window.__coldappLastMutation;
+"""
+
+_RESOURCE_COUNT_JS = """
+return [document.readyState, performance.getEntriesByType('resource').length];
+"""
+
+# 에디터 이미지 개수 + 모두 로드됐는지
+_EDITOR_IMAGES_JS = """
+var components = document.querySelectorAll(arguments[0]);
+var imgs = [];
+for (var i = 0; i < components.length; i++) {
+    var found = components[i].querySelectorAll('img');
+    for (var j = 0; j < found.length; j++) imgs.push(found[j]);
+}
+var loaded = imgs.every(function(img) {
+    return img.complete && img.naturalWidth > 0 && img.src.indexOf('blob:') !== 0;
+});
+var busy = document.querySelector('.se-image-loading, .se-loading, [class*="upload"][class*="progress"]');
+return [components.length, loaded && !busy];
+"""
+
+
+class Waits:
+    """조건 기반 대기 도우미"""
+
+    def __init__(self, driver, profile='normal'):
+        """
+        초기화
+
+        Args:
+            driver: Selenium WebDriver
+            profile: TimingProfile 또는 이름 ('fast' / 'normal' / 'slow')
+        """
+        self.driver = driver
+        self.profile = TimingProfile.get(profile)
+
+    def pause(self, seconds):
+        """
+        키 입력/메뉴 애니메이션 사이의 짧은 대기 (확인할 조건이 없는 경우만 사용)
+        프로필 배율 적용
+        """
+        time.sleep(seconds * self.profile.pause_scale)
+
+    def until(self, condition, timeout=10, message=None):
+        """
+        조건이 참이 될 때까지 대기
+
+        Args:
+            condition: 인자 없는 함수 (참 값을 반환하면 종료, 예외는 거짓으로 처리)
+            timeout: 최대 대기 시간(초, 프로필 배율 적용)
+            message: 시간 초과 시 출력할 메시지 (선택)
+
+        Returns:
+            조건 함수의 반환값 (시간 초과 시 None)
+        """
+        def check(_driver):
+            try:
+                return condition()
+            except Exception:
+                return False
+
+        try:
+            return WebDriverWait(self.driver, timeout * self.profile.timeout_scale,
+                                 poll_frequency=self.profile.poll).until(check)
+        except TimeoutException:
+            if message:
+                print(f"   ⚠️ 대기 시간 초과: {message}")
+            return None
+
+    def page_loaded(self, timeout=15):
+        """document.readyState == 'complete' 대기"""
+        return self.until(
+            lambda: self.driver.execute_script("return document.readyState") == 'complete',
+            timeout, "페이지 로드"
+        )
+
+    def element(self, css, timeout=10, visible=True):
+        """
+        요소가 나타날 때까지 대기
+
+        Args:
+            css: CSS 셀렉터
+            timeout: 최대 대기 시간(초)
+            visible: True면 화면에 보일 때까지
+
+        Returns:
+            WebElement (시간 초과 시 None)
+        """
+        def find():
+            for element in self.driver.find_elements(By.CSS_SELECTOR, css):
+                if not visible or element.is_displayed():
+                    return element
+            return None
+
+        return self.until(find, timeout, f"요소 {css}")
+
+    def any_element(self, selectors, timeout=10):
+        """여러 셀렉터 중 먼저 나타나는 요소 (셀렉터 순서 우선)"""
+        def find():
+            for css in selectors:
+                elements = self.driver.find_elements(By.CSS_SELECTOR, css)
+                if elements:
+                    return elements[0]
+            return None
+
+        return self.until(find, timeout)
+
+    def editor_ready(self, timeout=20):
+        """
+        블로그 에디터 준비 대기 (제목 영역 + 본문 영역 표시)
+
+        Returns:
+            list: 본문 컴포넌트 요소 리스트 (시간 초과 시 None)
+        """
+        def ready():
+            if not self.driver.find_elements(By.CSS_SELECTOR, "div.se-title-text"):
+                return None
+            editors = self.driver.find_elements(By.CSS_SELECTOR, ".se-component-content")
+            return editors if len(editors) >= 2 else None
+
+        return self.until(ready, timeout, "에디터 준비")
+
+    def dom_quiet(self, quiet=0.3, timeout=5):
+        """
+        DOM 변경이 quiet초 동안 없을 때까지 대기 (에디터 입력 반영 확인용)
+
+        Returns:
+            bool: 안정화 여부
+        """
+        quiet_ms = quiet * 1000 * self.profile.pause_scale
+        return bool(self.until(
+            lambda: self.driver.execute_script(_DOM_QUIET_JS) >= quiet_ms,
+            timeout
+        ))
+
+    def network_quiet(self, quiet=0.5, timeout=15):
+        """
+        페이지 로드 완료 + quiet초 동안 새 리소스 요청이 없을 때까지 대기
+
+        Returns:
+            bool: 안정화 여부
+        """
+        state = {'count': -1, 'since': time.time()}
+        quiet = quiet * self.profile.pause_scale
+
+        def settled():
+            ready_state, count = self.driver.execute_script(_RESOURCE_COUNT_JS)
+            now = time.time()
+            if count != state['count']:
+                state['count'], state['since'] = count, now
+                return False
+            return ready_state == 'complete' and now - state['since'] >= quiet
+
+        return bool(self.until(settled, timeout, "네트워크 안정화"))
+
+    def editor_image_count(self):
+        """에디터에 들어간 이미지 요소 개수"""
+        try:
+            return self.driver.execute_script(_EDITOR_IMAGES_JS, EDITOR_IMAGE_SELECTOR)[0]
+        except Exception:
+            return 0
+
+    def upload_done(self, before_count, timeout=30):
+        """
+        이미지 업로드 완료 대기 (에디터 이미지 요소가 늘어나고 썸네일이 모두 로드될 때까지)
+
+        Args:
+            before_count: 업로드 전 editor_image_count() 값
+            timeout: 최대 대기 시간(초)
+
+        Returns:
+            bool: 완료 여부
+        """
+        def done():
+            count, loaded = self.driver.execute_script(_EDITOR_IMAGES_JS, EDITOR_IMAGE_SELECTOR)
+            return count > before_count and loaded
+
+        return bool(self.until(done, timeout, "이미지 업로드"))
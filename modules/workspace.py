@@ -0,0 +1,86 @@
+"""
+작업 폴더 모듈
+- 글(작업) 1개마다 고유한 임시 폴더 생성
+- 작업이 끝나면 자동 삭제 (with 문)
+- 같은 PC에서 여러 작업/봇이 동시에 돌아도 product_N.jpg 충돌 없음
+"""
+
+import os
+import time
+import shutil
+import tempfile
+
+
+class JobWorkspace:
+    """작업별 임시 폴더 클래스"""
+
+    PREFIX = 'job_'
+
+    def __init__(self, base_dir='temp_images', label=None, keep=False):
+        """
+        초기화 (생성 즉시 고유 폴더 생성)
+
+        Args:
+            base_dir: 작업 폴더들을 만들 상위 폴더
+            label: 폴더 이름에 붙일 식별자 (선택, 로그 확인용)
+            keep: True면 종료 시 삭제하지 않음 (디버깅용)
+        """
+        os.makedirs(base_dir, exist_ok=True)
+        prefix = self.PREFIX + (f"{label}_" if label else '')
+        self.path = os.path.abspath(tempfile.mkdtemp(prefix=prefix, dir=base_dir))
+        self.keep = keep
+
+    def file(self, filename):
+        """
+        작업 폴더 안의 파일 경로
+
+        Args:
+            filename: 파일 이름
+
+        Returns:
+            str: 절대 경로
+        """
+        return os.path.join(self.path, filename)
+
+    def cleanup(self):
+        """작업 폴더 삭제"""
+        if self.keep or not os.path.exists(self.path):
+            return
+        shutil.rmtree(self.path, ignore_errors=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.cleanup()
+        return False
+
+    @classmethod
+    def sweep_stale(cls, base_dir='temp_images', max_age=24 * 3600):
+        """
+        비정상 종료로 남은 오래된 작업 폴더 정리
+        (다른 봇이 사용 중일 수 있으므로 max_age보다 오래된 폴더만 삭제)
+
+        Args:
+            base_dir: 작업 폴더들의 상위 폴더
+            max_age: 삭제 기준 경과 시간(초)
+
+        Returns:
+            int: 삭제한 폴더 개수
+        """
+        if not os.path.isdir(base_dir):
+            return 0
+
+        removed = 0
+        now = time.time()
+        for name in os.listdir(base_dir):
+            path = os.path.join(base_dir, name)
+            if not name.startswith(cls.PREFIX) or not os.path.isdir(path):
+                continue
+            try:
+                if now - os.path.getmtime(path) > max_age:
+                    shutil.rmtree(path, ignore_errors=True)
+                    removed += 1
+            except OSError:
+                continue
+        return removed
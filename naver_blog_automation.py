@@ -7,39 +7,85 @@ import undetected_chromedriver as uc
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.common.action_chains import ActionChains
-import time
-import pyperclip
 import os
-import win32gui
-import win32con
-import requests
 import re
+import time
 import random
+import threading
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeout
+
+from modules.ai_cache import AICache, product_id_from_url, product_key
+from modules.batch_runner import BatchRunner
+from modules.dom_snapshot import DomSnapshot, MAIN_IMAGE_SELECTORS, TITLE_SELECTORS
+from modules.editor_injector import EditorInjector, select_text
+from modules.file_upload import EditorImageUploader
+from modules.gemini_client import GeminiClient
+from modules.http_extractor import HttpProductExtractor
+from modules.image_handler import ImageHandler
+from modules.model_router import ModelRouter
+from modules.naver_session import (
+    get_naver_cookies, has_login_cookies, is_captcha_page, profile_dir, restore_cookies
+)
+from modules.stream_parser import AIStream, ContentStreamParser, StreamReset, parse_content
+from modules.text_input import TextInput
+from modules.utils import get_app_data_dir
+from modules.waits import Waits
+from modules.workspace import JobWorkspace
 
 
 class NaverBlogAutomation:
     """네이버 블로그 자동화 클래스"""
     
-    def __init__(self, blog_id, naver_id, naver_pw, gemini_api_key):
+    FALLBACK_TAGS = ('추천', '후기', '리뷰', '가성비', '인기', '베스트', '구매후기', '사용후기', '솔직후기', '좋은제품')
+    
+    def __init__(self, blog_id, naver_id, naver_pw, gemini_api_key, timing_profile='normal', headless=False,
+                 user_data_dir=None, chrome_version=141, persistent_profile=False, gemini_rpm=None,
+                 ai_hedge=False, ai_cache_bypass=False):
         self.blog_id = blog_id
         self.naver_id = naver_id
         self.naver_pw = naver_pw
         self.gemini_api_key = gemini_api_key
+        self.gemini = GeminiClient.shared(gemini_api_key)  # 모델 객체 재사용
+        if gemini_rpm:
+            self.gemini.set_rate_limit(gemini_rpm)  # API 키 할당량(분당 요청 수)에 맞춤
+        # 작업별 모델 선택 (본문 Pro, 태그/캡차 Flash), ai_hedge면 느린 본문 요청은 한 번 더 보내서 빠른 쪽 사용
+        self.ai_router = ModelRouter(self.gemini, hedge=ai_hedge)
+        self.ai_timeout = 180  # 본문 + 태그 생성 전체 제한 시간(초)
+        self._ai_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix='gemini')  # 태그 동시 생성용
+        self.ai_cache = AICache.shared()  # AI 응답 디스크 캐시 (재시도/재실행 시 Gemini 호출 생략)
+        self.ai_cache_bypass = ai_cache_bypass  # True면 캐시를 읽지 않고 새로 생성 (결과는 다시 저장)
+        self.ai_cache_scope = f"{blog_id}/{naver_id}"  # 캐시/작성 관점은 계정별 (같은 상품을 여러 계정이 올려도 다른 글)
         self.driver = None
+        self.timing_profile = timing_profile  # 실행 속도 프로필 (fast / normal / slow)
+        self.headless = headless  # 화면 없이 실행 (리눅스 서버용)
+        self.user_data_dir = user_data_dir  # Chrome 프로필 폴더 (None이면 임시 프로필)
+        if persistent_profile and not user_data_dir:
+            # 계정별 고정 프로필: 브라우저를 다시 켜도 로그인 세션 유지
+            self.user_data_dir = profile_dir(naver_id)
+        self.chrome_version = chrome_version  # Chrome 주 버전 (undetected_chromedriver)
+        self.waits = Waits(None, timing_profile)
+        self.use_http_extractor = True  # 제품 정보를 브라우저 없이 먼저 수집 (실패 시 브라우저 사용)
+        self.http_extractor = HttpProductExtractor()
+        self.use_dom_snapshot = True  # 제품 정보를 스크립트 1회 호출로 수집 (실패 시 셀렉터 방식)
+        self.use_html_injection = True  # 본문을 섹션별 HTML 1회 붙여넣기로 입력 (실패 시 키 입력 방식)
+        self.use_ai_streaming = False  # AI 본문을 받는 중에 에디터 입력 시작 (process_url에서만, 강조는 입력 후 적용)
+        self.editor_injector = None
+        self.text_input_backend = 'auto'  # 텍스트 입력 방식 (클립보드 대신 브라우저별 입력 이벤트, 'clipboard'면 기존 방식)
+        self.text_input = None
+        self.image_uploader = None
         self.temp_images_dir = os.path.join(os.getcwd(), 'temp_images')
-        # 쿠키 파일 경로 (AppData에 숨김 저장)
-        config_dir = os.path.join(os.getenv('APPDATA'), 'ColdAPP')
-        if not os.path.exists(config_dir):
-            os.makedirs(config_dir, exist_ok=True)
-        self.cookies_file = os.path.join(config_dir, 'naver_cookies.json')
+        # 쿠키 파일 경로 (AppData에 숨김 저장, 리눅스는 ~/.config/ColdAPP)
+        self.cookies_file = os.path.join(get_app_data_dir(), 'naver_cookies.json')
         
-        # temp_images 폴더 생성
+        # temp_images 폴더 생성 (글마다 이 아래에 고유 작업 폴더를 만들어 사용)
         if not os.path.exists(self.temp_images_dir):
             os.makedirs(self.temp_images_dir)
+        JobWorkspace.sweep_stale(self.temp_images_dir)
 
-    def _soft_avoid_phrases(self, text: str) -> str:
+    def _soft_avoid_phrases(self, text: str, seen=None) -> str:
         """상투 문구의 빈도를 낮추기 위한 후처리: 동일 그룹 표현은 최대 1회 유지하고 나머지는 동의어로 치환.
         태그([TEXT] 등)는 보존.
+        seen: 스트리밍처럼 줄 단위로 나눠 처리할 때 이미 등장한 그룹 번호 set (여러 호출에 걸쳐 1회 유지)
         """
         groups = [
             {
@@ -66,9 +112,9 @@ class NaverBlogAutomation:
                 'alts': ['완벽하진 않아서', '쓰다 보니 보완할 지점도 있습니다']
             }
         ]
-        for group in groups:
+        for group_idx, group in enumerate(groups):
             pattern = re.compile('|'.join(re.escape(t) for t in group['targets']))
-            cnt = {'n': 0}
+            cnt = {'n': 1 if seen is not None and group_idx in seen else 0}
             def repl(m):
                 cnt['n'] += 1
                 if cnt['n'] == 1:
@@ -76,6 +122,8 @@ class NaverBlogAutomation:
                     return m.group(0) if random.random() < 0.5 else random.choice(group['alts'])
                 return random.choice(group['alts'])
             text = pattern.sub(repl, text)
+            if seen is not None and cnt['n']:
+                seen.add(group_idx)
         return text
 
     def _remove_markdown(self, text):
@@ -132,55 +180,14 @@ class NaverBlogAutomation:
     def _apply_text_style_to_keyword(self, keyword_text, style_type):
         """키워드에 실제 스타일 적용 (안전한 방법)"""
         try:
-            # JavaScript로 본문에서 첫 번째 키워드 찾아서 선택
-            js_script = f"""
-            (function() {{
-                // 에디터 영역 찾기
-                var editor = document.querySelector('.se-component-content');
-                if (!editor) return false;
-                
-                // 텍스트 노드에서 키워드 찾기
-                var keyword = "{keyword_text}";
-                var found = false;
-                
-                function findAndSelect(node) {{
-                    if (found) return;
-                    
-                    if (node.nodeType === 3) {{  // 텍스트 노드
-                        var index = node.textContent.indexOf(keyword);
-                        if (index >= 0) {{
-                            var range = document.createRange();
-                            range.setStart(node, index);
-                            range.setEnd(node, index + keyword.length);
-                            
-                            var selection = window.getSelection();
-                            selection.removeAllRanges();
-                            selection.addRange(range);
-                            
-                            found = true;
-                            return;
-                        }}
-                    }} else {{
-                        for (var i = 0; i < node.childNodes.length; i++) {{
-                            findAndSelect(node.childNodes[i]);
-                            if (found) return;
-                        }}
-                    }}
-                }}
-                
-                findAndSelect(editor);
-                return found;
-            }})();
-            """
-            
-            # JavaScript 실행
-            result = self.driver.execute_script(js_script)
+            # 본문에서 첫 번째 키워드 찾아서 선택 (제목 영역 제외)
+            result = select_text(self.driver, keyword_text)
             
             if not result:
                 print(f"         ⚠️ '{keyword_text}' 찾기 실패")
                 return False
             
-            time.sleep(0.2)
+            self.waits.pause(0.2)
             
             # 스타일 적용
             if style_type == 'bold':
@@ -205,7 +212,7 @@ class NaverBlogAutomation:
                 # 글자색 버튼 클릭
                 font_color_btn = self.driver.find_element(By.CSS_SELECTOR, '[data-name="font-color"]')
                 font_color_btn.click()
-                time.sleep(0.3)
+                self.waits.pause(0.3)
                 
                 # 색상 선택
                 color = self._get_random_color('font')
@@ -217,7 +224,7 @@ class NaverBlogAutomation:
                 # 배경색 버튼 클릭
                 bg_color_btn = self.driver.find_element(By.CSS_SELECTOR, '[data-name="background-color"]')
                 bg_color_btn.click()
-                time.sleep(0.3)
+                self.waits.pause(0.3)
                 
                 # 색상 선택
                 color = self._get_random_color('bg')
@@ -229,7 +236,7 @@ class NaverBlogAutomation:
                 # 글자 크기 버튼 클릭
                 font_size_btn = self.driver.find_element(By.CSS_SELECTOR, '[data-name="font-size"]')
                 font_size_btn.click()
-                time.sleep(0.3)
+                self.waits.pause(0.3)
                 
                 # 크기 선택 (크게 = 19pt)
                 size_btn = self.driver.find_element(By.CSS_SELECTOR, '[data-value="fs19"]')
@@ -240,11 +247,11 @@ class NaverBlogAutomation:
                 # 굵게 + 글자색
                 bold_btn = self.driver.find_element(By.CSS_SELECTOR, '[data-name="bold"]')
                 bold_btn.click()
-                time.sleep(0.2)
+                self.waits.pause(0.2)
                 
                 font_color_btn = self.driver.find_element(By.CSS_SELECTOR, '[data-name="font-color"]')
                 font_color_btn.click()
-                time.sleep(0.3)
+                self.waits.pause(0.3)
                 
                 color = self._get_random_color('font')
                 color_btn = self.driver.find_element(By.CSS_SELECTOR, f'[data-color="{color}"]')
@@ -255,11 +262,11 @@ class NaverBlogAutomation:
                 # 굵게 + 배경색
                 bold_btn = self.driver.find_element(By.CSS_SELECTOR, '[data-name="bold"]')
                 bold_btn.click()
-                time.sleep(0.2)
+                self.waits.pause(0.2)
                 
                 bg_color_btn = self.driver.find_element(By.CSS_SELECTOR, '[data-name="background-color"]')
                 bg_color_btn.click()
-                time.sleep(0.3)
+                self.waits.pause(0.3)
                 
                 color = self._get_random_color('bg')
                 color_btn = self.driver.find_element(By.CSS_SELECTOR, f'[data-color="{color}"]')
@@ -267,11 +274,11 @@ class NaverBlogAutomation:
                 print(f"         [굵게+배경색{color}] '{keyword_text}'")
             
             # ✅ 수정: 스타일 적용 후 충분히 대기한 다음 해제
-            time.sleep(0.5)
+            self.waits.pause(0.5)
             self._deactivate_style(style_type)
             
             # 선택 영역 해제
-            time.sleep(0.3)
+            self.waits.pause(0.3)
             ActionChains(self.driver).send_keys(Keys.ESCAPE).perform()
             
             return True
@@ -286,77 +293,77 @@ class NaverBlogAutomation:
             if style_type == 'bold':
                 btn = self.driver.find_element(By.CSS_SELECTOR, '[data-name="bold"]')
                 btn.click()
-                time.sleep(0.1)
+                self.waits.pause(0.1)
                 
             elif style_type == 'italic':
                 btn = self.driver.find_element(By.CSS_SELECTOR, '[data-name="italic"]')
                 btn.click()
-                time.sleep(0.1)
+                self.waits.pause(0.1)
                 
             elif style_type == 'underline':
                 btn = self.driver.find_element(By.CSS_SELECTOR, '[data-name="underline"]')
                 btn.click()
-                time.sleep(0.1)
+                self.waits.pause(0.1)
                 
             elif style_type == 'font_color':
                 # 글자색 버튼 클릭
                 font_color_btn = self.driver.find_element(By.CSS_SELECTOR, '[data-name="font-color"]')
                 font_color_btn.click()
-                time.sleep(0.2)
+                self.waits.pause(0.2)
                 # 색상 선택
                 color = self._get_random_color('font')
                 color_btn = self.driver.find_element(By.CSS_SELECTOR, f'[data-color="{color}"]')
                 color_btn.click()
-                time.sleep(0.1)
+                self.waits.pause(0.1)
                 
             elif style_type == 'bg_color':
                 # 배경색 버튼 클릭
                 bg_color_btn = self.driver.find_element(By.CSS_SELECTOR, '[data-name="background-color"]')
                 bg_color_btn.click()
-                time.sleep(0.2)
+                self.waits.pause(0.2)
                 # 색상 선택
                 color = self._get_random_color('bg')
                 color_btn = self.driver.find_element(By.CSS_SELECTOR, f'[data-color="{color}"]')
                 color_btn.click()
-                time.sleep(0.1)
+                self.waits.pause(0.1)
                 
             elif style_type == 'font_size':
                 # 글자 크기 버튼 클릭
                 font_size_btn = self.driver.find_element(By.CSS_SELECTOR, '[data-name="font-size"]')
                 font_size_btn.click()
-                time.sleep(0.2)
+                self.waits.pause(0.2)
                 # 크기 선택 (19pt)
                 size_btn = self.driver.find_element(By.CSS_SELECTOR, '[data-value="fs19"]')
                 size_btn.click()
-                time.sleep(0.1)
+                self.waits.pause(0.1)
                 
             elif style_type == 'bold_font':
                 # 굵게
                 bold_btn = self.driver.find_element(By.CSS_SELECTOR, '[data-name="bold"]')
                 bold_btn.click()
-                time.sleep(0.1)
+                self.waits.pause(0.1)
                 # 글자색
                 font_color_btn = self.driver.find_element(By.CSS_SELECTOR, '[data-name="font-color"]')
                 font_color_btn.click()
-                time.sleep(0.2)
+                self.waits.pause(0.2)
                 color = self._get_random_color('font')
                 color_btn = self.driver.find_element(By.CSS_SELECTOR, f'[data-color="{color}"]')
                 color_btn.click()
-                time.sleep(0.1)
+                self.waits.pause(0.1)
                 
             elif style_type == 'bold_bg':
                 # 굵게
                 bold_btn = self.driver.find_element(By.CSS_SELECTOR, '[data-name="bold"]')
                 bold_btn.click()
-                time.sleep(0.1)
+                self.waits.pause(0.1)
                 # 배경색
                 bg_color_btn = self.driver.find_element(By.CSS_SELECTOR, '[data-name="background-color"]')
                 bg_color_btn.click()
-                time.sleep(0.2)
+                self.waits.pause(0.2)
                 color = self._get_random_color('bg')
                 color_btn = self.driver.find_element(By.CSS_SELECTOR, f'[data-color="{color}"]')
                 color_btn.click()
-                time.sleep(0.1)
+                self.waits.pause(0.1)
                 
         except Exception as e:
             print(f"         ⚠️ 스타일 활성화 실패: {e}")
@@ -368,94 +375,86 @@ class NaverBlogAutomation:
                 # 굵게 OFF (토글)
                 btn = self.driver.find_element(By.CSS_SELECTOR, '[data-name="bold"]')
                 btn.click()
-                time.sleep(0.2)
+                self.waits.pause(0.2)
                 
             elif style_type == 'italic':
                 # 기울임 OFF (토글)
                 btn = self.driver.find_element(By.CSS_SELECTOR, '[data-name="italic"]')
                 btn.click()
-                time.sleep(0.2)
+                self.waits.pause(0.2)
                 
             elif style_type == 'underline':
                 # 밑줄 OFF (토글)
                 btn = self.driver.find_element(By.CSS_SELECTOR, '[data-name="underline"]')
                 btn.click()
-                time.sleep(0.2)
+                self.waits.pause(0.2)
                 
             elif style_type == 'font_color':
                 # 글자색 → 검정색으로
                 font_color_btn = self.driver.find_element(By.CSS_SELECTOR, '[data-name="font-color"]')
                 font_color_btn.click()
-                time.sleep(0.3)
+                self.waits.pause(0.3)
                 black_btn = self.driver.find_element(By.CSS_SELECTOR, '[data-color="#000000"]')
                 black_btn.click()
-                time.sleep(0.2)
+                self.waits.pause(0.2)
                 
             elif style_type == 'bg_color':
                 # 배경색 → 색상 없음
                 bg_color_btn = self.driver.find_element(By.CSS_SELECTOR, '[data-name="background-color"]')
                 bg_color_btn.click()
-                time.sleep(0.3)
+                self.waits.pause(0.3)
                 no_color_btn = self.driver.find_element(By.CSS_SELECTOR, '.se-color-palette-no-color')
                 no_color_btn.click()
-                time.sleep(0.2)
+                self.waits.pause(0.2)
                 
             elif style_type == 'font_size':
                 # 글자크기 → 기본 크기(16)
                 font_size_btn = self.driver.find_element(By.CSS_SELECTOR, '[data-name="font-size"]')
                 font_size_btn.click()
-                time.sleep(0.3)
+                self.waits.pause(0.3)
                 default_size_btn = self.driver.find_element(By.CSS_SELECTOR, '[data-value="fs16"]')
                 default_size_btn.click()
-                time.sleep(0.2)
+                self.waits.pause(0.2)
                 
             elif style_type == 'bold_font':
                 # 굵게 OFF
                 bold_btn = self.driver.find_element(By.CSS_SELECTOR, '[data-name="bold"]')
                 bold_btn.click()
-                time.sleep(0.2)
+                self.waits.pause(0.2)
                 # 글자색 → 검정색
                 font_color_btn = self.driver.find_element(By.CSS_SELECTOR, '[data-name="font-color"]')
                 font_color_btn.click()
-                time.sleep(0.3)
+                self.waits.pause(0.3)
                 black_btn = self.driver.find_element(By.CSS_SELECTOR, '[data-color="#000000"]')
                 black_btn.click()
-                time.sleep(0.2)
+                self.waits.pause(0.2)
                 
             elif style_type == 'bold_bg':
                 # 굵게 OFF
                 bold_btn = self.driver.find_element(By.CSS_SELECTOR, '[data-name="bold"]')
                 bold_btn.click()
-                time.sleep(0.2)
+                self.waits.pause(0.2)
                 # 배경색 → 색상 없음
                 bg_color_btn = self.driver.find_element(By.CSS_SELECTOR, '[data-name="background-color"]')
                 bg_color_btn.click()
-                time.sleep(0.3)
+                self.waits.pause(0.3)
                 no_color_btn = self.driver.find_element(By.CSS_SELECTOR, '.se-color-palette-no-color')
                 no_color_btn.click()
-                time.sleep(0.2)
+                self.waits.pause(0.2)
                 
         except Exception as e:
             print(f"         ⚠️ 스타일 되돌리기 실패: {e}")
     
-    def _insert_text_with_inline_styles(self, text, highlights, section):
-        """텍스트 입력하면서 강조 부분은 바로 스타일 적용"""
-        import random
-        
+    def _select_highlight_positions(self, text, highlights, section):
+        """이 섹션 텍스트에서 강조할 위치 선택 (섹션별 랜덤 1-3개, 없으면 빈 리스트)"""
         # 1. 이 섹션의 highlights 찾기
         section_highlights = [h for h in highlights if h.get('section') == section]
         
-        if not section_highlights:
-            # 강조 없으면 그냥 입력
-            pyperclip.copy(text)
-            ActionChains(self.driver).key_down(Keys.CONTROL).send_keys('v').key_up(Keys.CONTROL).perform()
-            return
-        
         # 2. 텍스트에서 키워드 위치 찾기
         positions = []
         for h in section_highlights:
             keyword = h.get('text', '')
-            start = text.find(keyword)
+            start = text.find(keyword) if keyword else -1
             if start >= 0:
                 positions.append({
                     'start': start,
@@ -465,39 +464,47 @@ class NaverBlogAutomation:
                 })
         
         if not positions:
-            # 이 텍스트에는 강조 없음
-            pyperclip.copy(text)
-            ActionChains(self.driver).key_down(Keys.CONTROL).send_keys('v').key_up(Keys.CONTROL).perform()
-            return
-        
-        # 3. 위치 순서대로 정렬
-        positions.sort(key=lambda x: x['start'])
+            return []
         
-        # 4. 섹션별 랜덤 선택 (1-3개)
+        # 3. 섹션별 랜덤 선택 (1-3개), 위치 순서대로 정렬
         select_count = random.randint(1, min(3, len(positions)))
         selected_positions = random.sample(positions, select_count)
         selected_positions.sort(key=lambda x: x['start'])
         
         print(f"      💡 {section} 섹션: {len(positions)}개 중 {select_count}개 강조 선택")
+        return selected_positions
+    
+    def _insert_text_with_inline_styles(self, text, highlights, section):
+        """텍스트 입력하면서 강조 부분은 바로 스타일 적용"""
+        selected_positions = self._select_highlight_positions(text, highlights or [], section)
+        
+        # HTML 한 번에 붙여넣기 (실패 시 아래 키 입력 방식)
+        if self.editor_injector and self.editor_injector.insert_section(text, selected_positions, self._get_random_color):
+            for pos in selected_positions:
+                print(f"         [{pos['style']}] '{pos['text']}'")
+            return
+        
+        if not selected_positions:
+            # 강조 없으면 그냥 입력
+            self.text_input.insert(text)
+            return
         
-        # 5. 조각별로 입력
+        # 조각별로 입력
         last_end = 0
         for pos in selected_positions:
             # 일반 텍스트 부분 입력
             if pos['start'] > last_end:
                 normal_text = text[last_end:pos['start']]
-                pyperclip.copy(normal_text)
-                ActionChains(self.driver).key_down(Keys.CONTROL).send_keys('v').key_up(Keys.CONTROL).perform()
-                time.sleep(0.1)
+                self.text_input.insert(normal_text)
+                self.waits.pause(0.1)
             
             # 스타일 버튼 먼저 활성화
             print(f"         [{pos['style']}] '{pos['text']}'")
             self._activate_style(pos['style'])
             
             # 강조 텍스트 입력 (스타일 적용된 상태로)
-            pyperclip.copy(pos['text'])
-            ActionChains(self.driver).key_down(Keys.CONTROL).send_keys('v').key_up(Keys.CONTROL).perform()
-            time.sleep(0.1)
+            self.text_input.insert(pos['text'])
+            self.waits.pause(0.1)
             
             # 스타일 버튼 비활성화
             self._deactivate_style(pos['style'])
@@ -507,24 +514,33 @@ class NaverBlogAutomation:
         # 마지막 남은 텍스트
         if last_end < len(text):
             final_text = text[last_end:]
-            pyperclip.copy(final_text)
-            ActionChains(self.driver).key_down(Keys.CONTROL).send_keys('v').key_up(Keys.CONTROL).perform()
+            self.text_input.insert(final_text)
 
     def start_browser(self):
         """브라우저 시작"""
         print("🌐 Chrome 브라우저 시작...")
         options = uc.ChromeOptions()
         options.add_argument('--disable-blink-features=AutomationControlled')
-        options.add_argument('--start-maximized')
+        if self.headless:
+            # 화면 없는 서버: 창 크기를 고정해야 에디터 툴바가 모두 보임
+            options.add_argument('--headless=new')
+            options.add_argument('--window-size=1920,1080')
+            options.add_argument('--disable-dev-shm-usage')
+        else:
+            options.add_argument('--start-maximized')
         
-        self.driver = uc.Chrome(options=options, version_main=141)
+        self.driver = uc.Chrome(options=options, version_main=self.chrome_version,
+                                user_data_dir=self.user_data_dir)
+        self.waits = Waits(self.driver, self.timing_profile)
+        self.text_input = TextInput(self.driver, self.waits, self.text_input_backend)
+        self.image_uploader = EditorImageUploader(self.driver, self.waits)
         print("✅ 브라우저 시작 완료")
     
     def save_cookies(self):
         """쿠키 저장"""
         try:
             import json
-            cookies = self.driver.get_cookies()
+            cookies = get_naver_cookies(self.driver)
             with open(self.cookies_file, 'w') as f:
                 json.dump(cookies, f)
             print("✅ 쿠키 저장 완료")
@@ -539,8 +555,14 @@ class NaverBlogAutomation:
                 with open(self.cookies_file, 'r') as f:
                     cookies = json.load(f)
                 
+                # CDP로 한 번에 복원 (페이지 이동 없음)
+                if restore_cookies(self.driver, cookies):
+                    print("✅ 쿠키 로드 완료")
+                    return True
+                
+                # CDP를 못 쓰면 naver.com에서 하나씩 추가
                 self.driver.get('https://www.naver.com')
-                time.sleep(1)
+                self.waits.page_loaded()
                 
                 for cookie in cookies:
                     try:
@@ -549,7 +571,7 @@ class NaverBlogAutomation:
                         pass
                 
                 self.driver.refresh()
-                time.sleep(2)
+                self.waits.page_loaded()
                 print("✅ 쿠키 로드 완료")
                 return True
         except Exception as e:
@@ -560,13 +582,14 @@ class NaverBlogAutomation:
         """네이버 로그인"""
         print("\n🔐 네이버 로그인...")
         
+        # 프로필에 로그인 세션이 남아 있으면 바로 사용 (페이지 이동 없이 쿠키만 확인)
+        if has_login_cookies(self.driver):
+            print("✅ 저장된 브라우저 세션으로 로그인 생략!")
+            return True
+        
         # 쿠키로 로그인 시도
         if self.load_cookies():
-            # 로그인 확인
-            self.driver.get('https://www.naver.com')
-            time.sleep(2)
-            
-            if 'blog.naver.com' in self.driver.current_url or 'NID_AUT' in self.driver.page_source:
+            if has_login_cookies(self.driver):
                 print("✅ 쿠키 로그인 성공!")
                 return True
             else:
@@ -574,33 +597,33 @@ class NaverBlogAutomation:
         
         # 네이버 메인
         self.driver.get('https://www.naver.com')
-        time.sleep(2)
+        self.waits.page_loaded()
         
         # 로그인 페이지
         self.driver.get('https://nid.naver.com/nidlogin.login')
-        time.sleep(3)
+        self.waits.element('#id', timeout=10)
         
         # 자동 로그인 시도
         try:
             id_input = self.driver.find_element(By.ID, 'id')
             id_input.click()
-            time.sleep(0.8)
+            self.waits.pause(0.8)
             
-            pyperclip.copy(self.naver_id)
-            id_input.send_keys(Keys.CONTROL, 'v')
-            time.sleep(1.5)
+            self.text_input.insert(self.naver_id)
+            self.waits.pause(1.5)
             
             pw_input = self.driver.find_element(By.ID, 'pw')
             pw_input.click()
-            time.sleep(0.8)
+            self.waits.pause(0.8)
             
-            pyperclip.copy(self.naver_pw)
-            pw_input.send_keys(Keys.CONTROL, 'v')
-            time.sleep(1.5)
+            self.text_input.insert(self.naver_pw)
+            self.waits.pause(1.5)
             
             login_btn = self.driver.find_element(By.ID, 'log.login')
             login_btn.click()
-            time.sleep(5)
+            # 로그인 페이지를 벗어나거나(성공) 캡차/오류가 뜰 때까지 대기
+            self.waits.until(lambda: 'nidlogin.login' not in self.driver.current_url, 10)
+            self.waits.page_loaded()
             
             current_url = self.driver.current_url
             if 'nid.naver.com' not in current_url:
@@ -627,27 +650,22 @@ class NaverBlogAutomation:
     def _check_and_solve_captcha(self):
         """캡차 확인 및 자동 해결"""
         try:
-            time.sleep(2)  # 페이지 로드 대기
-            
-            # 캡차 확인 (여러 방법으로)
-            page_source = self.driver.page_source
-            is_captcha = (
-                "보안 확인" in page_source or 
-                "보안 학인을 완료해 주세요" in page_source or
-                "구매한 물건은 총 몇 개 입니까" in page_source or
-                "몇 개 입니까" in page_source
-            )
+            self.waits.page_loaded()  # 페이지 로드 대기
+            
+            # 캡차 확인 (캡차 요소/안내 문구만 확인, 페이지 전체 HTML은 받지 않음)
+            is_captcha = is_captcha_page(self.driver)
             
             if is_captcha:
                 print("🔐 캡차 감지! Gemini로 자동 해결 시도...")
                 
-                # 전체 화면 스크린샷
-                screenshot_path = os.path.join(self.temp_images_dir, 'captcha.png')
-                self.driver.save_screenshot(screenshot_path)
-                print(f"   📸 캡차 스크린샷 저장: {screenshot_path}")
-                
-                # Gemini Vision으로 캡차 해결
-                answer = self._solve_captcha_with_gemini(screenshot_path)
+                # 전체 화면 스크린샷 (동시에 실행 중인 다른 작업과 겹치지 않도록 작업 폴더 사용)
+                with JobWorkspace(self.temp_images_dir, label='captcha') as workspace:
+                    screenshot_path = workspace.file('captcha.png')
+                    self.driver.save_screenshot(screenshot_path)
+                    print(f"   📸 캡차 스크린샷 저장: {screenshot_path}")
+                    
+                    # Gemini Vision으로 캡차 해결
+                    answer = self._solve_captcha_with_gemini(screenshot_path)
                 
                 if answer:
                     # 답 입력
@@ -677,7 +695,7 @@ class NaverBlogAutomation:
                         if answer_input:
                             answer_input.clear()
                             answer_input.send_keys(answer)
-                            time.sleep(1)
+                            self.waits.pause(1)
                             print(f"   ✅ 답변 입력: {answer}")
                             
                             # 확인 버튼 클릭
@@ -695,14 +713,14 @@ class NaverBlogAutomation:
                                         if btn.is_displayed() and ("확인" in btn.text or "로딩" in btn.text or btn.get_attribute("type") == "submit"):
                                             btn.click()
                                             print(f"   ✅ 확인 버튼 클릭")
-                                            time.sleep(5)
+                                            self.waits.network_quiet(timeout=10)
                                             return True
                                 except:
                                     continue
                             
                             # Enter로 제출
                             answer_input.send_keys(Keys.ENTER)
-                            time.sleep(5)
+                            self.waits.network_quiet(timeout=10)
                             print(f"   ✅ Enter로 제출")
                             return True
                         else:
@@ -728,18 +746,8 @@ class NaverBlogAutomation:
     def _solve_captcha_with_gemini(self, image_path):
         """Gemini Vision으로 캡차 해결"""
         try:
-            import google.generativeai as genai
             from PIL import Image
             
-            genai.configure(api_key=self.gemini_api_key)
-            
-            try:
-                model = genai.GenerativeModel('gemini-2.5-pro')
-                print("   🤖 모델: gemini-2.5-pro")
-            except:
-                model = genai.GenerativeModel('gemini-2.5-flash')
-                print("   🤖 모델: gemini-2.5-flash (백업)")
-            
             # 이미지 로드
             img = Image.open(image_path)
             
@@ -755,7 +763,7 @@ class NaverBlogAutomation:
 설명 없이 답(숫자)만 출력하세요:
 """
             
-            response = model.generate_content([prompt, img])
+            response = self.ai_router.generate('captcha', [prompt, img])
             answer = response.text.strip()
             
             # 숫자만 추출
@@ -777,40 +785,51 @@ class NaverBlogAutomation:
         print(f"\n📦 제품 정보 추출 중...")
         print(f"   URL: {shopping_url}")
         
+        # 브라우저 없이 먼저 시도 (페이지 로드/대기 시간 없음)
+        if self.use_http_extractor:
+            product_info = self.http_extractor.extract(shopping_url)
+            if product_info:
+                print(f"\n✅ 제품 정보 추출 완료:")
+                print(f"   - 제품명: {product_info['title'][:50]}...")
+                print(f"   - 가격: {product_info['price']}")
+                print(f"   - 설명: {len(product_info['description'])}자")
+                print(f"   - 이미지: {len(product_info['images'])}개")
+                return product_info
+            print("   ↩️ 브라우저 방식으로 대체")
+        
         try:
             # URL 접근 (naver.me 짧은 URL도 리다이렉트 후 그대로 사용)
             if 'naver.me' in shopping_url:
                 print("   🔄 짧은 URL 리다이렉트 확인...")
                 self.driver.get(shopping_url)
-                time.sleep(3)
+                self.waits.until(lambda: 'naver.me' not in self.driver.current_url, 10, "리다이렉트")
                 final_url = self.driver.current_url
                 print(f"   ✅ 리다이렉트: {final_url}")
-                
-                # 캡차 확인 및 해결
-                if self._check_and_solve_captcha():
-                    print("   ✅ 캡차 해결 완료")
-                    time.sleep(3)
-                
-                print(f"   ✅ 페이지 로드 완료")
-                time.sleep(3)
             else:
                 # 일반 URL (smartstore, brand 등)
                 print(f"   🔄 URL 접근 중...")
                 self.driver.get(shopping_url)
-                time.sleep(5)
-                
-                # 캡차 확인 및 해결
-                if self._check_and_solve_captcha():
-                    print("   ✅ 캡차 해결 완료")
-                    time.sleep(3)
-                
-                print(f"   ✅ 페이지 로드 완료")
             
-            # 제품 정보 추출
-            title = self._extract_title()
-            price = self._extract_price()
-            description = self._extract_description()
-            images = self._extract_images()
+            # 캡차 확인 및 해결
+            if self._check_and_solve_captcha():
+                print("   ✅ 캡차 해결 완료")
+            
+            # 상품명이 그려질 때까지 대기 (고정 대기 없음)
+            self.waits.any_element(TITLE_SELECTORS, timeout=10)
+            print(f"   ✅ 페이지 로드 완료")
+            
+            # 제품 정보 추출 (스냅샷 우선, 비어 있는 항목만 셀렉터 방식으로 대체)
+            snapshot = self._capture_snapshot()
+            if snapshot:
+                title = snapshot.title() or self._extract_title()
+                price = snapshot.price() or self._extract_price()
+                description = snapshot.description() or self._extract_description()
+                images = snapshot.product_images() or self._extract_images()
+            else:
+                title = self._extract_title()
+                price = self._extract_price()
+                description = self._extract_description()
+                images = self._extract_images()
             
             print(f"\n✅ 제품 정보 추출 완료:")
             print(f"   - 제품명: {title[:50]}...")
@@ -823,7 +842,8 @@ class NaverBlogAutomation:
                 'price': price,
                 'description': description,
                 'images': images,
-                'link': shopping_url
+                'link': shopping_url,
+                'product_id': product_id_from_url(self.driver.current_url)
             }
             
         except Exception as e:
@@ -832,6 +852,25 @@ class NaverBlogAutomation:
             traceback.print_exc()
             return None
     
+    def _capture_snapshot(self):
+        """DOM 스냅샷 수집 (execute_script 1회, 실패 시 None → 셀렉터 방식 사용)"""
+        if not self.use_dom_snapshot:
+            return None
+        
+        try:
+            snapshot = DomSnapshot.capture(
+                self.driver,
+                main_image_selectors=MAIN_IMAGE_SELECTORS + [
+                    'div._2X4tyqLO8t img',
+                    'img[class*="TgO"]',
+                ]
+            )
+            print(f"   ⚡ DOM 스냅샷 수집 완료 (썸네일 {snapshot.thumbnail_count()}개)")
+            return snapshot
+        except Exception as e:
+            print(f"   ⚠️ DOM 스냅샷 실패 - 셀렉터 방식 사용: {e}")
+            return None
+    
     def _extract_title(self):
         """제품명 추출"""
         selectors = [
@@ -927,7 +966,7 @@ class NaverBlogAutomation:
                     try:
                         # 썸네일 클릭
                         thumbnail.click()
-                        time.sleep(0.8)  # 로딩 시간 증가
+                        self.waits.pause(0.8)  # 로딩 시간 증가
                         
                         # 메인 이미지 가져오기 (여러 셀렉터 시도)
                         main_img = None
@@ -1015,59 +1054,25 @@ class NaverBlogAutomation:
             print(f"   ⚠️ 이미지 추출 오류: {e}")
             return []
     
-    def download_images(self, image_urls):
-        """이미지 다운로드"""
-        print(f"\n💾 이미지 다운로드 중...")
-        print(f"   📊 다운로드할 이미지: {len(image_urls)}개")
-        
-        if not image_urls:
-            print("   ⚠️ 이미지 URL이 없습니다!")
-            return []
-        
-        downloaded_files = []
-        
-        for idx, url in enumerate(image_urls):
-            try:
-                response = requests.get(url, timeout=10)
-                if response.status_code == 200:
-                    filename = f"product_{idx+1}.jpg"
-                    filepath = os.path.join(self.temp_images_dir, filename)
-                    
-                    with open(filepath, 'wb') as f:
-                        f.write(response.content)
-                    
-                    abs_path = os.path.abspath(filepath)
-                    downloaded_files.append(abs_path)
-                    print(f"   ✅ {filename} 다운로드 완료")
-                    
-            except Exception as e:
-                print(f"   ⚠️ 이미지 {idx+1} 다운로드 실패: {e}")
-                continue
-        
-        print(f"✅ {len(downloaded_files)}개 이미지 다운로드 완료")
-        return downloaded_files
+    def download_images(self, image_urls, target_dir=None):
+        """이미지 다운로드 (target_dir 지정 시 해당 폴더에 저장, 공유 세션으로 병렬 다운로드)"""
+        image_handler = ImageHandler(target_dir or self.temp_images_dir)
+        return image_handler.download_product_images(image_urls)
     
-    def generate_ai_content(self, product_info):
-        """Gemini AI로 블로그 글 생성"""
+    def generate_ai_content(self, product_info, stream=None):
+        """Gemini AI로 블로그 글 생성 (stream: 받는 대로 응답 조각을 넘길 AIStream, 선택)"""
         print(f"\n🤖 AI 글 생성 중...")
         
         try:
-            import google.generativeai as genai
-            
-            genai.configure(api_key=self.gemini_api_key)
-            
-            # 모델 우선순위: gemini-2.5-flash → Gemini 2.5 Flash-Lite
-            try:
-                model = genai.GenerativeModel('gemini-2.5-pro')
-                print("   🤖 모델: gemini-2.5-pro")
-            except:
-                model = genai.GenerativeModel('gemini-2.5-flash')
-                print("   🤖 모델: gemini-2.5-flash (백업)")
-            
             title = product_info['title']
             price = product_info['price']
             description = product_info['description']
             image_count = len(product_info['images'])
+            
+            # 태그는 제목/설명만 필요하므로 본문 생성과 동시에 요청 (두 호출 합쳐서 ai_timeout 이내)
+            deadline = time.time() + self.ai_timeout
+            tags_future = self._ai_executor.submit(self._generate_tags, title, description)
+            angle_key = product_key(product_info)  # 같은 상품은 같은 작성 관점 (재시도 시 캐시 적중)
 
             # 스타일 프로파일(무작위 각도) 생성
             style_angles = [
@@ -1077,7 +1082,7 @@ class NaverBlogAutomation:
                 "핵심 스펙 숫자 강조(수치·치수·용량·소재 등 3개 이상)",
                 "TIP 제공형(구매/사용/관리 팁 3가지)"
             ]
-            chosen_angle = random.choice(style_angles)
+            chosen_angle = self._choose_angle(style_angles, angle_key)
             banned_phrases = [
                 "직접 사용해보니 정말 만족스러웠어요",
                 "제 솔직한 경험을 공유하고 싶어서 이렇게 후기를 남깁니다",
@@ -1089,11 +1094,13 @@ class NaverBlogAutomation:
             if image_count == 1:
                 # 1개: 자유 후기
                 print(f"   📊 이미지 1개 → 자유 후기 스타일 (단일)")
-                return self._generate_free_style_content(title, price, description, image_count)
+                return self._generate_free_style_content(title, price, description, image_count,
+                                                         tags_future, deadline, stream, angle_key)
             elif image_count == 2:
                 # 2개: 콜라주 1개 → 자유 후기
                 print(f"   📊 이미지 2개 → 자유 후기 스타일 (콜라주 1개)")
-                return self._generate_free_style_with_collage(title, price, description, image_count)
+                return self._generate_free_style_with_collage(title, price, description, image_count,
+                                                              tags_future, deadline, stream, angle_key)
             elif image_count == 3:
                 # 3개: 단일 3개 → 장점 3개
                 advantage_count = 3
@@ -1294,9 +1301,8 @@ JSON 형식 예시:
 본문 다음에 ```json으로 시작하는 JSON만 출력하세요:
 """
             
-            gen_config = genai.GenerationConfig(temperature=0.95, top_p=0.9)
-            response = model.generate_content(prompt, generation_config=gen_config)
-            ai_response = response.text.strip()
+            gen_config = self.gemini.generation_config(temperature=0.95, top_p=0.9)
+            ai_response = self._generate_body_text(prompt, gen_config, deadline, stream, chosen_angle)
             
             # 본문과 JSON 분리
             import json
@@ -1324,8 +1330,8 @@ JSON 형식 예시:
             
             print(f"✅ AI 글 생성 완료 ({len(ai_content)}자)")
             
-            # 태그 생성
-            tags = self._generate_tags(title, description)
+            # 태그 (본문과 동시에 생성 중이던 결과)
+            tags = self._collect_tags(tags_future, deadline)
             
             return {
                 'content': ai_content,
@@ -1339,20 +1345,10 @@ JSON 형식 예시:
             traceback.print_exc()
             return None
     
-    def _generate_free_style_content(self, title, price, description, image_count):
+    def _generate_free_style_content(self, title, price, description, image_count, tags_future, deadline,
+                                     stream=None, angle_key=None):
         """이미지 1개 이하일 때 자유 후기 스타일 생성"""
         try:
-            import google.generativeai as genai
-            
-            genai.configure(api_key=self.gemini_api_key)
-            
-            try:
-                model = genai.GenerativeModel('gemini-2.5-pro')
-                print("   🤖 모델: gemini-2.5-pro")
-            except:
-                model = genai.GenerativeModel('gemini-2.5-flash')
-                print("   🤖 모델: gemini-2.5-flash (백업)")
-            
             # 랜덤 스타일 각도 및 금지 문구
             style_angles = [
                 "문제-해결(Problem→Insight→Solution)",
@@ -1361,7 +1357,7 @@ JSON 형식 예시:
                 "핵심 스펙 숫자 강조(수치·치수·용량·소재 등 3개 이상)",
                 "TIP 제공형(구매/사용/관리 팁 3가지)"
             ]
-            chosen_angle = random.choice(style_angles)
+            chosen_angle = self._choose_angle(style_angles, angle_key)
             banned_phrases = [
                 "직접 사용해보니 정말 만족스러웠어요",
                 "제 솔직한 경험을 공유하고 싶어서 이렇게 후기를 남깁니다",
@@ -1433,15 +1429,14 @@ JSON 형식 예시:
 위 형식 그대로 작성하세요:
 """
             
-            gen_config = genai.GenerationConfig(temperature=0.95, top_p=0.9)
-            response = model.generate_content(prompt, generation_config=gen_config)
-            ai_content = response.text.strip()
+            gen_config = self.gemini.generation_config(temperature=0.95, top_p=0.9)
+            ai_content = self._generate_body_text(prompt, gen_config, deadline, stream, chosen_angle)
             ai_content = self._soft_avoid_phrases(ai_content)
             
             print(f"✅ AI 자유 후기 생성 완료 ({len(ai_content)}자)")
             
-            # 태그 생성
-            tags = self._generate_tags(title, description)
+            # 태그 (본문과 동시에 생성 중이던 결과)
+            tags = self._collect_tags(tags_future, deadline)
             
             return {
                 'content': ai_content,
@@ -1454,20 +1449,10 @@ JSON 형식 예시:
             traceback.print_exc()
             return None
     
-    def _generate_free_style_with_collage(self, title, price, description, image_count):
+    def _generate_free_style_with_collage(self, title, price, description, image_count, tags_future, deadline,
+                                          stream=None, angle_key=None):
         """이미지 2개일 때 콜라주 사용하는 자유 후기 스타일 생성"""
         try:
-            import google.generativeai as genai
-            
-            genai.configure(api_key=self.gemini_api_key)
-            
-            try:
-                model = genai.GenerativeModel('gemini-2.5-pro')
-                print("   🤖 모델: gemini-2.5-pro")
-            except:
-                model = genai.GenerativeModel('gemini-2.5-flash')
-                print("   🤖 모델: gemini-2.5-flash (백업)")
-            
             # 랜덤 스타일 + 금지 문구
             style_angles = [
                 "문제-해결(Problem→Insight→Solution)",
@@ -1476,7 +1461,7 @@ JSON 형식 예시:
                 "핵심 스펙 숫자 강조(수치·치수·용량·소재 등 3개 이상)",
                 "TIP 제공형(구매/사용/관리 팁 3가지)"
             ]
-            chosen_angle = random.choice(style_angles)
+            chosen_angle = self._choose_angle(style_angles, angle_key)
             banned_phrases = [
                 "직접 사용해보니 정말 만족스러웠어요",
                 "제 솔직한 경험을 공유하고 싶어서 이렇게 후기를 남깁니다",
@@ -1540,15 +1525,14 @@ JSON 형식 예시:
 위 형식 그대로 작성하세요:
 """
             
-            gen_config = genai.GenerationConfig(temperature=0.95, top_p=0.9)
-            response = model.generate_content(prompt, generation_config=gen_config)
-            ai_content = response.text.strip()
+            gen_config = self.gemini.generation_config(temperature=0.95, top_p=0.9)
+            ai_content = self._generate_body_text(prompt, gen_config, deadline, stream, chosen_angle)
             ai_content = self._soft_avoid_phrases(ai_content)
             
             print(f"✅ AI 자유 후기 생성 완료 (콜라주) ({len(ai_content)}자)")
             
-            # 태그 생성
-            tags = self._generate_tags(title, description)
+            # 태그 (본문과 동시에 생성 중이던 결과)
+            tags = self._collect_tags(tags_future, deadline)
             
             return {
                 'content': ai_content,
@@ -1566,16 +1550,6 @@ JSON 형식 예시:
         print("   🏷️  AI 태그 생성 중...")
         
         try:
-            import google.generativeai as genai
-            genai.configure(api_key=self.gemini_api_key)
-            
-            try:
-                model = genai.GenerativeModel('gemini-2.5-pro')
-                print("   🤖 모델: gemini-2.5-pro")
-            except:
-                model = genai.GenerativeModel('gemini-2.5-flash')
-                print("   🤖 모델: gemini-2.5-flash (백업)")
-            
             # AI에게 태그 생성 요청
             prompt = f"""
 아래 제품 정보를 보고 네이버 블로그 해시태그를 정확히 30개 생성하세요.
@@ -1601,8 +1575,9 @@ JSON 형식 예시:
 태그만 출력하세요 (설명 없이):
 """
             
-            response = model.generate_content(prompt)
-            ai_tags_text = response.text.strip()
+            ai_tags_text, _ = self._cached_ai_text(
+                'tags', prompt, lambda: self.ai_router.generate('tags', prompt).text.strip()
+            )
             
             # 태그 파싱 (쉼표로 구분)
             tags = [tag.strip().replace('#', '') for tag in ai_tags_text.split(',')]
@@ -1642,79 +1617,146 @@ JSON 형식 예시:
         except Exception as e:
             print(f"   ⚠️ AI 태그 생성 실패, 기본 태그 사용: {e}")
             # 폴백: 간단한 태그
-            return ['추천', '후기', '리뷰', '가성비', '인기', '베스트', '구매후기', '사용후기', '솔직후기', '좋은제품']
+            return list(self.FALLBACK_TAGS)
+    
+    def _generate_body_text(self, prompt, gen_config, deadline, stream=None, angle=None):
+        """
+        본문 생성 요청 (stream이 있으면 스트리밍으로 받으면서 조각을 바로 전달, 캐시에 있으면 호출 생략)
+        
+        스트림이 중간에 실패하면(429/503/마감 시간 초과 등) 라우터로 전체 본문을 다시 요청 (다음 모델로 대체 가능)
+        - 아직 보낸 조각이 없으면 받은 본문을 그대로 조각으로 전달
+        - 이미 보낸 조각이 있으면 stream.reset() → 입력 쪽에서 에디터를 다시 열고 전체 본문으로 작성
+        
+        Returns:
+            str: 응답 전체 텍스트
+        """
+        def generate_full():
+            response = self.ai_router.generate('body', prompt, deadline=deadline, generation_config=gen_config)
+            return response.text.strip()
+        
+        def generate():
+            if stream is None:
+                return generate_full()
+            
+            parts = []
+            try:
+                response = self.ai_router.generate('body', prompt, deadline=deadline, generation_config=gen_config,
+                                                   stream=True)
+                for chunk in response:
+                    try:
+                        text = chunk.text
+                    except Exception:
+                        continue  # 텍스트 없는 조각 (메타데이터만)
+                    parts.append(text)
+                    stream.put(text)
+            except Exception as e:
+                if parts:
+                    print(f"   ⚠️ 스트리밍 응답이 중간에 끊김 ({type(e).__name__}) - 전체 본문을 다시 받아서 새로 작성")
+                    stream.reset()
+                    return generate_full()
+                print(f"   ⚠️ 스트리밍 응답 실패 ({type(e).__name__}) - 입력 전이므로 다시 요청")
+                text = generate_full()
+                stream.put(text)
+                return text
+            return ''.join(parts).strip()
+        
+        text, cached = self._cached_ai_text('body', prompt, generate, angle)
+        if cached and stream is not None:
+            stream.put(text)
+        return text
+    
+    def _cached_ai_text(self, task, prompt, generate, angle=None):
+        """
+        AI 응답 텍스트 캐시 (같은 계정에서 프롬프트/모델/작성 관점이 같으면 Gemini 호출 생략)
+        
+        Args:
+            task: 작업 이름 ('body', 'tags')
+            prompt: 프롬프트
+            generate: 캐시에 없을 때 호출할 함수 (응답 텍스트 반환)
+            angle: 작성 관점 (선택)
+            
+        Returns:
+            tuple: (응답 텍스트, 캐시 사용 여부)
+        """
+        key = AICache.make_key(task, prompt, ','.join(self.ai_router.models_for(task)), angle=angle,
+                               extra={'account': self.ai_cache_scope})
+        cached = self.ai_cache.get(key, bypass=self.ai_cache_bypass)
+        if cached:
+            print(f"   💾 AI 캐시 사용 ({task}, Gemini 호출 생략)")
+            return cached, True
+        
+        text = generate()
+        if text:
+            self.ai_cache.set(key, text)
+        return text, False
+    
+    def _choose_angle(self, style_angles, angle_key=None):
+        """작성 관점 선택 (계정 + 상품별로 고정, 캐시 유효 기간 동안 유지)"""
+        if not angle_key:
+            return random.choice(style_angles)
+        return self.ai_cache.sticky_choice(f"{self.ai_cache_scope}|{angle_key}", style_angles,
+                                           bypass=self.ai_cache_bypass)
+    
+    def _collect_tags(self, tags_future, deadline):
+        """동시에 생성 중인 태그 결과 받기 (마감까지 안 끝나면 기본 태그)"""
+        try:
+            return tags_future.result(timeout=max(0.0, deadline - time.time()))
+        except FuturesTimeout:
+            print(f"   ⚠️ AI 태그 생성 시간 초과, 기본 태그 사용")
+        except Exception as e:
+            print(f"   ⚠️ AI 태그 생성 실패, 기본 태그 사용: {e}")
+        return list(self.FALLBACK_TAGS)
     
     def write_blog_post(self, title, ai_result, image_files, shopping_link):
         """블로그에 글 작성"""
         print(f"\n📝 블로그 글 작성 중...")
         
         try:
-            # AI 결과 파싱
-            ai_content = ai_result['content']
-            tags = ai_result['tags']
+            # AI 결과 파싱 (스트리밍이면 본문/태그/강조 키워드는 입력하면서 받음)
+            stream = ai_result.get('stream')
+            ai_content = ai_result.get('content', '')
+            tags = ai_result.get('tags', [])
             highlights = ai_result.get('highlights', [])  # highlights 받기
             
-            print(f"   ℹ️  강조 키워드: {len(highlights)}개")
-            
-            # 글쓰기 페이지 이동
-            self.driver.get(f'https://blog.naver.com/{self.blog_id}/postwrite')
-            time.sleep(3)
-            
-            # 리다이렉트 (발행 버튼 노출)
-            current_url = self.driver.current_url
-            self.driver.get(current_url)
-            time.sleep(5)
+            if stream is None:
+                print(f"   ℹ️  강조 키워드: {len(highlights)}개")
             
-            # 제목 입력
-            print("   ✏️  제목 입력...")
-            try:
-                title_div = self.driver.find_element(By.CSS_SELECTOR, "div.se-title-text")
-                title_div.click()
-                time.sleep(1)
-                
-                title_text = f"{title} 솔직 후기"
-                ActionChains(self.driver).send_keys(title_text).perform()
-                time.sleep(0.5)
-                print(f"   ✅ 제목: {title_text}")
-            except Exception as e:
-                print(f"   ⚠️ 제목 입력 실패: {e}")
-            
-            # 본문 에디터 찾기
-            print("   📄 본문 에디터 찾기...")
-            editors = self.driver.find_elements(By.CSS_SELECTOR, ".se-component-content")
-            if len(editors) >= 2:
-                editor = editors[1]
-                editor.click()
-                time.sleep(1)
-                print("   ✅ 본문 에디터 준비 완료")
-            else:
-                print("   ❌ 본문 에디터를 찾을 수 없습니다")
+            if not self._open_editor(title):
                 return False
-
-
             
             # AI 콘텐츠 파싱 및 작성
             print("   ✍️  본문 작성 중...")
             # 이미지 순서 랜덤 섞기
             random.shuffle(image_files)
-            elements = self._parse_content(ai_content, image_files, shopping_link)
-            
-            for idx, element in enumerate(elements):
-                self._insert_element(element, highlights)  # highlights 전달
+            if stream is not None:
+                ai_result, text_elements = self._write_streamed_body(stream, title, image_files, shopping_link)
+                if not ai_result:
+                    print("   ❌ AI 글 생성 실패 (스트리밍)")
+                    return False
+                tags = ai_result['tags']
+            else:
+                elements = self._parse_content(ai_content, image_files, shopping_link)
+                
+                for idx, element in enumerate(elements):
+                    self._insert_element(element, highlights)  # highlights 전달
             
             print("   ✅ 본문 작성 완료!")
             
             # 링크 삽입 후 에디터 안정화 대기
             print("   ⏳ 에디터 안정화 대기 중...")
-            time.sleep(2)
+            self.waits.dom_quiet(quiet=0.5, timeout=5)
             
             # 해시태그를 본문 맨 끝에 추가
             print("   🏷️  해시태그 추가 시작...")
             self._insert_hashtags_in_content(tags)
             print("   ✅ 해시태그 추가 완료")
             
-            # 스타일은 이미 입력하면서 적용됨
-            print("   ℹ️  스타일 적용은 텍스트 입력 중 완료")
+            if stream is not None and text_elements is not None:
+                # 강조 키워드는 본문 끝(JSON)에 오므로 입력이 끝난 뒤 적용
+                self._apply_highlights_after(text_elements, ai_result.get('highlights', []))
+            else:
+                # 스타일은 이미 입력하면서 적용됨
+                print("   ℹ️  스타일 적용은 텍스트 입력 중 완료")
             
             # 발행하기
             print("\n🚀 발행 프로세스 시작...")
@@ -1730,114 +1772,130 @@ JSON 형식 예시:
             traceback.print_exc()
             return False
     
-    def _parse_content(self, content, image_files, shopping_link):
-        """AI 콘텐츠 파싱"""
-        elements = []
-        lines = content.split('\n')
+    def _open_editor(self, title, reopen=False):
+        """
+        글쓰기 페이지를 열고 제목 입력 + 본문 에디터 클릭
         
-        # 섹션 추적 변수
-        current_section = 'intro'  # 시작은 도입부
-        advantage_count = 0  # 장점 카운터
-        is_disadvantage = False  # 단점 섹션 플래그
+        Args:
+            title: 상품명
+            reopen: 작성 중이던 글을 버리고 다시 여는 경우 (이어쓰기 팝업 확인)
         
-        i = 0
-        while i < len(lines):
-            line = lines[i].strip()
-            
-            if not line:
-                i += 1
-                continue
-            
-            # [QUOTE:VERTICAL] - 제목 인용구
-            if line == '[QUOTE:VERTICAL]':
-                i += 1
-                if i < len(lines):
-                    elements.append({
-                        'type': 'quote',
-                        'style': 'vertical',
-                        'content': lines[i].strip(),
-                        'section': 'title'
-                    })
-                i += 1
-            
-            # [QUOTE:UNDERLINE] - 장점 인용구
-            elif line == '[QUOTE:UNDERLINE]':
-                advantage_count += 1
-                current_section = f'advantage_{advantage_count}'
-                i += 1
-                if i < len(lines):
-                    elements.append({
-                        'type': 'quote',
-                        'style': 'underline',
-                        'content': lines[i].strip(),
-                        'section': current_section
-                    })
-                i += 1
-            
-            # [TEXT]
-            elif line == '[TEXT]':
-                i += 1
-                if i < len(lines):
-                    text_content = lines[i].strip()
-                    
-                    # 단점 섹션 감지 (키워드 기반)
-                    disadvantage_keywords = ['아쉬운', '불편', '단점', '아쉽', '불만']
-                    if any(keyword in text_content for keyword in disadvantage_keywords):
-                        is_disadvantage = True
-                        section = 'disadvantage'
-                    elif is_disadvantage:
-                        # 단점 섹션 끝나고 마무리
-                        is_disadvantage = False
-                        section = 'conclusion'
-                        current_section = 'conclusion'
-                    elif advantage_count == 0:
-                        # 장점 시작 전 = 도입부
-                        section = 'intro'
-                    elif advantage_count > 0 and current_section.startswith('advantage'):
-                        # 장점 섹션 유지
-                        section = current_section
-                    else:
-                        section = current_section
-                    
-                    elements.append({
-                        'type': 'text',
-                        'content': text_content,
-                        'section': section
-                    })
-                i += 1
-            
-            # [IMAGE:x,y] or [IMAGE:x]
-            elif line.startswith('[IMAGE:'):
-                nums_str = line.replace('[IMAGE:', '').replace(']', '')
-                img_nums = [int(n.strip()) for n in nums_str.split(',') if n.strip().isdigit()]
-                
-                img_files = []
-                for num in img_nums:
-                    if 0 < num <= len(image_files):
-                        img_files.append(image_files[num-1])
-                
-                if img_files:
-                    elements.append({
-                        'type': 'image',
-                        'images': img_files,
-                        'single': len(img_files) == 1,  # 단일 이미지 표시
-                        'section': current_section
-                    })
-                i += 1
-            
-            # [LINK]
-            elif line == '[LINK]':
-                elements.append({
-                    'type': 'text',
-                    'content': shopping_link,
-                    'section': 'conclusion'
-                })
-                i += 1
-            
-            else:
-                i += 1
+        Returns:
+            bool: 본문 에디터 준비 여부
+        """
+        # 글마다 HTML 삽입 다시 시도 (이전 글에서 실패했어도)
+        self.editor_injector = EditorInjector(self.driver, self.waits) if self.use_html_injection else None
+        
+        # 글쓰기 페이지 이동 (작성 중인 글이 있으면 '페이지 나가기' 확인창 수락)
+        try:
+            self.driver.get(f'https://blog.naver.com/{self.blog_id}/postwrite')
+        except Exception:
+            self._accept_alert()
+        self.waits.page_loaded()
+        
+        # 리다이렉트 (발행 버튼 노출)
+        current_url = self.driver.current_url
+        self.driver.get(current_url)
+        
+        # 제목/본문 영역이 그려질 때까지 대기 (고정 대기 없음)
+        self.waits.editor_ready(timeout=20)
+        
+        # '작성 중인 글이 있습니다' 이어쓰기 팝업이 뜨면 취소 (새 글로 작성)
+        if reopen:
+            cancel = self.waits.until(
+                lambda: self.driver.find_element(By.CSS_SELECTOR, '.se-popup-button-cancel'), timeout=2
+            )
+            if cancel:
+                cancel.click()
         
-        return elements
+        # 제목 입력
+        print("   ✏️  제목 입력...")
+        try:
+            title_div = self.driver.find_element(By.CSS_SELECTOR, "div.se-title-text")
+            title_div.click()
+            self.waits.pause(0.5)
+            
+            title_text = f"{title} 솔직 후기"
+            ActionChains(self.driver).send_keys(title_text).perform()
+            self.waits.pause(0.5)
+            print(f"   ✅ 제목: {title_text}")
+        except Exception as e:
+            print(f"   ⚠️ 제목 입력 실패: {e}")
+        
+        # 본문 에디터 찾기
+        print("   📄 본문 에디터 찾기...")
+        editors = self.driver.find_elements(By.CSS_SELECTOR, ".se-component-content")
+        if len(editors) < 2:
+            print("   ❌ 본문 에디터를 찾을 수 없습니다")
+            return False
+        editors[1].click()
+        self.waits.pause(0.5)
+        print("   ✅ 본문 에디터 준비 완료")
+        return True
+    
+    def _accept_alert(self):
+        """브라우저 확인창(alert/beforeunload)이 떠 있으면 수락"""
+        try:
+            self.driver.switch_to.alert.accept()
+        except Exception:
+            pass
+    
+    def _write_streamed_body(self, stream, title, image_files, shopping_link):
+        """
+        AI 응답 조각을 받는 대로 줄 단위로 파싱해서 에디터에 입력
+        
+        스트림이 중간에 끊겨 생성 쪽이 전체 본문을 다시 받으면(StreamReset) 이미 입력한 내용이 있을 때
+        에디터를 다시 열고, 전체 본문을 스트리밍 없이 입력 (강조 키워드도 입력하면서 적용)
+        
+        Returns:
+            tuple: (AI 결과 dict 또는 None, 입력한 텍스트 요소 리스트 - 전체 본문으로 다시 썼으면 None)
+        """
+        seen_phrases = set()
+        parser = ContentStreamParser(image_files, shopping_link,
+                                     transform=lambda line: self._soft_avoid_phrases(line, seen_phrases))
+        text_elements = []
+        inserted = []
+        
+        def insert(elements):
+            for element in elements:
+                self._insert_element(element)  # 강조 키워드는 아직 모름
+                inserted.append(element)
+                if element['type'] == 'text' and element['content'] != shopping_link:
+                    text_elements.append(element)
+        
+        try:
+            for chunk in stream.chunks(timeout=self.ai_timeout):
+                insert(parser.feed(chunk))
+            insert(parser.close())
+        except StreamReset:
+            ai_result = stream.result(timeout=self.ai_timeout)
+            if not ai_result:
+                return None, text_elements
+            print(f"   ↩️ 스트리밍 중단 - 전체 본문으로 다시 작성 (이미 입력한 요소 {len(inserted)}개)")
+            if inserted and not self._open_editor(title, reopen=True):
+                return None, text_elements
+            highlights = ai_result.get('highlights', [])
+            for element in self._parse_content(ai_result['content'], image_files, shopping_link):
+                self._insert_element(element, highlights)
+            return ai_result, None
+        
+        ai_result = stream.result(timeout=self.ai_timeout)
+        if ai_result:
+            print(f"   ✅ 스트리밍 입력 완료 (요소 {len(text_elements)}개 텍스트)")
+        return ai_result, text_elements
+    
+    def _apply_highlights_after(self, text_elements, highlights):
+        """입력이 끝난 본문에서 섹션별 강조 키워드를 찾아 스타일 적용"""
+        if not highlights:
+            return
+        print(f"   🎨 강조 키워드 {len(highlights)}개 적용 중...")
+        for element in text_elements:
+            for pos in self._select_highlight_positions(element['content'], highlights, element['section']):
+                self._apply_text_style_to_keyword(pos['text'], pos['style'])
+    
+    def _parse_content(self, content, image_files, shopping_link):
+        """AI 콘텐츠 파싱"""
+        return parse_content(content, image_files, shopping_link)
     
     def _insert_element(self, element, highlights=None):
         """요소 삽입"""
@@ -1859,23 +1917,21 @@ JSON 형식 예시:
                 # 옵션 버튼 클릭
                 option_btn = self.driver.find_element(By.CSS_SELECTOR, '[data-name="insert-quotation"] .se-document-toolbar-select-option-button')
                 option_btn.click()
-                time.sleep(1)
                 
-                # 스타일 선택
-                quote_btn = self.driver.find_element(By.CSS_SELECTOR, f'[data-value="{target_value}"]')
+                # 스타일 선택 (메뉴가 열릴 때까지 대기)
+                quote_btn = self.waits.element(f'[data-value="{target_value}"]', timeout=5)
                 quote_btn.click()
-                time.sleep(0.5)
+                self.waits.pause(0.5)
                 
                 # 텍스트 입력
-                pyperclip.copy(element['content'])
-                ActionChains(self.driver).key_down(Keys.CONTROL).send_keys('v').key_up(Keys.CONTROL).perform()
-                time.sleep(0.5)
+                self.text_input.insert(element['content'])
+                self.waits.pause(0.5)
                 
                 # 인용구 빠져나오기
                 ActionChains(self.driver).send_keys(Keys.ARROW_DOWN).perform()
-                time.sleep(0.2)
+                self.waits.pause(0.2)
                 ActionChains(self.driver).send_keys(Keys.ARROW_DOWN).perform()
-                time.sleep(0.5)
+                self.waits.pause(0.5)
             
             # 텍스트
             elif elem_type == 'text':
@@ -1908,16 +1964,12 @@ JSON 형식 예시:
                     formatted_text += paragraph + "\n\n"
                     i += paragraph_size
                 
-                # highlights가 있으면 스타일 적용하면서 입력, 없으면 그냥 입력
-                if highlights:
-                    self._insert_text_with_inline_styles(formatted_text.strip(), highlights, section)
-                else:
-                    pyperclip.copy(formatted_text.strip())
-                    ActionChains(self.driver).key_down(Keys.CONTROL).send_keys('v').key_up(Keys.CONTROL).perform()
+                # 강조 스타일 적용하면서 입력 (HTML 한 번에 붙여넣기, 실패 시 조각별 입력)
+                self._insert_text_with_inline_styles(formatted_text.strip(), highlights, section)
                 
-                time.sleep(0.5)
+                self.waits.pause(0.5)
                 ActionChains(self.driver).send_keys(Keys.ENTER).send_keys(Keys.ENTER).perform()
-                time.sleep(0.5)
+                self.waits.pause(0.5)
             
             # 이미지
             elif elem_type == 'image':
@@ -1939,12 +1991,9 @@ JSON 형식 예시:
             # 해시태그 텍스트 생성
             hashtag_text = " ".join([f"#{tag}" for tag in tags])
             
-            # 클립보드에 복사
-            pyperclip.copy(hashtag_text)
-            
-            # 붙여넣기
-            ActionChains(self.driver).key_down(Keys.CONTROL).send_keys('v').key_up(Keys.CONTROL).perform()
-            time.sleep(0.5)
+            # 커서 위치에 입력 (클립보드 사용 안 함)
+            self.text_input.insert(hashtag_text)
+            self.waits.pause(0.5)
             
             print(f"   ✅ 해시태그 {len(tags)}개 추가 완료!")
             print(f"      예시: {' '.join([f'#{tag}' for tag in tags[:3]])}...")
@@ -1961,7 +2010,7 @@ JSON 형식 예시:
         try:
             # 해시태그 입력 후 대기
             print("   ⏳ 발행 전 대기 중...")
-            time.sleep(2)
+            self.waits.dom_quiet(quiet=0.5, timeout=5)
             
             # 발행 버튼 찾기 (오른쪽 상단)
             print("   🔍 발행 버튼 찾는 중...")
@@ -2001,8 +2050,8 @@ JSON 형식 예시:
                 return False
             
             # 첫 번째 발행 버튼 클릭
+            editor_url = self.driver.current_url
             publish_btn.click()
-            time.sleep(2)
             print("   ✅ 발행 버튼 클릭")
             
             # 발행 확인 버튼 클릭 (팝업)
@@ -2015,6 +2064,9 @@ JSON 형식 예시:
                 "button.se-publish-confirm"
             ]
             
+            # 발행 팝업이 열릴 때까지 대기
+            self.waits.any_element(confirm_selectors, timeout=10)
+            
             for selector in confirm_selectors:
                 try:
                     confirm_btn = self.driver.find_element(By.CSS_SELECTOR, selector)
@@ -2028,7 +2080,8 @@ JSON 형식 예시:
             
             if confirm_btn:
                 confirm_btn.click()
-                time.sleep(3)
+                # 발행 후 글 보기 페이지로 이동할 때까지 대기
+                self.waits.until(lambda: self.driver.current_url != editor_url, 15, "발행 후 페이지 이동")
                 print("   ✅ 발행 확인 완료!")
                 print("\n" + "="*60)
                 print("🎉 블로그 글 발행 성공!")
@@ -2048,57 +2101,14 @@ JSON 형식 예시:
     def _upload_single_image(self, image_file):
         """단일 이미지 업로드 (콜라주 없이)"""
         try:
-            # 사진 버튼 클릭
-            photo_btn = self.driver.find_element(By.CSS_SELECTOR, "button[data-name='image']")
-            photo_btn.click()
-            time.sleep(3)
-            
-            # file input 찾기
-            file_inputs = self.driver.find_elements(By.CSS_SELECTOR, "input[type='file']")
-            file_input = None
-            for inp in file_inputs:
-                try:
-                    accept = inp.get_attribute('accept')
-                    if accept and 'image' in accept:
-                        file_input = inp
-                        break
-                except:
-                    pass
-            
-            if not file_input and file_inputs:
-                file_input = file_inputs[0]
+            before_images = self.waits.editor_image_count()
             
-            if not file_input:
+            # 사진 버튼 → 파일 전달 (파일 선택 창 없이)
+            if not self.image_uploader.upload([image_file]):
                 return
             
-            # 파일 업로드 (단일)
-            file_input.send_keys(image_file)
-            time.sleep(1)
-            
-            # 파일 선택 창 닫기 (win32gui 직접 종료)
-            def find_window_by_title(title_part):
-                def callback(hwnd, windows):
-                    if win32gui.IsWindowVisible(hwnd):
-                        window_title = win32gui.GetWindowText(hwnd)
-                        if title_part in window_title:
-                            windows.append(hwnd)
-                    return True
-                
-                windows = []
-                win32gui.EnumWindows(callback, windows)
-                return windows[0] if windows else None
-            
-            hwnd = None
-            for i in range(5):
-                time.sleep(1)
-                hwnd = find_window_by_title("열기")
-                if hwnd:
-                    break
-            
-            if hwnd:
-                # WM_CLOSE 메시지로 창 닫기
-                win32gui.PostMessage(hwnd, win32con.WM_CLOSE, 0, 0)
-                time.sleep(2)
+            # 에디터에 이미지가 들어가고 썸네일이 로드될 때까지 대기
+            self.waits.upload_done(before_images, timeout=30)
             
             print(f"      ✅ 단일 이미지 업로드 완료")
             
@@ -2108,71 +2118,96 @@ JSON 형식 예시:
     def _upload_collage_images(self, image_files):
         """콜라주 이미지 업로드"""
         try:
-            # 사진 버튼 클릭
-            photo_btn = self.driver.find_element(By.CSS_SELECTOR, "button[data-name='image']")
-            photo_btn.click()
-            time.sleep(3)
-            
-            # file input 찾기
-            file_inputs = self.driver.find_elements(By.CSS_SELECTOR, "input[type='file']")
-            file_input = None
-            for inp in file_inputs:
-                try:
-                    accept = inp.get_attribute('accept')
-                    if accept and 'image' in accept:
-                        file_input = inp
-                        break
-                except:
-                    pass
-            
-            if not file_input and file_inputs:
-                file_input = file_inputs[0]
+            before_images = self.waits.editor_image_count()
             
-            if not file_input:
+            # 사진 버튼 → 파일 전달 (파일 선택 창 없이)
+            if not self.image_uploader.upload(image_files):
                 return
             
-            # 파일 업로드
-            files_path = '\n'.join(image_files)
-            file_input.send_keys(files_path)
-            time.sleep(1)
-            
-            # 파일 선택 창 닫기 (win32gui 직접 종료)
-            def find_window_by_title(title_part):
-                def callback(hwnd, windows):
-                    if win32gui.IsWindowVisible(hwnd):
-                        window_title = win32gui.GetWindowText(hwnd)
-                        if title_part in window_title:
-                            windows.append(hwnd)
-                    return True
-                
-                windows = []
-                win32gui.EnumWindows(callback, windows)
-                return windows[0] if windows else None
-            
-            hwnd = None
-            for i in range(5):
-                time.sleep(1)
-                hwnd = find_window_by_title("열기")
-                if hwnd:
-                    break
-            
-            if hwnd:
-                # WM_CLOSE 메시지로 창 닫기
-                win32gui.PostMessage(hwnd, win32con.WM_CLOSE, 0, 0)
-                time.sleep(2)
+            # 에디터에 이미지가 들어가고 썸네일이 로드될 때까지 대기
+            self.waits.upload_done(before_images, timeout=30)
             
             # 콜라주 버튼 클릭
             if len(image_files) >= 2:
-                time.sleep(2)
-                collage_label = self.driver.find_element(By.CSS_SELECTOR, "label[for='image-type-collage']")
+                collage_label = self.waits.element("label[for='image-type-collage']", timeout=10, visible=False)
                 self.driver.execute_script("arguments[0].scrollIntoView(true);", collage_label)
-                time.sleep(0.5)
+                self.waits.pause(0.5)
                 collage_label.click()
-                time.sleep(2)
+                self.waits.dom_quiet(quiet=0.5, timeout=5)
                 
         except Exception as e:
             print(f"      ⚠️ 이미지 업로드 실패: {e}")
-    
+
+    def process_url(self, shopping_url, progress=None):
+        """
+        쇼핑 URL 1개 처리 (추출 → 이미지 다운로드 → AI 생성 → 작성/발행)
+        브라우저 시작과 로그인은 호출 전에 완료되어 있어야 함
+
+        Args:
+            shopping_url: 네이버 쇼핑 URL
+            progress: 진행 메시지 콜백 (선택, GUI 로그용)
+
+        Returns:
+            tuple: (성공 여부, 결과 메시지)
+        """
+        emit = progress or (lambda msg: None)
+
+        emit("📦 제품 정보 추출 중...")
+        product_info = self.extract_product_info(shopping_url)
+        if not product_info:
+            return False, "제품 정보 추출 실패"
+        emit(f"✅ 제품명: {product_info['title'][:50]}...\n")
+
+        # 글마다 고유 작업 폴더 사용, 끝나면 자동 삭제
+        with JobWorkspace(self.temp_images_dir) as workspace:
+            emit("💾 이미지 다운로드 중...")
+            image_files = self.download_images(product_info['images'], target_dir=workspace.path)
+            if not image_files:
+                return False, "이미지 다운로드 실패 - 최소 1개"
+            emit(f"✅ {len(image_files)}개 이미지 다운로드 완료\n")
+
+            if self.use_ai_streaming:
+                return self._process_streaming(product_info, image_files, shopping_url, emit)
+
+            emit("🤖 AI 글 생성 중...")
+            ai_result = self.generate_ai_content(product_info)
+            if not ai_result:
+                return False, "AI 글 생성 실패"
+            emit(f"✅ AI 글 생성 완료 ({len(ai_result['content'])}자)\n")
+            emit(f"✅ 태그 {len(ai_result['tags'])}개 생성\n")
+
+            emit("📝 블로그 글 작성 및 발행 중...")
+            if self.write_blog_post(product_info['title'], ai_result, image_files, shopping_url):
+                return True, "블로그 글 발행 완료! 🎉"
+            return False, "블로그 글 작성 실패"
+
+    def _process_streaming(self, product_info, image_files, shopping_url, emit):
+        """
+        AI 생성과 에디터 입력을 동시에 진행 (생성은 별도 스레드, 받은 줄부터 바로 입력)
+
+        Returns:
+            tuple: (성공 여부, 결과 메시지)
+        """
+        stream = AIStream()
+
+        def produce():
+            try:
+                stream.finish(self.generate_ai_content(product_info, stream=stream))
+            except Exception as e:
+                stream.finish(error=e)
+
+        threading.Thread(target=produce, name='gemini-stream', daemon=True).start()
+
+        emit("🤖 AI 글 생성 + 📝 블로그 글 작성 동시 진행 중...")
+        if self.write_blog_post(product_info['title'], {'stream': stream}, image_files, shopping_url):
+            return True, "블로그 글 발행 완료! 🎉"
+        try:
+            if stream.result(timeout=self.ai_timeout) is None:
+                return False, "AI 글 생성 실패"
+        except TimeoutError:
+            return False, "AI 글 생성 실패"
+        return False, "블로그 글 작성 실패"
+
     def close(self):
         """브라우저 종료"""
         if self.driver:
@@ -2190,45 +2225,34 @@ def main():
     naver_id = input("🔐 네이버 ID: ").strip()
     naver_pw = input("🔑 네이버 PW: ").strip()
     gemini_api_key = input("🤖 Gemini API Key: ").strip()
-    shopping_url = input("🛒 쇼핑 URL (naver.me): ").strip()
+    timing_profile = input("⏱️ 실행 속도 (fast/normal/slow, 기본 normal): ").strip() or 'normal'
+    headless = input("🖥️ 화면 없이 실행 (서버용, y/N): ").strip().lower() == 'y'
+    ai_cache_bypass = input("♻️ AI 캐시 무시하고 새로 생성 (y/N): ").strip().lower() == 'y'
+    shopping_input = input("🛒 쇼핑 URL (naver.me) 또는 URL 목록 파일 경로: ").strip()
+    
+    # URL 목록 (파일이면 한 줄에 하나씩, 여러 URL은 공백/쉼표 구분)
+    shopping_urls = BatchRunner.load_urls(shopping_input)
+    if not shopping_urls:
+        print("❌ 유효한 쇼핑 URL이 없습니다")
+        return
     
     # 자동화 시작
-    bot = NaverBlogAutomation(blog_id, naver_id, naver_pw, gemini_api_key)
+    bot = NaverBlogAutomation(blog_id, naver_id, naver_pw, gemini_api_key,
+                              timing_profile=timing_profile, headless=headless, ai_cache_bypass=ai_cache_bypass)
+    
+    # 브라우저 시작/로그인은 1회, 작성 중에 다음 글의 다운로드/AI 생성을 미리 진행
+    runner = BatchRunner(bot, close_when_done=False, pipelined=True)
     
     try:
-        # 1. 브라우저 시작
-        bot.start_browser()
-        
-        # 2. 로그인
-        if not bot.login():
-            print("❌ 로그인 실패")
-            return
-        
-        # 3. 제품 정보 추출
-        product_info = bot.extract_product_info(shopping_url)
-        if not product_info:
-            print("❌ 제품 정보 추출 실패")
-            return
+        results = runner.run(shopping_urls)
         
-        # 4. 이미지 다운로드
-        image_files = bot.download_images(product_info['images'])
-        if not image_files:
-            print("❌ 이미지 다운로드 실패 - 최소 1개 이상 필요합니다")
-            return
-        
-        # 5. AI 글 생성
-        ai_content = bot.generate_ai_content(product_info)
-        if not ai_content:
-            print("❌ AI 글 생성 실패")
-            return
-        
-        # 6. 블로그 글 작성
-        if bot.write_blog_post(product_info['title'], ai_content, image_files, shopping_url):
+        if results and all(r['success'] for r in results):
             print("\n✅ 블로그 글 작성 완료!")
-            print("\n⏸️  브라우저에서 확인 후 발행해주세요...")
-            input("Enter를 누르면 종료됩니다...")
         else:
-            print("❌ 블로그 글 작성 실패")
+            print("❌ 일부 또는 전체 블로그 글 작성 실패")
+        
+        print("\n⏸️  브라우저에서 확인 후 발행해주세요...")
+        input("Enter를 누르면 종료됩니다...")
         
     except Exception as e:
         print(f"\n❌ 오류 발생: {e}")
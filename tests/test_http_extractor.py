@@ -0,0 +1,55 @@
+"""
+HttpProductExtractor.parse_html 테스트 (저장해 둔 상품 페이지 HTML, 네트워크 사용 안 함)
+"""
+
+import os
+
+from modules.http_extractor import HttpProductExtractor
+
+
+FIXTURES = os.path.join(os.path.dirname(__file__), 'fixtures')
+
+
+def load_fixture(name):
+    with open(os.path.join(FIXTURES, name), encoding='utf-8') as f:
+        return f.read()
+
+
+def test_parse_html_reads_preloaded_state():
+    info = HttpProductExtractor.parse_html(load_fixture('smartstore_product.html'), link='https://naver.me/xyz')
+
+    # [히든딜] 접두어 제거, 할인가 우선
+    assert info['title'] == '콜드 자연기화 가습기 5L'
+    assert info['price'] == '49,900원'
+    assert info['link'] == 'https://naver.me/xyz'
+
+    # 대표 이미지 먼저, 같은 이미지는 한 번만, 고화질(f640) URL
+    assert info['images'] == [
+        'https://shop-phinf.pstatic.net/main_1.jpg?type=f640',
+        'https://shop-phinf.pstatic.net/main_2.jpg?type=f640',
+    ]
+
+    # 아이콘(40x40)/중복/data: URL 제외, data-src 지연 로딩 이미지는 포함
+    assert info['detail_images'] == [
+        'https://shop-phinf.pstatic.net/detail/detail_01.jpg?type=f640',
+        'https://shop-phinf.pstatic.net/detail/detail_02.jpg?type=f640',
+    ]
+
+    # 배송 안내 문단은 설명에서 제외
+    assert '자연기화식 가습기' in info['description']
+    assert '배송' not in info['description']
+
+
+def test_parse_html_falls_back_to_og_meta():
+    info = HttpProductExtractor.parse_html(load_fixture('og_only_product.html'))
+
+    # og:title의 ' : 스토어명' 제거
+    assert info['title'] == '콜드 미니 선풍기'
+    assert info['price'] == '19,800원'
+    assert info['images'] == ['https://shop-phinf.pstatic.net/fan_main.jpg?type=f640']
+    assert info['detail_images'] == []
+    assert info['description'] == '책상 위에 두기 좋은 저소음 미니 선풍기'
+
+
+def test_parse_html_rejects_non_product_page():
+    assert HttpProductExtractor.parse_html('<html><body>보안 확인을 완료해 주세요</body></html>') is None